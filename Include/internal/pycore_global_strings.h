@@ -621,6 +621,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(reset)
         STRUCT_FOR_ID(resetids)
         STRUCT_FOR_ID(return)
+        STRUCT_FOR_ID(reuse_buffer)
         STRUCT_FOR_ID(reverse)
         STRUCT_FOR_ID(reversed)
         STRUCT_FOR_ID(s)
@@ -726,6 +727,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(x)
         STRUCT_FOR_ID(year)
         STRUCT_FOR_ID(zdict)
+        STRUCT_FOR_ID(zero_copy)
     } identifiers;
     struct {
         PyASCIIObject _ascii;
@@ -110,10 +110,7 @@ typedef struct pyruntimestate {
         int64_t next_id;
     } interpreters;
     // XXX Remove this field once we have a tp_* slot.
-    struct _xidregistry {
-        PyThread_type_lock mutex;
-        struct _xidregitem *head;
-    } xidregistry;
+    struct _xidregistry xidregistry;
 
     unsigned long main_thread;
 
@@ -1127,6 +1127,7 @@ extern "C" {
     INIT_ID(reset), \
     INIT_ID(resetids), \
     INIT_ID(return), \
+    INIT_ID(reuse_buffer), \
     INIT_ID(reverse), \
     INIT_ID(reversed), \
     INIT_ID(s), \
@@ -1232,6 +1233,7 @@ extern "C" {
     INIT_ID(x), \
     INIT_ID(year), \
     INIT_ID(zdict), \
+    INIT_ID(zero_copy), \
 }
 
 #define _Py_str_ascii_INIT { \
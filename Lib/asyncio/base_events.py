@@ -44,6 +44,7 @@
 from . import sslproto
 from . import staggered
 from . import tasks
+from . import timerwheel
 from . import transports
 from . import trsock
 from .log import logger
@@ -63,6 +64,9 @@
 
 _HAS_IPv6 = hasattr(socket, 'AF_INET6')
 
+# Number of buckets of the callback latency histogram
+_PROFILE_BUCKETS = 25
+
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
@@ -76,6 +80,45 @@ def _format_handle(handle):
         return str(handle)
 
 
+class _CallbackProfile:
+    """Latency histogram and slowest callbacks of an event loop.
+
+    Bucket i of the histogram counts the callbacks which ran in less
+    than 2**i microseconds (and at least 2**(i-1) microseconds); the
+    last bucket counts all slower callbacks.
+    """
+
+    __slots__ = ('histogram', 'slowest', 'top')
+
+    def __init__(self, top):
+        self.histogram = [0] * _PROFILE_BUCKETS
+        # Min-heap of (duration, description) of the slowest callbacks.
+        self.slowest = []
+        self.top = top
+
+    def add(self, handle, duration):
+        bucket = int(duration * 1e6).bit_length()
+        if bucket >= _PROFILE_BUCKETS:
+            bucket = _PROFILE_BUCKETS - 1
+        self.histogram[bucket] += 1
+        slowest = self.slowest
+        if len(slowest) < self.top:
+            heapq.heappush(slowest, (duration, _format_handle(handle)))
+        elif self.top and duration > slowest[0][0]:
+            heapq.heapreplace(slowest, (duration, _format_handle(handle)))
+
+    def snapshot(self):
+        # list() copies are atomic, so that this can be called from
+        # another thread while the loop is running.
+        histogram = list(self.histogram)
+        bounds = [2 ** i / 1e6 for i in range(_PROFILE_BUCKETS - 1)]
+        bounds.append(float('inf'))
+        return {
+            'histogram': list(zip(bounds, histogram)),
+            'slowest': sorted(list(self.slowest), reverse=True),
+        }
+
+
 def _format_pipe(fd):
     if fd == subprocess.PIPE:
         return '<pipe>'
@@ -392,6 +435,17 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Replaces the _scheduled heap when set_timer_wheel() is used.
+        self._timer_wheel = None
+        # Counters reported by get_stats().
+        self._tasks_created = 0
+        self._tasks_completed_eagerly = 0
+        self._callbacks_run = 0
+        self._callbacks_time = 0.0
+        self._iterations = 0
+        self._select_time = 0.0
+        # Set by set_callback_profiling().
+        self._callback_profile = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -445,6 +499,10 @@ def create_task(self, coro, *, name=None, context=None):
 
             tasks._set_task_name(task, name)
 
+        self._tasks_created += 1
+        if task.done():
+            # The task factory ran the coroutine to completion eagerly.
+            self._tasks_completed_eagerly += 1
         return task
 
     def set_task_factory(self, factory):
@@ -465,6 +523,118 @@ def get_task_factory(self):
         """Return a task factory, or None if the default one is in use."""
         return self._task_factory
 
+    def get_stats(self):
+        """Return a dict of counters describing the loop activity.
+
+        The counters are updated at a negligible cost, even when debug
+        mode is disabled:
+
+        * tasks_created: number of tasks created by create_task();
+        * tasks_completed_eagerly: number of those tasks that were done
+          when returned by the task factory (see eager_task_factory());
+        * callbacks_run: number of callbacks run by the loop, including
+          each step of every task;
+        * callbacks_time: total time spent running them, in seconds;
+        * average_callback_time: callbacks_time / callbacks_run;
+        * iterations: number of iterations of the loop;
+        * select_time: total time spent polling for I/O, in seconds,
+          including the time spent waiting for events.
+
+        It is safe to call this method from another thread.
+        """
+        callbacks_run = self._callbacks_run
+        callbacks_time = self._callbacks_time
+        if callbacks_run:
+            average = callbacks_time / callbacks_run
+        else:
+            average = 0.0
+        return {
+            'tasks_created': self._tasks_created,
+            'tasks_completed_eagerly': self._tasks_completed_eagerly,
+            'callbacks_run': callbacks_run,
+            'callbacks_time': callbacks_time,
+            'average_callback_time': average,
+            'iterations': self._iterations,
+            'select_time': self._select_time,
+        }
+
+    def set_callback_profiling(self, enabled, *, top=10):
+        """Enable or disable the profiling of callbacks.
+
+        When enabled, the duration of every callback is recorded in a
+        latency histogram, and the *top* slowest callbacks are kept
+        with their description, see get_callback_profile().  Enabling
+        the profiling resets it.
+        """
+        if top < 0:
+            raise ValueError('top must be a non-negative integer')
+        if enabled:
+            self._callback_profile = _CallbackProfile(top)
+        else:
+            self._callback_profile = None
+
+    def get_callback_profile(self):
+        """Return a snapshot of the callback profile, or None.
+
+        The result is a dict with two keys:
+
+        * histogram: list of (upper_bound, count) pairs, where count is
+          the number of callbacks which ran in less than upper_bound
+          seconds and at least the previous upper bound;
+        * slowest: list of (duration, description) pairs of the slowest
+          callbacks, slowest first.  The description includes the
+          source location of the callback or of the task coroutine.
+
+        Return None if the profiling is disabled.  It is safe to call
+        this method from another thread.
+        """
+        profile = self._callback_profile
+        if profile is None:
+            return None
+        return profile.snapshot()
+
+    def set_timer_wheel(self, resolution):
+        """Schedule call_at() and call_later() callbacks on a timing wheel.
+
+        By default, timer handles are kept in a binary heap, which costs
+        O(log n) per scheduled or cancelled callback.  A hierarchical
+        timing wheel makes both operations O(1), at the cost of running
+        callbacks up to *resolution* seconds after their deadline.
+
+        If resolution is None, switch back to the default heap.  Already
+        scheduled callbacks are moved to the new structure.
+        """
+        if resolution is not None and resolution <= 0:
+            raise ValueError('resolution must be a positive number or None')
+        handles = self._get_scheduled_handles()
+        if resolution is None:
+            self._timer_wheel = None
+            self._scheduled = handles
+            heapq.heapify(self._scheduled)
+        else:
+            self._timer_wheel = timerwheel.TimerWheel(resolution, self.time())
+            self._scheduled = []
+            for handle in handles:
+                self._timer_wheel.push(handle)
+        self._timer_cancelled_count = 0
+
+    def get_timer_wheel_resolution(self):
+        """Return the timing wheel resolution, or None if not in use."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
+    def _get_scheduled_handles(self):
+        if self._timer_wheel is not None:
+            return list(self._timer_wheel)
+        handles = []
+        for handle in self._scheduled:
+            if handle._cancelled:
+                handle._scheduled = False
+            else:
+                handles.append(handle)
+        return handles
+
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
         """Create socket transport."""
@@ -688,6 +858,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -755,7 +927,10 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is not None:
+            self._timer_wheel.push(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
@@ -1869,7 +2044,11 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is not None:
+                self._timer_wheel.discard(handle)
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1902,6 +2081,7 @@ def _run_once(self):
                 handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
+        timer_wheel = self._timer_wheel
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
@@ -1909,14 +2089,24 @@ def _run_once(self):
             # Compute the desired timeout.
             when = self._scheduled[0]._when
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
+        elif timer_wheel is not None and timer_wheel:
+            when = timer_wheel.next_deadline()
+            timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
 
+        t0 = time.monotonic()
         event_list = self._selector.select(timeout)
+        self._select_time += time.monotonic() - t0
+        self._iterations += 1
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
+        if timer_wheel is not None:
+            for handle in timer_wheel.pop_expired(end_time):
+                handle._scheduled = False
+                self._ready.append(handle)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1932,10 +2122,14 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        nrun = 0
+        profile = self._callback_profile
+        run_start = time.monotonic()
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
+            nrun += 1
             if self._debug:
                 try:
                     self._current_handle = handle
@@ -1945,11 +2139,20 @@ def _run_once(self):
                     if dt >= self.slow_callback_duration:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
+                    if profile is not None:
+                        profile.add(handle, dt)
                 finally:
                     self._current_handle = None
+            elif profile is not None:
+                t0 = time.monotonic()
+                handle._run()
+                profile.add(handle, time.monotonic() - t0)
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
+        if nrun:
+            self._callbacks_run += nrun
+            self._callbacks_time += time.monotonic() - run_start
 
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
@@ -2,7 +2,7 @@
 
 __all__ = (
     'BaseProtocol', 'Protocol', 'DatagramProtocol',
-    'SubprocessProtocol', 'BufferedProtocol',
+    'BatchedDatagramProtocol', 'SubprocessProtocol', 'BufferedProtocol',
 )
 
 
@@ -174,6 +174,36 @@ def error_received(self, exc):
         """
 
 
+class BatchedDatagramProtocol(DatagramProtocol):
+    """Interface for datagram protocol receiving datagrams in batches.
+
+    Transports that support batching drain as many datagrams as are
+    available from the socket (up to an implementation-defined limit)
+    on every read readiness event, and deliver them with a single
+    datagrams_received() call instead of one datagram_received() call
+    per datagram.
+
+    Transports that don't support batching call datagram_received(),
+    which forwards each datagram as a batch of one.
+    """
+
+    __slots__ = ()
+
+    def datagram_received(self, data, addr):
+        """Called when a single datagram is received.
+
+        The default implementation forwards it to datagrams_received().
+        """
+        self.datagrams_received([(data, addr)])
+
+    def datagrams_received(self, datagrams):
+        """Called when a batch of datagrams is received.
+
+        *datagrams* is a non-empty list of (data, addr) tuples in the
+        order they were received.
+        """
+
+
 class SubprocessProtocol(BaseProtocol):
     """Interface for protocol for subprocess calls."""
 
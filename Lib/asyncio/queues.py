@@ -63,6 +63,14 @@ def _wakeup_next(self, waiters):
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, n):
+        # Wake up the next n waiters (if any) that aren't cancelled.
+        while n > 0 and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                n -= 1
+
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
 
@@ -146,6 +154,48 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        Items are added as long as there are free slots, waiting for free
+        slots when the queue is full.  Waiting getters are woken up once
+        per batch of added items rather than once per item.
+        """
+        added = 0
+        try:
+            for item in items:
+                if self.full():
+                    self._notify_put_many(added)
+                    added = 0
+                    await self.put(item)
+                else:
+                    self._put(item)
+                    added += 1
+        finally:
+            self._notify_put_many(added)
+
+    def put_many_nowait(self, items):
+        """Put all items of a sequence into the queue without blocking.
+
+        If there are not enough free slots for all the items, raise
+        QueueFull and leave the queue unchanged.
+        """
+        if self._maxsize > 0 and self.qsize() + len(items) > self._maxsize:
+            raise QueueFull
+        added = 0
+        try:
+            for item in items:
+                self._put(item)
+                added += 1
+        finally:
+            self._notify_put_many(added)
+
+    def _notify_put_many(self, added):
+        if added:
+            self._unfinished_tasks += added
+            self._finished.clear()
+            self._wakeup_many(self._getters, added)
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -183,6 +233,39 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items):
+        """Remove and return a list of up to max_items items from the queue.
+
+        If queue is empty, wait until an item is available, then return
+        all the available items, up to max_items, without waiting for more.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            items = [await self.get()]
+            max_items -= 1
+        else:
+            items = []
+        items.extend(self._get_many(max_items))
+        return items
+
+    def get_many_nowait(self, max_items):
+        """Remove and return a list of up to max_items items from the queue.
+
+        Return the items immediately available, else raise QueueEmpty.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            raise QueueEmpty
+        return self._get_many(max_items)
+
+    def _get_many(self, max_items):
+        count = min(max_items, self.qsize())
+        items = [self._get() for _ in range(count)]
+        self._wakeup_many(self._putters, count)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -1172,13 +1172,28 @@ def writelines(self, list_of_data):
             raise RuntimeError('Cannot call writelines() after write_eof()')
         if self._empty_waiter is not None:
             raise RuntimeError('unable to writelines; sendfile is in progress')
-        if not list_of_data:
+        # Keep a flat byte view of every non-empty chunk so that they can be
+        # passed to sendmsg() as-is, without concatenating them.
+        buffers = [data for data in map(memoryview, list_of_data)
+                   if data.nbytes]
+        if not buffers:
+            return
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
-        self._write_ready()
-        # If the entire buffer couldn't be written, register a write handler
-        if self._buffer:
-            self._loop._add_writer(self._sock_fd, self._write_ready)
+
+        buffer_was_empty = not self._buffer
+        self._buffer.extend(data.cast('B') for data in buffers)
+        if buffer_was_empty:
+            # Optimization: try to send now.
+            self._write_ready()
+            # If the entire buffer couldn't be written, register a write handler
+            if self._buffer:
+                self._loop._add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
@@ -1208,6 +1223,7 @@ def close(self):
 class _SelectorDatagramTransport(_SelectorTransport, transports.DatagramTransport):
 
     _buffer_factory = collections.deque
+    max_batch = 64  # Max datagrams delivered per datagrams_received() call.
 
     def __init__(self, loop, sock, protocol, address=None,
                  waiter=None, extra=None):
@@ -1226,7 +1242,44 @@ def __init__(self, loop, sock, protocol, address=None,
     def get_write_buffer_size(self):
         return self._buffer_size
 
+    def set_protocol(self, protocol):
+        if isinstance(protocol, protocols.BatchedDatagramProtocol):
+            self._read_ready_cb = self._read_ready__datagrams_received
+        else:
+            self._read_ready_cb = self._read_ready__datagram_received
+
+        super().set_protocol(protocol)
+
     def _read_ready(self):
+        self._read_ready_cb()
+
+    def _read_ready__datagrams_received(self):
+        if self._conn_lost:
+            return
+        datagrams = []
+        error = None
+        recvfrom = self._sock.recvfrom
+        max_size = self.max_size
+        try:
+            for _ in range(self.max_batch):
+                datagrams.append(recvfrom(max_size))
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as exc:
+            error = exc
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            self._fatal_error(exc, 'Fatal read error on datagram transport')
+            return
+
+        # Deliver what was received before the error, preserving order.
+        if datagrams:
+            self._protocol.datagrams_received(datagrams)
+        if error is not None:
+            self._protocol.error_received(error)
+
+    def _read_ready__datagram_received(self):
         if self._conn_lost:
             return
         try:
@@ -16,6 +16,10 @@
     SSLAgainErrors = (ssl.SSLWantReadError, ssl.SSLSyscallError)
 
 
+# Maximum amount of application data carried by a single TLS record.
+_MAX_RECORD_SIZE = 16 * 1024
+
+
 class SSLProtocolState(enum.Enum):
     UNWRAPPED = "UNWRAPPED"
     DO_HANDSHAKE = "DO_HANDSHAKE"
@@ -692,21 +696,38 @@ def _write_appdata(self, list_of_data):
             self._fatal_error(ex, 'Fatal error on SSL protocol')
 
     def _do_write(self):
+        backlog = self._write_backlog
         try:
-            while self._write_backlog:
-                data = self._write_backlog[0]
-                count = self._sslobj.write(data)
+            while backlog:
+                data = backlog[0]
                 data_len = len(data)
+                if data_len < _MAX_RECORD_SIZE and len(backlog) > 1:
+                    data, data_len = self._coalesce_write_backlog()
+                count = self._sslobj.write(data)
                 if count < data_len:
-                    self._write_backlog[0] = data[count:]
+                    backlog[0] = memoryview(data)[count:]
                     self._write_buffer_size -= count
                 else:
-                    del self._write_backlog[0]
+                    del backlog[0]
                     self._write_buffer_size -= data_len
         except SSLAgainErrors:
             pass
         self._process_outgoing()
 
+    def _coalesce_write_backlog(self):
+        # Merge small chunks at the head of the backlog, so that they are
+        # encrypted as a single TLS record instead of one record each.
+        backlog = self._write_backlog
+        chunks = [backlog.popleft()]
+        size = len(chunks[0])
+        while backlog and size + len(backlog[0]) <= _MAX_RECORD_SIZE:
+            chunk = backlog.popleft()
+            chunks.append(chunk)
+            size += len(chunk)
+        data = b''.join(chunks)
+        backlog.appendleft(data)
+        return data, size
+
     def _process_outgoing(self):
         if not self._ssl_writing_paused:
             data = self._outgoing.read()
@@ -768,31 +789,34 @@ def _do_read__buffered(self):
             self._start_shutdown()
 
     def _do_read__copied(self):
-        chunk = b'1'
-        zero = True
-        one = False
+        # Decrypt into a buffer sized for the pending data, rather than
+        # allocating a max_size bytes object for each read(), so that
+        # records decrypted in a row are delivered with a single copy
+        # instead of a join().  The buffer is only kept during this burst
+        # of reads, idle connections don't hold on to it.  Decrypted data
+        # is smaller than the encrypted records, the extra byte avoids
+        # rescheduling a read when the buffer is filled exactly.
+        wants = min(self._incoming.pending + self._sslobj.pending() + 1,
+                    self.max_size)
+        buf = memoryview(bytearray(wants))
+        offset = 0
+        count = 1
 
         try:
-            while True:
-                chunk = self._sslobj.read(self.max_size)
-                if not chunk:
+            while offset < wants:
+                count = self._sslobj.read(wants - offset, buf[offset:])
+                if not count:
                     break
-                if zero:
-                    zero = False
-                    one = True
-                    first = chunk
-                elif one:
-                    one = False
-                    data = [first, chunk]
-                else:
-                    data.append(chunk)
+                offset += count
+            else:
+                self._loop.call_soon(lambda: self._do_read())
         except SSLAgainErrors:
             pass
-        if one:
-            self._app_protocol.data_received(first)
-        elif not zero:
-            self._app_protocol.data_received(b''.join(data))
-        if not chunk:
+        if offset > 0:
+            data = bytes(buf[:offset])
+            buf.release()
+            self._app_protocol.data_received(data)
+        if not count:
             # close_notify
             self._call_eof_received()
             self._start_shutdown()
@@ -1,8 +1,10 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
-    'open_connection', 'start_server')
+    'BufferedStreamReaderProtocol', 'ConnectionPool', 'open_connection',
+    'start_server')
 
 import collections
+import contextlib
 import socket
 import sys
 import weakref
@@ -113,6 +115,222 @@ def factory():
         return await loop.create_unix_server(factory, path, **kwds)
 
 
+class ConnectionPool:
+    """A pool of reusable stream connections.
+
+    Connections are opened with open_connection() and kept per
+    (host, port, ssl) key once released, so that later requests to the
+    same endpoint skip the DNS lookup and the TCP/TLS handshake.
+
+    At most max_size idle connections are kept per key; idle connections
+    are closed after idle_timeout seconds.  Before reuse, a connection is
+    checked for closing, EOF, errors and unexpected pending data.
+
+    Resolved addresses are cached for dns_ttl seconds (0 disables the
+    cache).
+    """
+
+    def __init__(self, *, max_size=10, idle_timeout=60.0, dns_ttl=60.0,
+                 limit=_DEFAULT_LIMIT):
+        if max_size < 0:
+            raise ValueError('max_size cannot be negative')
+        if idle_timeout <= 0:
+            raise ValueError('idle_timeout must be positive')
+        if dns_ttl < 0:
+            raise ValueError('dns_ttl cannot be negative')
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._dns_ttl = dns_ttl
+        self._limit = limit
+        # Maps a key to a deque of (reader, writer, release time), the
+        # most recently released connection last.
+        self._idle = {}
+        # Maps writers of acquired connections to their key.
+        self._acquired = {}
+        # Maps (host, port) to (expiration time, addrinfo list).
+        self._dns_cache = {}
+        # Timer closing the idle connections once they expire.
+        self._evict_handle = None
+        self._closed = False
+
+    def __repr__(self):
+        info = [self.__class__.__name__]
+        if self._closed:
+            info.append('closed')
+        info.append(f'idle={sum(map(len, self._idle.values()))}')
+        info.append(f'acquired={len(self._acquired)}')
+        return '<{}>'.format(' '.join(info))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def acquire(self, host, port, *, ssl=None, **kwds):
+        """Return a (reader, writer) pair connected to (host, port).
+
+        An idle connection is reused if possible, otherwise a new one is
+        opened with open_connection(); extra keyword arguments are passed
+        to it.  The connection must be given back with release().
+        """
+        if self._closed:
+            raise RuntimeError('ConnectionPool is closed')
+        loop = events.get_running_loop()
+        key = (host, port, ssl)
+        self._evict_expired(loop.time())
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer, _ = idle.pop()
+            if self._is_reusable(reader, writer):
+                self._acquired[writer] = key
+                return reader, writer
+            writer.close()
+
+        reader, writer = await self._connect(loop, host, port, ssl, kwds)
+        if self._closed:
+            writer.close()
+            raise RuntimeError('ConnectionPool is closed')
+        self._acquired[writer] = key
+        return reader, writer
+
+    def release(self, writer, *, discard=False):
+        """Give back a connection returned by acquire().
+
+        The connection is closed instead of being kept for reuse if
+        discard is true, if it is not reusable, or if the pool is full.
+        """
+        try:
+            key = self._acquired.pop(writer)
+        except KeyError:
+            raise ValueError(f'{writer!r} was not acquired from this pool')
+        reader = writer._reader
+        idle = self._idle.get(key, ())
+        if (discard or self._closed or len(idle) >= self._max_size or
+                not self._is_reusable(reader, writer)):
+            writer.close()
+            return
+        now = writer._loop.time()
+        self._evict_expired(now)
+        idle = self._idle.setdefault(key, collections.deque())
+        idle.append((reader, writer, now))
+        self._schedule_eviction(writer._loop)
+
+    @contextlib.asynccontextmanager
+    async def connection(self, host, port, *, ssl=None, **kwds):
+        """Context manager acquiring a connection and releasing it.
+
+        The connection is discarded if the block raises an exception,
+        since it may be left in an unknown protocol state.
+        """
+        reader, writer = await self.acquire(host, port, ssl=ssl, **kwds)
+        try:
+            yield reader, writer
+        except BaseException:
+            self.release(writer, discard=True)
+            raise
+        else:
+            self.release(writer)
+
+    async def close(self):
+        """Close all idle connections and stop pooling connections.
+
+        Connections currently acquired are closed when released.
+        """
+        self._closed = True
+        if self._evict_handle is not None:
+            self._evict_handle.cancel()
+            self._evict_handle = None
+        writers = [writer for idle in self._idle.values()
+                   for _, writer, _ in idle]
+        self._idle.clear()
+        self._dns_cache.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def clear_dns_cache(self):
+        """Forget all cached DNS results."""
+        self._dns_cache.clear()
+
+    def _is_reusable(self, reader, writer):
+        return (not writer.is_closing() and
+                reader.exception() is None and
+                not reader.at_eof() and
+                # Unsolicited data means the protocol state is unknown.
+                not reader._buffer)
+
+    def _evict_expired(self, now):
+        deadline = now - self._idle_timeout
+        for key in list(self._idle):
+            idle = self._idle[key]
+            while idle and idle[0][2] <= deadline:
+                _, writer, _ = idle.popleft()
+                writer.close()
+            if not idle:
+                del self._idle[key]
+
+    def _schedule_eviction(self, loop):
+        # Idle connections are closed when they expire, even if the pool
+        # is not used anymore.
+        if self._evict_handle is not None or not self._idle:
+            return
+        oldest = min(idle[0][2] for idle in self._idle.values())
+        self._evict_handle = loop.call_at(oldest + self._idle_timeout,
+                                          self._on_evict_timer, loop)
+
+    def _on_evict_timer(self, loop):
+        self._evict_handle = None
+        self._evict_expired(loop.time())
+        self._schedule_eviction(loop)
+
+    async def _resolve(self, loop, host, port, kwds):
+        now = loop.time()
+        entry = self._dns_cache.get((host, port))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        infos = await loop.getaddrinfo(
+            host, port, family=kwds.get('family', 0),
+            type=socket.SOCK_STREAM, proto=kwds.get('proto', 0),
+            flags=kwds.get('flags', 0))
+        if not infos:
+            raise OSError('getaddrinfo() returned empty list')
+        if self._dns_ttl:
+            self._dns_cache[(host, port)] = (now + self._dns_ttl, infos)
+        return infos
+
+    async def _connect(self, loop, host, port, ssl, kwds):
+        if host is None or kwds.get('sock') is not None:
+            return await open_connection(host, port, ssl=ssl,
+                                         limit=self._limit, **kwds)
+        infos = await self._resolve(loop, host, port, kwds)
+        kwds = {k: v for k, v in kwds.items()
+                if k not in ('family', 'proto', 'flags')}
+        if ssl and 'server_hostname' not in kwds:
+            kwds['server_hostname'] = host
+        errors = []
+        for family, _, proto, _, address in infos:
+            addr_host = address[0]
+            if family == socket.AF_INET6 and address[3]:
+                addr_host = f'{addr_host}%{address[3]}'
+            try:
+                return await open_connection(
+                    addr_host, address[1], ssl=ssl, family=family,
+                    proto=proto, limit=self._limit, **kwds)
+            except OSError as exc:
+                errors.append(exc)
+        # The cached addresses may be outdated.
+        self._dns_cache.pop((host, port), None)
+        if len(errors) == 1:
+            raise errors[0]
+        raise OSError('Multiple exceptions: {}'.format(
+            ', '.join(str(exc) for exc in errors)))
+
+
 class FlowControlMixin(protocols.Protocol):
     """Reusable flow control logic for StreamWriter.drain().
 
@@ -297,6 +515,35 @@ def __del__(self):
                 closed.exception()
 
 
+class BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                   protocols.BufferedProtocol):
+    """StreamReaderProtocol variant implementing BufferedProtocol.
+
+    The transport receives data directly into a buffer preallocated by
+    the protocol, which is then appended to the StreamReader buffer.
+    This saves allocating an intermediate bytes object for every chunk
+    received from the transport.
+    """
+
+    def __init__(self, stream_reader, client_connected_cb=None, loop=None,
+                 buffer_size=None):
+        super().__init__(stream_reader, client_connected_cb, loop=loop)
+        if buffer_size is None:
+            if stream_reader is not None:
+                buffer_size = stream_reader._limit
+            else:
+                buffer_size = _DEFAULT_LIMIT
+        if buffer_size <= 0:
+            raise ValueError('Buffer size cannot be <= 0')
+        self._recv_buffer = memoryview(bytearray(buffer_size))
+
+    def get_buffer(self, sizehint):
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        self.data_received(self._recv_buffer[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -697,6 +944,37 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into `buffer`.
+
+        Return the number of bytes read.  Data is copied straight from the
+        internal buffer into `buffer`, without creating an intermediate
+        bytes object.  If EOF was received and the internal buffer is
+        empty, return 0.
+
+        Like read(n), this returns as soon as at least 1 byte is available
+        in the internal buffer.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        view = memoryview(buffer).cast('B')
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data('readinto')
+
+        nbytes = min(len(view), len(self._buffer))
+        view[:nbytes] = memoryview(self._buffer)[:nbytes]
+        del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
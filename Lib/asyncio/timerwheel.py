@@ -0,0 +1,243 @@
+"""Hierarchical timing wheel for scheduled TimerHandle objects.
+
+This is an alternative to the binary heap used by BaseEventLoop for
+call_at()/call_later().  Inserting and cancelling a timer is O(1),
+which matters for servers that arm and cancel a huge number of
+timeouts, most of which never fire.
+
+Time is split into ticks of *resolution* seconds.  The wheel has
+_LEVELS levels of _SIZE slots each: level 0 holds the timers expiring
+within the current block of _SIZE ticks, level 1 those expiring within
+the current block of _SIZE**2 ticks, and so on.  When the current tick
+enters a new block, the timers of the matching higher-level slot are
+"cascaded" down to the lower levels.  Timers beyond the reach of the
+top level are kept in an overflow heap.
+
+A bitmap of occupied slots is kept per level, so that runs of empty
+slots are skipped in constant time when the wheel is advanced.
+
+Timers are expired in `when` order.
+"""
+
+__all__ = ()
+
+import heapq
+
+_BITS = 8
+_SIZE = 1 << _BITS
+_MASK = _SIZE - 1
+_LEVELS = 4
+_TOP_SHIFT = _BITS * _LEVELS
+
+
+def _next_slot(bitmap, index):
+    """Return the first occupied slot >= index, or -1."""
+    bits = bitmap >> index
+    if not bits:
+        return -1
+    return index + (bits & -bits).bit_length() - 1
+
+
+class TimerWheel:
+    """Hierarchical timing wheel of TimerHandle objects."""
+
+    def __init__(self, resolution, now):
+        if resolution <= 0:
+            raise ValueError('resolution must be positive')
+        self._resolution = resolution
+        self._tick = self._to_tick(now)
+        # Slots are dicts mapping id(handle) to the handle: TimerHandle
+        # defines __eq__() and __hash__() on its attributes, so distinct
+        # handles may compare equal.
+        self._slots = [[None] * _SIZE for _ in range(_LEVELS)]
+        self._occupied = [0] * _LEVELS
+        # Heap of timers beyond the top level; cancelled timers are
+        # dropped lazily when they are moved to the wheel.
+        self._overflow = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for level in self._slots:
+            for slot in level:
+                if slot:
+                    yield from slot.values()
+        for handle in self._overflow:
+            if not handle._cancelled:
+                yield handle
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def _to_tick(self, when):
+        return int(when // self._resolution)
+
+    def _locate(self, tick):
+        """Return the (level, index) of the slot for tick.
+
+        Return (_LEVELS, 0) if the timer belongs to the overflow heap.
+        """
+        cur = self._tick
+        if tick < cur:
+            tick = cur
+        for level in range(_LEVELS):
+            shift = _BITS * (level + 1)
+            if (tick >> shift) == (cur >> shift):
+                return level, (tick >> (_BITS * level)) & _MASK
+        return _LEVELS, 0
+
+    def _place(self, handle):
+        level, index = self._locate(self._to_tick(handle._when))
+        if level == _LEVELS:
+            heapq.heappush(self._overflow, handle)
+            return
+        slot = self._slots[level][index]
+        if slot is None:
+            slot = self._slots[level][index] = {}
+            self._occupied[level] |= 1 << index
+        slot[id(handle)] = handle
+
+    def push(self, handle):
+        """Add a TimerHandle to the wheel."""
+        self._place(handle)
+        self._count += 1
+
+    def discard(self, handle):
+        """Remove a TimerHandle from the wheel."""
+        level, index = self._locate(self._to_tick(handle._when))
+        self._count -= 1
+        if level == _LEVELS:
+            # Removed from the heap once it is cancelled.
+            return
+        slot = self._slots[level][index]
+        if slot is not None:
+            slot.pop(id(handle), None)
+            if not slot:
+                self._clear_slot(level, index)
+
+    def clear(self):
+        for level in range(_LEVELS):
+            self._slots[level] = [None] * _SIZE
+            self._occupied[level] = 0
+        self._overflow.clear()
+        self._count = 0
+
+    def _clear_slot(self, level, index):
+        self._slots[level][index] = None
+        self._occupied[level] &= ~(1 << index)
+
+    def _take_slot(self, level, index):
+        slot = self._slots[level][index]
+        self._clear_slot(level, index)
+        return slot.values()
+
+    def _prune_overflow(self):
+        overflow = self._overflow
+        while overflow and overflow[0]._cancelled:
+            heapq.heappop(overflow)
+
+    def _next_event(self):
+        """Return (tick, level) of the next slot to process, or None.
+
+        For level 0, tick is the tick of a slot whose timers expire;
+        for higher levels, it is the first tick of a block which must be
+        cascaded.  Level _LEVELS denotes the overflow heap.
+        """
+        cur = self._tick
+        for level in range(_LEVELS):
+            shift = _BITS * level
+            index = (cur >> shift) & _MASK
+            # The slot of the current block of higher levels has already
+            # been cascaded, so only look at later slots.
+            start = index if level == 0 else index + 1
+            found = _next_slot(self._occupied[level], start)
+            if found >= 0:
+                block = (cur >> shift) - index + found
+                return block << shift, level
+        self._prune_overflow()
+        if self._overflow:
+            tick = self._to_tick(self._overflow[0]._when)
+            return (tick >> _TOP_SHIFT) << _TOP_SHIFT, _LEVELS
+        return None
+
+    def next_deadline(self):
+        """Return the loop time of the next slot to process, or None.
+
+        The loop should call pop_expired() at or after this time.
+        """
+        event = self._next_event()
+        if event is None:
+            return None
+        tick, level = event
+        if level == 0:
+            slot = self._slots[0][tick & _MASK]
+            return min(handle._when for handle in slot.values())
+        return tick * self._resolution
+
+    def _cascade(self, level, index):
+        for handle in self._take_slot(level, index):
+            self._place(handle)
+
+    def _migrate_overflow(self):
+        overflow = self._overflow
+        top = self._tick >> _TOP_SHIFT
+        while overflow:
+            handle = overflow[0]
+            if not handle._cancelled:
+                if (self._to_tick(handle._when) >> _TOP_SHIFT) != top:
+                    break
+                heapq.heappop(overflow)
+                self._place(handle)
+            else:
+                heapq.heappop(overflow)
+
+    def pop_expired(self, end_time):
+        """Remove and return the timers with a deadline before end_time.
+
+        The returned list is sorted by deadline.
+        """
+        expired = []
+        if not self._count:
+            self._tick = max(self._tick, self._to_tick(end_time))
+            return expired
+        target = self._to_tick(end_time)
+        while self._tick < target:
+            event = self._next_event()
+            if event is None:
+                self._tick = target
+                break
+            tick, level = event
+            if level == 0:
+                if tick >= target:
+                    self._tick = target
+                    break
+                self._tick = tick
+                timers = sorted(self._take_slot(0, tick & _MASK))
+                expired.extend(timers)
+            else:
+                if tick > target:
+                    self._tick = target
+                    break
+                self._tick = tick
+                if level == _LEVELS:
+                    self._migrate_overflow()
+                else:
+                    self._cascade(level, (tick >> (_BITS * level)) & _MASK)
+
+        # Timers of the current tick expire individually.
+        index = self._tick & _MASK
+        slot = self._slots[0][index]
+        if slot is not None:
+            due = sorted(handle for handle in slot.values()
+                         if handle._when < end_time)
+            for handle in due:
+                del slot[id(handle)]
+            if not slot:
+                self._clear_slot(0, index)
+            expired.extend(due)
+
+        self._count -= len(expired)
+        return expired
@@ -32,13 +32,21 @@
     'ThreadPoolExecutor',
 )
 
+try:
+    import _xxsubinterpreters
+except ImportError:
+    _xxsubinterpreters = None
+
+if _xxsubinterpreters is not None:
+    __all__ += ('InterpreterPoolExecutor',)
+
 
 def __dir__():
     return __all__ + ('__author__', '__doc__')
 
 
 def __getattr__(name):
-    global ProcessPoolExecutor, ThreadPoolExecutor
+    global ProcessPoolExecutor, ThreadPoolExecutor, InterpreterPoolExecutor
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
@@ -50,4 +58,9 @@ def __getattr__(name):
         ThreadPoolExecutor = te
         return te
 
+    if _xxsubinterpreters is not None and name == 'InterpreterPoolExecutor':
+        from .interpreter import InterpreterPoolExecutor as ie
+        InterpreterPoolExecutor = ie
+        return ie
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,13 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
+import queue
 import threading
 import time
 import types
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -322,6 +325,14 @@ def _result_or_cancel(fut, timeout=None):
         del fut
 
 
+def _check_buffersize(buffersize):
+    if buffersize is not None:
+        if not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        if buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+
+
 class Future(object):
     """Represents the result of an asynchronous computation."""
 
@@ -580,7 +591,7 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -592,6 +603,11 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The maximum number of submitted calls whose results
+                have not been yielded yet. If None, all the calls are
+                submitted immediately and the iterables are consumed
+                eagerly. Otherwise, the iterables are consumed lazily, as
+                the results are yielded.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -602,10 +618,20 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        _check_buffersize(buffersize)
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        zipped_iterables = zip(*iterables)
+        if buffersize is None:
+            fs = [self.submit(fn, *args) for args in zipped_iterables]
+        else:
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in itertools.islice(zipped_iterables, buffersize))
+
+        # Don't let the result iterator keep the executor alive.
+        executor_weakref = weakref.ref(self)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -614,6 +640,11 @@ def result_iterator():
                 # reverse to keep finishing order
                 fs.reverse()
                 while fs:
+                    if (buffersize is not None
+                        and (executor := executor_weakref()) is not None
+                        and (args := next(zipped_iterables, None))):
+                        fs.appendleft(executor.submit(fn, *args))
+                        executor = None
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
                         yield _result_or_cancel(fs.pop())
@@ -624,6 +655,93 @@ def result_iterator():
                     future.cancel()
         return result_iterator()
 
+    def map_unordered(self, fn, *iterables, timeout=None, chunksize=1,
+                      buffersize=None):
+        """Returns an iterator over the results of fn(*args), as they complete.
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: The size of the chunks the iterable will be broken into
+                before being passed to a child process. This argument is only
+                used by ProcessPoolExecutor; it is ignored by
+                ThreadPoolExecutor.
+            buffersize: The maximum number of submitted calls whose results
+                have not been yielded yet. If None, all the calls are
+                submitted immediately and the iterables are consumed
+                eagerly.
+
+        Returns:
+            An iterator over the results of fn(*args) for the arguments taken
+            from the iterables, in the order in which the calls complete.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        _check_buffersize(buffersize)
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        zipped_iterables = zip(*iterables)
+        # Done callbacks put the completed futures in this queue, which
+        # is thread-safe.
+        completed = queue.SimpleQueue()
+        pending = set()
+        # The done callbacks don't keep the queue alive, so that the
+        # futures left in the queue don't form reference cycles.
+        completed_ref = weakref.ref(completed)
+
+        def put_completed(future):
+            completed = completed_ref()
+            if completed is not None:
+                completed.put(future)
+
+        def submit(executor, args):
+            future = executor.submit(fn, *args)
+            pending.add(future)
+            future.add_done_callback(put_completed)
+
+        if buffersize is None:
+            for args in zipped_iterables:
+                submit(self, args)
+        else:
+            for args in itertools.islice(zipped_iterables, buffersize):
+                submit(self, args)
+
+        executor_weakref = weakref.ref(self)
+
+        def result_iterator():
+            try:
+                while pending:
+                    try:
+                        if timeout is None:
+                            future = completed.get()
+                        else:
+                            future = completed.get(
+                                timeout=max(0, end_time - time.monotonic()))
+                    except queue.Empty:
+                        raise TimeoutError(
+                            '%d futures unfinished' % len(pending)) from None
+                    pending.discard(future)
+                    if (buffersize is not None
+                        and (executor := executor_weakref()) is not None
+                        and (args := next(zipped_iterables, None))):
+                        submit(executor, args)
+                        executor = None
+                    try:
+                        yield future.result()
+                    finally:
+                        # Break a reference cycle with the exception
+                        del future
+            finally:
+                for future in pending:
+                    future.cancel()
+        return result_iterator()
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
 
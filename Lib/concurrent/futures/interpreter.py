@@ -0,0 +1,250 @@
+# Licensed to PSF under a Contributor Agreement.
+
+"""Implements InterpreterPoolExecutor.
+
+The executor is a ThreadPoolExecutor whose worker threads each own a
+subinterpreter created with its own GIL.  A worker thread runs the calls
+in its subinterpreter, so that calls run in parallel on several cores,
+while the threads of the main interpreter only wait for them.
+
+Data flow through the executor:
+
+The callable and its arguments are pickled with pickle protocol 5 in the
+worker thread and passed to the subinterpreter in the namespace of the
+script run by run_string().  The subinterpreter unpickles them, runs the
+call, and sends back the pickled result (or exception) through a channel.
+bytes objects passed directly as arguments or returned as results, and
+the out-of-band buffers of protocol 5, are passed as separate objects:
+they are not copied into the pickle data and out of it again.
+
+Receiving an object from a channel releases its data in the interpreter
+which sent it, so the results channel is only read once run_string() has
+returned, when no thread runs in the subinterpreter.
+"""
+
+import functools
+import itertools
+import pickle
+import sys
+import threading
+import traceback
+
+import _xxsubinterpreters as _interpreters
+import _xxinterpchannels as _channels
+
+from concurrent.futures import _base
+from concurrent.futures import thread
+
+__all__ = ['InterpreterPoolExecutor']
+
+# bytes arguments and results of at least this size are passed as separate
+# objects rather than pickled.
+_RAW_BYTES_MIN_SIZE = 1024
+
+# Code run in a new subinterpreter.  Names defined here persist in its
+# __main__ module between calls.  The interpreter gets the sys.path of the
+# main interpreter, as the children of the spawn start method of
+# multiprocessing do, so that it can import the modules of the callables.
+_SETUP = """\
+import sys
+sys.path[:] = _sys_path.split('\\0')
+del _sys_path
+from concurrent.futures.interpreter import _execute
+"""
+_RUN = "_execute(_results, globals())"
+
+# Interpreter owned by the current worker thread
+_current = threading.local()
+
+
+class _RemoteTraceback(Exception):
+    def __init__(self, tb):
+        self.tb = tb
+    def __str__(self):
+        return self.tb
+
+
+class _RawBytes(object):
+    """Placeholder of a bytes object passed as a separate object."""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __reduce__(self):
+        return _RawBytes, (self.index,)
+
+
+def _dumps(obj, raw):
+    """Pickle obj and append the buffers to send separately to raw."""
+    def buffer_callback(buffer):
+        view = buffer.raw()
+        base = view.obj
+        if type(base) is bytes and len(base) == view.nbytes:
+            raw.append(base)
+        else:
+            raw.append(view.tobytes())
+        return False
+    return pickle.dumps(obj, 5, buffer_callback=buffer_callback)
+
+
+def _dumps_call(fn, args, kwargs):
+    # The bytes arguments are sent after the out-of-band buffers.
+    strings = []
+    def extract(value):
+        if type(value) is bytes and len(value) >= _RAW_BYTES_MIN_SIZE:
+            strings.append(value)
+            return _RawBytes(len(strings) - 1)
+        return value
+    args = tuple(map(extract, args))
+    kwargs = {key: extract(value) for key, value in kwargs.items()}
+    raw = []
+    data = _dumps((fn, args, kwargs, len(strings)), raw)
+    raw.extend(strings)
+    return data, raw
+
+
+def _loads_call(data, raw):
+    fn, args, kwargs, nstrings = pickle.loads(data, buffers=raw)
+    strings = raw[len(raw) - nstrings:]
+    def restore(value):
+        if type(value) is _RawBytes:
+            return strings[value.index]
+        return value
+    args = tuple(map(restore, args))
+    kwargs = {key: restore(value) for key, value in kwargs.items()}
+    return fn, args, kwargs
+
+
+def _execute(results, namespace):
+    # Run in the subinterpreter: run the call found in the namespace and send
+    # its outcome to the results channel.
+    try:
+        data = namespace.pop('_data')
+        raw = [namespace.pop('_raw%d' % i)
+               for i in range(namespace.pop('_count'))]
+        fn, args, kwargs = _loads_call(data, raw)
+        del data, raw
+        result = fn(*args, **kwargs)
+        raw = []
+        if type(result) is bytes and len(result) >= _RAW_BYTES_MIN_SIZE:
+            data = _dumps((True, _RawBytes(0), None), raw)
+            raw.append(result)
+        else:
+            data = _dumps((True, result, None), raw)
+    except BaseException as exc:
+        tb = ''.join(traceback.format_exception(exc))
+        raw = []
+        try:
+            data = _dumps((False, exc, tb), raw)
+        except BaseException:
+            # The exception cannot be pickled
+            raw = []
+            data = _dumps((False, RuntimeError(repr(exc)), tb), raw)
+    _channels.send(results, len(raw))
+    _channels.send(results, data)
+    for item in raw:
+        _channels.send(results, item)
+
+
+class _Interpreter(object):
+    """Subinterpreter running the calls of a worker thread."""
+
+    def __init__(self):
+        self.id = _interpreters.create(isolated=True)
+        try:
+            self.results = _channels.create()
+            _interpreters.run_string(
+                self.id, _SETUP,
+                {'_results': self.results, '_sys_path': '\0'.join(sys.path)})
+        except BaseException:
+            self.close()
+            raise
+
+    def call(self, fn, args, kwargs):
+        data, raw = _dumps_call(fn, args, kwargs)
+        shared = {'_data': data, '_count': len(raw)}
+        for i, item in enumerate(raw):
+            shared['_raw%d' % i] = item
+        del data, raw
+        _interpreters.run_string(self.id, _RUN, shared)
+        # The outcome is received once the interpreter is idle: receiving
+        # an object releases its data in the interpreter which sent it.
+        count = _channels.recv(self.results)
+        data = _channels.recv(self.results)
+        raw = [_channels.recv(self.results) for _ in range(count)]
+        success, value, tb = pickle.loads(data, buffers=raw)
+        if success:
+            if type(value) is _RawBytes:
+                value = raw[-1]
+            return value
+        value.__cause__ = _RemoteTraceback(tb)
+        try:
+            raise value
+        finally:
+            # Break a reference cycle with the exception in value
+            value = None
+
+    def close(self):
+        if hasattr(self, 'results'):
+            _channels.destroy(self.results)
+        _interpreters.destroy(self.id)
+
+
+def _call_in_interpreter(fn, args, kwargs):
+    return _current.interpreter.call(fn, args, kwargs)
+
+
+def _interpreter_worker(worker, executor_reference, work_queue, initializer,
+                        initargs, idle_timeout=None):
+    try:
+        interp = _Interpreter()
+    except BaseException:
+        _base.LOGGER.critical('Exception creating an interpreter:',
+                              exc_info=True)
+        executor = executor_reference()
+        if executor is not None:
+            executor._initializer_failed()
+        return
+    _current.interpreter = interp
+    try:
+        if initializer is not None:
+            # Run the initializer in the interpreter.
+            initializer = functools.partial(_call_in_interpreter, initializer,
+                                            initargs, {})
+        worker(executor_reference, work_queue, initializer, (), idle_timeout)
+    finally:
+        del _current.interpreter
+        interp.close()
+
+
+class InterpreterPoolExecutor(thread.ThreadPoolExecutor):
+
+    # Used to assign unique thread names when thread_name_prefix is not supplied.
+    _counter = itertools.count().__next__
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), **kwargs):
+        """Initializes a new InterpreterPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of interpreters that can be used
+                to execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize each interpreter.
+            initargs: A tuple of arguments to pass to the initializer.
+
+        The other keyword arguments are passed to ThreadPoolExecutor.
+        The callables, their arguments and their results must be
+        picklable.
+        """
+        super().__init__(max_workers,
+                         thread_name_prefix or
+                         ("InterpreterPoolExecutor-%d" % self._counter()),
+                         initializer, initargs, **kwargs)
+        self._worker = functools.partial(_interpreter_worker, self._worker)
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(_call_in_interpreter, fn, args, kwargs)
+    submit.__doc__ = _base.Executor.submit.__doc__
@@ -53,11 +53,16 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
+import array
+import io
 import itertools
+import pickle
 import sys
+import time
 from traceback import format_exception
 
 
@@ -115,6 +120,19 @@ def _python_exit():
 # - the thread wakeup reader
 _MAX_WINDOWS_WORKERS = 63 - 2
 
+# With chunksize="auto", map() sizes the chunks so that running a chunk
+# takes about _AUTO_CHUNK_DURATION seconds in a worker, which amortizes
+# the cost of pickling the chunk and of the round-trip through the queues.
+_AUTO_CHUNK_DURATION = 0.02
+_AUTO_CHUNK_MAX = 1 << 14
+
+# With a shared_memory_threshold, large buffers are looked for in the
+# arguments and in the results down to this number of nested tuples,
+# lists and dicts.
+_SHARED_MEMORY_MAX_DEPTH = 3
+# Size of the smallest shared memory segment of the pool
+_SHARED_MEMORY_MIN_SEGMENT = 1 << 16
+
 # Hack to embed stringification of remote traceback in local traceback
 
 class _RemoteTraceback(Exception):
@@ -144,6 +162,8 @@ def __init__(self, future, fn, args, kwargs):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        # Shared memory segment holding the large arguments, if any
+        self.segment = None
 
 class _ResultItem(object):
     def __init__(self, work_id, exception=None, result=None, exit_pid=None):
@@ -207,6 +227,267 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map with chunksize="auto".
+
+    Like _process_chunk(), but also returns the time spent running the
+    function passed to map().
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return results, time.perf_counter() - start
+
+
+class _AdaptiveChunker:
+    """ Iterates over zip()ed iterables in chunks of varying size.
+
+    The size of the next chunks is adjusted by record() from the time
+    spent running the previous chunks.
+    """
+
+    def __init__(self, *iterables):
+        self._it = zip(*iterables)
+        self.chunksize = 1
+        # Moving average of the time spent running one call
+        self._call_time = None
+
+    def __iter__(self):
+        while True:
+            chunk = tuple(itertools.islice(self._it, self.chunksize))
+            if not chunk:
+                return
+            yield chunk
+
+    def record(self, ncalls, elapsed):
+        call_time = elapsed / ncalls
+        if self._call_time is None:
+            self._call_time = call_time
+        else:
+            self._call_time = (self._call_time + call_time) / 2
+        if self._call_time > 0:
+            target = int(_AUTO_CHUNK_DURATION / self._call_time)
+        else:
+            target = _AUTO_CHUNK_MAX
+        # Grow progressively, but shrink immediately.
+        self.chunksize = max(1, min(target, 2 * self.chunksize,
+                                    _AUTO_CHUNK_MAX))
+
+
+class _SharedBuffer:
+    """ Wraps a large buffer to move it out-of-band when pickled. """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.buffer = pickle.PickleBuffer(obj)
+
+    def __reduce_ex__(self, protocol):
+        obj = self.obj
+        if isinstance(obj, array.array):
+            return _rebuild_array, (obj.typecode, self.buffer)
+        if isinstance(obj, memoryview):
+            return _rebuild_memoryview, (self.buffer, obj.format, obj.shape,
+                                         obj.readonly)
+        return type(obj), (self.buffer,)
+
+
+def _rebuild_array(typecode, buffer):
+    result = array.array(typecode)
+    result.frombytes(buffer)
+    return result
+
+
+def _rebuild_memoryview(buffer, format, shape, readonly):
+    data = bytes(buffer) if readonly else bytearray(buffer)
+    return memoryview(data).cast(format, shape)
+
+
+def _is_shareable(obj, threshold):
+    cls = type(obj)
+    if cls is bytes or cls is bytearray:
+        return len(obj) >= threshold
+    if cls is array.array:
+        return len(obj) * obj.itemsize >= threshold
+    if cls is memoryview:
+        return (obj.c_contiguous and obj.nbytes >= threshold
+                and len(obj.format.lstrip('@')) == 1)
+    return False
+
+
+def _wrap_buffers(obj, threshold, wrapped, depth=0):
+    """ Replaces the large buffers of obj with _SharedBuffer objects.
+
+    The _SharedBuffer objects are appended to wrapped.  Containers without
+    large buffers are returned unchanged.
+    """
+    if _is_shareable(obj, threshold):
+        shared = _SharedBuffer(obj)
+        wrapped.append(shared)
+        return shared
+    if depth >= _SHARED_MEMORY_MAX_DEPTH:
+        return obj
+    cls = type(obj)
+    if cls is tuple or cls is list:
+        count = len(wrapped)
+        items = [_wrap_buffers(item, threshold, wrapped, depth + 1)
+                 for item in obj]
+        if len(wrapped) == count:
+            return obj
+        return cls(items)
+    if cls is dict:
+        count = len(wrapped)
+        items = {key: _wrap_buffers(value, threshold, wrapped, depth + 1)
+                 for key, value in obj.items()}
+        if len(wrapped) == count:
+            return obj
+        return items
+    return obj
+
+
+class _SharedMemoryMessage:
+    """ An object pickled with its large buffers in a shared memory segment.
+
+    The pickle data holds the rest of the object, and is sent through the
+    queues.
+    """
+
+    def __init__(self, data, name, layout):
+        self.data = data
+        self.name = name
+        # List of the (offset, size) of the buffers in the segment
+        self.layout = layout
+
+    def load(self, unlink=False):
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(self.name)
+        try:
+            buffers = [shm.buf[offset:offset + size]
+                       for offset, size in self.layout]
+            try:
+                # The buffers are copied by the rebuild functions.
+                return pickle.loads(self.data, buffers=buffers)
+            finally:
+                for buffer in buffers:
+                    buffer.release()
+        finally:
+            shm.close()
+            if unlink:
+                shm.unlink()
+
+    def unlink(self):
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(self.name)
+        shm.close()
+        shm.unlink()
+
+
+def _dump_shared(obj, threshold, allocate):
+    """ Pickles obj with its large buffers in a shared memory segment.
+
+    allocate(size) must return a SharedMemory of at least size bytes.
+    Return (message, segment), or (obj, None) if obj has no large buffer.
+    """
+    wrapped = []
+    obj = _wrap_buffers(obj, threshold, wrapped)
+    if not wrapped:
+        return obj, None
+    ours = {id(shared.buffer) for shared in wrapped}
+    buffers = []
+
+    def buffer_callback(buffer):
+        if id(buffer) in ours:
+            buffers.append(buffer.raw())
+            return False
+        # Keep the buffers of other objects in-band: they could refer
+        # to the segment after it is closed.
+        return True
+
+    file = io.BytesIO()
+    ForkingPickler(file, 5, True, buffer_callback).dump(obj)
+    layout = []
+    offset = 0
+    for buffer in buffers:
+        layout.append((offset, buffer.nbytes))
+        offset += buffer.nbytes
+    shm = allocate(offset)
+    for buffer, (offset, size) in zip(buffers, layout):
+        shm.buf[offset:offset + size] = buffer
+        buffer.release()
+    return _SharedMemoryMessage(file.getvalue(), shm.name, layout), shm
+
+
+def _create_segment(size):
+    from multiprocessing.shared_memory import SharedMemory
+    return SharedMemory(create=True, size=size)
+
+
+def _call_with_shared_memory(threshold, call):
+    """ Runs a call sent with ProcessPoolExecutor(shared_memory_threshold).
+
+    The large buffers of the result are placed in a new shared memory
+    segment, which is unlinked by the parent process.
+
+    This function is run in a separate process.
+
+    """
+    if isinstance(call, _SharedMemoryMessage):
+        # The segment belongs to the pool of the parent process.
+        call = call.load()
+    fn, args, kwargs = call
+    del call
+    result = fn(*args, **kwargs)
+    message, shm = _dump_shared(result, threshold, _create_segment)
+    if shm is not None:
+        shm.close()
+    return message
+
+
+class _SharedMemoryPool:
+    """ A pool of shared memory segments for the arguments of the calls.
+
+    The segments are only used by the executor manager thread.
+    """
+
+    def __init__(self, max_free):
+        self._max_free = max_free
+        # Map sizes to lists of free segments
+        self._free = {}
+        self._nfree = 0
+        # Map names to the segments in use
+        self._in_use = {}
+
+    def acquire(self, size):
+        size = max(_SHARED_MEMORY_MIN_SEGMENT, 1 << (size - 1).bit_length())
+        free = self._free.get(size)
+        if free:
+            shm = free.pop()
+            self._nfree -= 1
+        else:
+            shm = _create_segment(size)
+        self._in_use[shm.name] = shm
+        return shm
+
+    def release(self, shm):
+        del self._in_use[shm.name]
+        if self._nfree < self._max_free:
+            self._free.setdefault(shm.size, []).append(shm)
+            self._nfree += 1
+        else:
+            shm.close()
+            shm.unlink()
+
+    def close(self):
+        segments = list(self._in_use.values())
+        for free in self._free.values():
+            segments.extend(free)
+        self._in_use.clear()
+        self._free.clear()
+        self._nfree = 0
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
                      exit_pid=None):
     """Safely send back the given result or exception"""
@@ -330,6 +611,10 @@ def weakref_cb(_,
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # Large buffers are sent through shared memory if this is not None
+        self.shared_memory_threshold = executor._shared_memory_threshold
+        self.shared_memory_pool = executor._shared_memory_pool
+
         super().__init__()
 
     def run(self):
@@ -391,15 +676,37 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    if self.shared_memory_threshold is not None:
+                        call_item = self.shared_memory_call_item(work_id,
+                                                                 work_item)
+                        if call_item is None:
+                            continue
+                    else:
+                        call_item = _CallItem(work_id,
+                                              work_item.fn,
+                                              work_item.args,
+                                              work_item.kwargs)
+                    self.call_queue.put(call_item, block=True)
                 else:
                     del self.pending_work_items[work_id]
                     continue
 
+    def shared_memory_call_item(self, work_id, work_item):
+        # Returns a _CallItem sending the large arguments of work_item
+        # through shared memory, or None if they cannot be pickled.
+        call = (work_item.fn, work_item.args, work_item.kwargs)
+        try:
+            call, work_item.segment = _dump_shared(
+                call, self.shared_memory_threshold,
+                self.shared_memory_pool.acquire)
+        except BaseException as e:
+            del self.pending_work_items[work_id]
+            exc = _ExceptionWithTraceback(e, e.__traceback__)
+            work_item.future.set_exception(exc)
+            return None
+        return _CallItem(work_id, _call_with_shared_memory,
+                         (self.shared_memory_threshold, call), {})
+
     def wait_result_broken_or_wakeup(self):
         # Wait for a result to be ready in the result_queue while checking
         # that all worker processes are still running, or for a wake up
@@ -447,12 +754,25 @@ def process_result_item(self, result_item):
         else:
             # Received a _ResultItem so mark the future as completed.
             work_item = self.pending_work_items.pop(result_item.work_id, None)
+            result = result_item.result
+            if isinstance(result, _SharedMemoryMessage):
+                # Copy the result out of the segment created by the worker.
+                try:
+                    if work_item is not None:
+                        result = result.load(unlink=True)
+                    else:
+                        result.unlink()
+                except BaseException as e:
+                    result_item.exception = e
             # work_item can be None if another process terminated (see above)
             if work_item is not None:
+                if work_item.segment is not None:
+                    self.shared_memory_pool.release(work_item.segment)
+                    work_item.segment = None
                 if result_item.exception:
                     work_item.future.set_exception(result_item.exception)
                 else:
-                    work_item.future.set_result(result_item.result)
+                    work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -553,6 +873,8 @@ def join_executor_internals(self):
         # some ctx.Queue methods may deadlock on Mac OS X.
         for p in self.processes.values():
             p.join()
+        if self.shared_memory_pool is not None:
+            self.shared_memory_pool.close()
 
     def get_n_children_alive(self):
         # This is an upper bound on the number of children alive.
@@ -607,6 +929,19 @@ def _chain_from_iterable_of_lists(iterable):
             yield element.pop()
 
 
+def _chain_from_iterable_of_timed_lists(iterable, chunker):
+    """
+    Like _chain_from_iterable_of_lists(), for the results of
+    _process_timed_chunk().  The timings are reported to chunker.
+    """
+    for element, elapsed in iterable:
+        if element:
+            chunker.record(len(element), elapsed)
+        element.reverse()
+        while element:
+            yield element.pop()
+
+
 class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
@@ -616,7 +951,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -634,6 +970,12 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, the bytes, bytearray,
+                array.array and memoryview objects of at least this number of
+                bytes found in the arguments and results of the calls (possibly
+                nested in tuples, lists and dicts) are passed through shared
+                memory instead of being sent through pipes.  Not supported on
+                Windows.
         """
         _check_system_limits()
 
@@ -680,6 +1022,28 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+            if sys.platform == 'win32':
+                # The segments of the results would be destroyed when the
+                # worker closes them, before the parent opens them.
+                raise ValueError("shared_memory_threshold is not supported"
+                                 " on Windows")
+            # Start the resource tracker before the workers, so that they
+            # share it with this process: segments are registered by the
+            # process creating them and unregistered by the one unlinking
+            # them.
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+            self._shared_memory_pool = _SharedMemoryPool(
+                self._max_workers + EXTRA_QUEUED_CALLS)
+        else:
+            self._shared_memory_pool = None
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -791,7 +1155,7 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -802,6 +1166,12 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If set to "auto", the size of the chunks is adjusted from the
+                time spent running the previous chunks.
+            buffersize: The maximum number of submitted chunks whose results
+                have not been yielded yet. If None, all the chunks are
+                submitted immediately and the iterables are consumed
+                eagerly, unless chunksize is "auto".
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -812,14 +1182,66 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == "auto":
+            return self._map_auto(super().map, fn, iterables, timeout,
+                                  buffersize)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
+    def map_unordered(self, fn, *iterables, timeout=None, chunksize=1,
+                      buffersize=None):
+        """Returns an iterator over the results of fn(*args), as they complete.
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and submitted to the process pool.
+                The results of a chunk are yielded together, in order.
+                If set to "auto", the size of the chunks is adjusted from the
+                time spent running the previous chunks.
+            buffersize: The maximum number of submitted chunks whose results
+                have not been yielded yet. If None, all the chunks are
+                submitted immediately and the iterables are consumed
+                eagerly, unless chunksize is "auto".
+
+        Returns:
+            An iterator over the results of fn(*args) for the arguments taken
+            from the iterables, in the order in which the chunks complete.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        if chunksize == "auto":
+            return self._map_auto(super().map_unordered, fn, iterables,
+                                  timeout, buffersize)
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+
+        results = super().map_unordered(
+            partial(_process_chunk, fn),
+            _get_chunks(*iterables, chunksize=chunksize),
+            timeout=timeout, buffersize=buffersize)
+        return _chain_from_iterable_of_lists(results)
+
+    def _map_auto(self, map_chunks, fn, iterables, timeout, buffersize):
+        # The chunks must be submitted lazily for their size to adapt.
+        if buffersize is None:
+            buffersize = 2 * self._max_workers
+        chunker = _AdaptiveChunker(*iterables)
+        results = map_chunks(partial(_process_timed_chunk, fn), chunker,
+                             timeout=timeout, buffersize=buffersize)
+        return _chain_from_iterable_of_timed_lists(results, chunker)
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
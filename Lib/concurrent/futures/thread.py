@@ -6,9 +6,11 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
+import time
 import types
 import weakref
 import os
@@ -66,7 +68,180 @@ def run(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
-def _worker(executor_reference, work_queue, initializer, initargs):
+class _WorkerState(object):
+    """State of a worker thread of a work-stealing ThreadPoolExecutor.
+
+    The counters are only updated by the worker thread.
+    """
+
+    __slots__ = ('deque', 'waiter', 'next_victim', 'tasks', 'steals',
+                 'wait_time', 'run_time')
+
+    def __init__(self):
+        # Deque of (work item, submission time)
+        self.deque = collections.deque()
+        # Lock released by put() to wake up the idle worker
+        self.waiter = threading.Lock()
+        self.waiter.acquire()
+        self.next_victim = 0
+        self.tasks = 0
+        self.steals = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+
+class _WorkStealingQueue(object):
+    """Work queue of a ThreadPoolExecutor created with work_stealing=True.
+
+    Work items submitted from a worker thread are pushed to the deque of the
+    worker, and the others to a shared deque.  A worker takes the items of
+    its own deque first (most recent first), then those of the shared deque,
+    and then steals the oldest items of the other workers.  Appending to and
+    popping from a deque are atomic, so no lock is shared by the workers:
+    an idle worker waits on its own lock, which put() releases.
+    """
+
+    def __init__(self):
+        self._shared = collections.deque()
+        # List of the _WorkerState of the running workers, replaced when
+        # a worker starts or exits so that it can be iterated without lock.
+        self._states = []
+        self._states_lock = threading.Lock()
+        # Counters of the exited workers
+        self._retired = _WorkerState()
+        self._local = threading.local()
+        # Waiter locks of the idle workers
+        self._idle = collections.deque()
+
+    def register(self):
+        # Called by a worker thread when it starts.
+        state = _WorkerState()
+        self._local.state = state
+        with self._states_lock:
+            self._states = self._states + [state]
+        return state
+
+    def unregister(self, state):
+        # Called by a worker thread when it exits.
+        with self._states_lock:
+            states = list(self._states)
+            states.remove(state)
+            self._states = states
+            retired = self._retired
+            retired.tasks += state.tasks
+            retired.steals += state.steals
+            retired.wait_time += state.wait_time
+            retired.run_time += state.run_time
+        if state.deque:
+            self._shared.extend(state.deque)
+            state.deque.clear()
+            self._wakeup()
+
+    def _wakeup(self):
+        try:
+            waiter = self._idle.popleft()
+        except IndexError:
+            return
+        waiter.release()
+
+    def put(self, work_item):
+        state = getattr(self._local, 'state', None)
+        # The None sentinel must reach the other workers, even after the
+        # current one exited.
+        if state is None or work_item is None:
+            self._shared.append((work_item, time.monotonic()))
+        else:
+            state.deque.append((work_item, time.monotonic()))
+        if self._idle:
+            self._wakeup()
+
+    def _pop(self, state):
+        local = state.deque
+        if local:
+            try:
+                return local.pop()
+            except IndexError:
+                pass
+        shared = self._shared
+        if shared:
+            try:
+                return shared.popleft()
+            except IndexError:
+                pass
+        states = self._states
+        n = len(states)
+        for i in range(n):
+            victim = states[(state.next_victim + i) % n].deque
+            if victim and victim is not local:
+                try:
+                    entry = victim.popleft()
+                except IndexError:
+                    continue
+                state.next_victim += i + 1
+                state.steals += 1
+                return entry
+        return None
+
+    def get(self, state, timeout=None):
+        """Return the next (work item, submission time) for a worker.
+
+        Raise queue.Empty if no work item was available for timeout seconds.
+        """
+        while True:
+            entry = self._pop(state)
+            if entry is not None:
+                return entry
+            # put() checks the idle workers after appending the item, so the
+            # item is either seen below or put() releases the waiter.
+            waiter = state.waiter
+            self._idle.append(waiter)
+            entry = self._pop(state)
+            if entry is None:
+                if timeout is None:
+                    waiter.acquire()
+                    continue
+                if waiter.acquire(True, timeout):
+                    continue
+            try:
+                self._idle.remove(waiter)
+            except ValueError:
+                # put() is releasing the waiter: consume the wakeup and
+                # pass it on, since it may be for another item.
+                waiter.acquire()
+                if entry is not None:
+                    self._wakeup()
+            if entry is not None:
+                return entry
+            entry = self._pop(state)
+            if entry is None:
+                raise queue.Empty
+            return entry
+
+    def get_nowait(self):
+        for d in [self._shared] + [state.deque for state in self._states]:
+            try:
+                return d.popleft()[0]
+            except IndexError:
+                pass
+        raise queue.Empty
+
+    def stats(self):
+        states = self._states + [self._retired]
+        tasks = sum(state.tasks for state in states)
+        wait_time = sum(state.wait_time for state in states)
+        run_time = sum(state.run_time for state in states)
+        return {
+            'tasks_completed': tasks,
+            'steals': sum(state.steals for state in states),
+            'queue_wait_time': wait_time,
+            'run_time': run_time,
+            'average_queue_wait_time': wait_time / tasks if tasks else 0.0,
+            'average_run_time': run_time / tasks if tasks else 0.0,
+        }
+
+
+def _initialize_worker(executor_reference, initializer, initargs):
+    # Return False if the initializer failed.
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -75,12 +250,41 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             executor = executor_reference()
             if executor is not None:
                 executor._initializer_failed()
-            return
+            return False
+    return True
+
+
+def _retire_worker(executor_reference):
+    # Called by a worker which was idle for idle_timeout seconds.
+    # Return True if the worker must exit.
+    executor = executor_reference()
+    return executor is None or executor._retire_idle_thread()
+
+
+def _worker_loop(executor_reference, work_queue, idle_timeout, state=None):
+    # state is the _WorkerState of the worker if work_queue is a
+    # _WorkStealingQueue, None if it is a SimpleQueue.
     try:
         while True:
-            work_item = work_queue.get(block=True)
+            try:
+                if state is None:
+                    work_item = work_queue.get(block=True, timeout=idle_timeout)
+                else:
+                    work_item, submitted = work_queue.get(state, idle_timeout)
+            except queue.Empty:
+                if _retire_worker(executor_reference):
+                    return
+                continue
             if work_item is not None:
-                work_item.run()
+                if state is None:
+                    work_item.run()
+                else:
+                    start = time.monotonic()
+                    work_item.run()
+                    end = time.monotonic()
+                    state.tasks += 1
+                    state.wait_time += start - submitted
+                    state.run_time += end - start
                 # Delete references to object. See issue16284
                 del work_item
 
@@ -109,6 +313,24 @@ def _worker(executor_reference, work_queue, initializer, initargs):
         _base.LOGGER.critical('Exception in worker', exc_info=True)
 
 
+def _worker(executor_reference, work_queue, initializer, initargs,
+            idle_timeout=None):
+    if not _initialize_worker(executor_reference, initializer, initargs):
+        return
+    _worker_loop(executor_reference, work_queue, idle_timeout)
+
+
+def _work_stealing_worker(executor_reference, work_queue, initializer,
+                          initargs, idle_timeout=None):
+    if not _initialize_worker(executor_reference, initializer, initargs):
+        return
+    state = work_queue.register()
+    try:
+        _worker_loop(executor_reference, work_queue, idle_timeout, state)
+    finally:
+        work_queue.unregister(state)
+
+
 class BrokenThreadPool(_base.BrokenExecutor):
     """
     Raised when a worker thread in a ThreadPoolExecutor failed initializing.
@@ -121,7 +343,8 @@ class ThreadPoolExecutor(_base.Executor):
     _counter = itertools.count().__next__
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 idle_timeout=None):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -130,6 +353,14 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, each worker thread has its own queue of
+                the calls submitted by the calls it runs, and idle workers
+                steal calls from the queues of the other workers.  The
+                queue wait time and run time of the calls are measured,
+                see get_stats().
+            idle_timeout: If not None, the number of seconds after which an
+                idle worker thread exits.  Threads are started again when
+                calls are submitted.
         """
         if max_workers is None:
             # ThreadPoolExecutor is often used to:
@@ -146,10 +377,22 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
 
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+
         self._max_workers = max_workers
-        self._work_queue = queue.SimpleQueue()
+        self._idle_timeout = idle_timeout
+        if work_stealing:
+            self._work_queue = _WorkStealingQueue()
+            self._worker = _work_stealing_worker
+        else:
+            self._work_queue = queue.SimpleQueue()
+            self._worker = _worker
+        self._thread_counter = itertools.count().__next__
         self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
+        # Threads which exited after idle_timeout, joined by shutdown()
+        self._retired_threads = set()
         self._broken = False
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
@@ -190,16 +433,56 @@ def weakref_cb(_, q=self._work_queue):
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
-                                     num_threads)
-            t = threading.Thread(name=thread_name, target=_worker,
+                                     self._thread_counter())
+            t = threading.Thread(name=thread_name, target=self._worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._work_queue,
                                        self._initializer,
-                                       self._initargs))
+                                       self._initargs,
+                                       self._idle_timeout))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    def _retire_idle_thread(self):
+        # Called by a worker thread which was idle for idle_timeout seconds.
+        # Return True if the thread must exit.
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._shutdown or _shutdown:
+                # Let shutdown() wake up the thread.
+                return False
+            # Consume the idle count of the thread: if there is none, a call
+            # was submitted for this thread.
+            if not self._idle_semaphore.acquire(timeout=0):
+                return False
+            t = threading.current_thread()
+            self._threads.discard(t)
+            _threads_queues.pop(t, None)
+            # Forget the retired threads which have already exited.
+            self._retired_threads = {r for r in self._retired_threads
+                                     if r.is_alive()}
+            self._retired_threads.add(t)
+            return True
+
+    def get_stats(self):
+        """Returns a dict of statistics about the executor.
+
+        The "threads" key gives the number of worker threads.  If the
+        executor was created with work_stealing=True, the dict also
+        contains:
+
+        * tasks_completed: the number of calls run;
+        * steals: the number of calls stolen from another worker;
+        * queue_wait_time: the total time between the submission of the
+          calls and the start of their execution, in seconds;
+        * run_time: the total execution time of the calls, in seconds;
+        * average_queue_wait_time and average_run_time.
+        """
+        stats = {'threads': len(self._threads)}
+        if isinstance(self._work_queue, _WorkStealingQueue):
+            stats.update(self._work_queue.stats())
+        return stats
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
@@ -231,6 +514,6 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             # _work_queue.get(block=True) from permanently blocking.
             self._work_queue.put(None)
         if wait:
-            for t in self._threads:
+            for t in list(self._threads) + list(self._retired_threads):
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
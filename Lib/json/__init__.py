@@ -97,7 +97,7 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads', 'AttrDict',
+    'dump', 'dumps', 'load', 'loads', 'iterload', 'iterparse', 'AttrDict',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
@@ -166,18 +166,22 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    if isinstance(encoder, JSONEncoder):
+        # The output is buffered and passed to fp.write() in large blocks
+        encoder._dump(obj, fp.write)
+    else:
+        # could accelerate with writelines in some versions of Python, at
+        # a debuggability cost
+        for chunk in encoder.iterencode(obj):
+            fp.write(chunk)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -358,6 +362,105 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
 
+# Size of the chunks read by iterload() and iterparse()
+_CHUNK_SIZE = 64 * 1024
+
+def _read_chunks(fp, chunk_size):
+    # Generate the contents of fp as str chunks, decoding binary files
+    # like loads() decodes bytes.
+    data = fp.read(chunk_size)
+    if isinstance(data, str):
+        if data.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                                  data, 0)
+        while data:
+            yield data
+            data = fp.read(chunk_size)
+        return
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                        f'not {data.__class__.__name__}')
+    # detect_encoding() needs the first 4 bytes
+    while len(data) < 4:
+        more = fp.read(chunk_size)
+        if not more:
+            break
+        data += more
+    decoder = codecs.getincrementaldecoder(detect_encoding(data))('surrogatepass')
+    while data:
+        yield decoder.decode(data)
+        data = fp.read(chunk_size)
+    yield decoder.decode(b'', True)
+
+
+def iterload(fp, *, lines=False, chunk_size=_CHUNK_SIZE, cls=None,
+        object_hook=None, parse_float=None, parse_int=None,
+        parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON document) and return an iterator over its
+    values, reading ``fp`` in chunks of ``chunk_size`` characters or bytes.
+
+    If ``lines`` is false, the document must be a JSON array: iterate
+    over its items.  If ``lines`` is true, the document is a sequence of
+    JSON values separated by whitespace, like JSON Lines: iterate over the
+    values.  Only the current value is decoded in memory, not the whole
+    document.
+
+    The other arguments have the same meaning as in ``load()``.  When a
+    value spans several chunks, ``object_hook`` and ``object_pairs_hook``
+    can be called more than once for the objects it contains.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw).iterdecode(_read_chunks(fp, chunk_size), lines=lines)
+
+
+def iterparse(fp, *, chunk_size=_CHUNK_SIZE, cls=None, parse_float=None,
+        parse_int=None, parse_constant=None, **kw):
+    """Incrementally parse ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON document), reading it in chunks of
+    ``chunk_size`` characters or bytes, and return an iterator over
+    ``(event, value)`` pairs.
+
+    The events are ``'start_map'``, ``'key'``, ``'end_map'``,
+    ``'start_array'``, ``'end_array'`` and ``'value'``.  The value is
+    the key of ``'key'`` events, the decoded string, number or constant of
+    ``'value'`` events, and ``None`` for the other events::
+
+        >>> from io import StringIO
+        >>> for event, value in iterparse(StringIO('{"a": [1, null]}')):
+        ...     print(event, value)
+        start_map None
+        key a
+        start_array None
+        value 1
+        value None
+        end_array None
+        end_map None
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw).iterparse(_read_chunks(fp, chunk_size))
+
+
 class AttrDict(dict):
     """Dict like object that supports attribute style dotted access.
 
@@ -131,10 +131,12 @@ def py_scanstring(s, end, strict=True,
 
 WHITESPACE = re.compile(r'[ \t\n\r]*', FLAGS)
 WHITESPACE_STR = ' \t\n\r'
+ARRAY_DELIMITER = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*', FLAGS)
 
 
 def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
-               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR, *,
+               object_kwargs_hook=None):
     s, end = s_and_end
     pairs = []
     pairs_append = pairs.append
@@ -155,6 +157,8 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
             if object_pairs_hook is not None:
                 result = object_pairs_hook(pairs)
                 return result, end + 1
+            if object_kwargs_hook is not None:
+                return object_kwargs_hook(), end + 1
             pairs = {}
             if object_hook is not None:
                 pairs = object_hook(pairs)
@@ -210,6 +214,8 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
         result = object_pairs_hook(pairs)
         return result, end
     pairs = dict(pairs)
+    if object_kwargs_hook is not None:
+        return object_kwargs_hook(**pairs), end
     if object_hook is not None:
         pairs = object_hook(pairs)
     return pairs, end
@@ -283,7 +289,8 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, object_kwargs_hook=None,
+            key_cache_size=0):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -296,6 +303,13 @@ def __init__(self, *, object_hook=None, parse_float=None,
         If ``object_hook`` is also defined, the ``object_pairs_hook`` takes
         priority.
 
+        ``object_kwargs_hook``, if specified, will be called with the
+        members of every JSON object decoded as keyword arguments, and its
+        return value will be used instead of the ``dict``.  This allows
+        constructing a dataclass or named tuple directly, without creating
+        an intermediate ``dict``.  It takes priority over ``object_hook``,
+        but not over ``object_pairs_hook``.
+
         ``parse_float``, if specified, will be called with the string
         of every JSON float to be decoded. By default this is equivalent to
         float(num_str). This can be used to use another datatype or parser
@@ -315,13 +329,23 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        Object keys are shared between all objects of a document.  If
+        ``key_cache_size`` is positive, they are also kept for later calls
+        of ``decode()`` until more than ``key_cache_size`` distinct keys
+        are cached, which saves memory and time when decoding many
+        documents with the same keys.
         """
+        if key_cache_size < 0:
+            raise ValueError("key_cache_size must be non-negative")
         self.object_hook = object_hook
         self.parse_float = parse_float or float
         self.parse_int = parse_int or int
         self.parse_constant = parse_constant or _CONSTANTS.__getitem__
         self.strict = strict
         self.object_pairs_hook = object_pairs_hook
+        self.object_kwargs_hook = object_kwargs_hook
+        self.key_cache_size = key_cache_size
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
@@ -354,3 +378,254 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iterdecode(self, chunks, lines=False,
+                   _w=WHITESPACE.match, _d=ARRAY_DELIMITER.match):
+        """Decode a JSON document read from ``chunks`` (an iterable of
+        ``str`` instances) incrementally, and generate its values.
+
+        If ``lines`` is false, the document must be an array: generate
+        its items.  If ``lines`` is true, the document is a sequence of
+        JSON values separated by whitespace, like JSON Lines: generate
+        the values.
+
+        Only the current item and the unparsed part of the current chunk
+        are kept in memory.
+
+        """
+        stream = _Stream(chunks)
+        scan = self.scan_once
+        # The fast paths below parse the values found in the buffer.  A value
+        # followed by a delimiter in the buffer cannot continue in the next
+        # chunk.  The other cases, including errors, go through the slow
+        # paths, which scan the value again.
+        if lines:
+            while True:
+                buf, pos = stream.buf, stream.pos
+                try:
+                    value, end = scan(buf, pos)
+                except (StopIteration, JSONDecodeError):
+                    pass
+                else:
+                    next_pos = _w(buf, end).end()
+                    if end < next_pos < len(buf):
+                        stream.pos = next_pos
+                        yield value
+                        continue
+                if not stream.skip():
+                    return
+                yield stream.scan(scan)
+                stream.skip()
+        if stream.skip() != '[':
+            raise stream.error("Expecting array", stream.pos)
+        stream.pos += 1
+        if stream.skip() == ']':
+            stream.pos += 1
+        else:
+            while True:
+                buf, pos = stream.buf, stream.pos
+                try:
+                    value, end = scan(buf, pos)
+                except (StopIteration, JSONDecodeError):
+                    pass
+                else:
+                    m = _d(buf, end)
+                    if m is not None:
+                        stream.pos = m.end()
+                        yield value
+                        if m.group(1) == ']':
+                            break
+                        continue
+                stream.skip()
+                yield stream.scan(scan)
+                c = stream.skip()
+                stream.pos += 1
+                if c == ']':
+                    break
+                if c != ',':
+                    raise stream.error("Expecting ',' delimiter",
+                                       stream.pos - 1)
+                stream.skip()
+        if stream.skip():
+            raise stream.error("Extra data", stream.pos)
+
+    def iterparse(self, chunks):
+        """Parse a JSON document read from ``chunks`` (an iterable of
+        ``str`` instances) incrementally, and generate ``(event, value)``
+        pairs.
+
+        The events are ``'start_map'``, ``'key'``, ``'end_map'``,
+        ``'start_array'``, ``'end_array'`` and ``'value'``.  The value
+        is the key of ``'key'`` events, the decoded string, number or
+        constant of ``'value'`` events, and ``None`` for the other
+        events.  Objects and arrays are not built, so ``object_hook``
+        and ``object_pairs_hook`` are not used.
+
+        """
+        stream = _Stream(chunks)
+        scan_value = self.scan_once
+        parse_string = self.parse_string
+        strict = self.strict
+        def scan_key(s, idx):
+            return parse_string(s, idx + 1, strict)
+        def parse_key():
+            if stream.skip() != '"':
+                raise stream.error(
+                    "Expecting property name enclosed in double quotes",
+                    stream.pos)
+            key = stream.scan(scan_key)
+            if stream.skip() != ':':
+                raise stream.error("Expecting ':' delimiter", stream.pos)
+            stream.pos += 1
+            return key
+
+        # Closing characters of the open objects and arrays
+        stack = []
+        while True:
+            c = stream.skip()
+            if c == '{':
+                stream.pos += 1
+                yield 'start_map', None
+                if stream.skip() != '}':
+                    stack.append('}')
+                    yield 'key', parse_key()
+                    continue
+                stream.pos += 1
+                yield 'end_map', None
+            elif c == '[':
+                stream.pos += 1
+                yield 'start_array', None
+                if stream.skip() != ']':
+                    stack.append(']')
+                    continue
+                stream.pos += 1
+                yield 'end_array', None
+            else:
+                yield 'value', stream.scan(scan_value)
+            # A value was parsed: close the objects and arrays which end
+            # after it, up to the next item.
+            while stack:
+                c = stream.skip()
+                stream.pos += 1
+                if c == ',':
+                    if stack[-1] == '}':
+                        yield 'key', parse_key()
+                    break
+                if c != stack[-1]:
+                    raise stream.error("Expecting ',' delimiter",
+                                       stream.pos - 1)
+                stack.pop()
+                yield ('end_map' if c == '}' else 'end_array'), None
+            else:
+                if stream.skip():
+                    raise stream.error("Extra data", stream.pos)
+                return
+
+
+# A scan which fails less than this number of characters before the end of
+# the buffer, or which ends there with a number, can be caused by a token
+# cut by the end of a chunk: "-Infinity" is the longest token which can be
+# cut before its last character.
+_LOOKAHEAD = len('-Infinity')
+
+class _Stream(object):
+    """Buffer over the chunks of a JSON document, for the incremental
+    decoding methods.
+
+    ``buf`` holds the part of the document which is not parsed yet, from
+    ``pos``.  Data is only read when needed to parse the next token.
+    """
+
+    def __init__(self, chunks):
+        self._next_chunk = iter(chunks).__next__
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        # Position, line and column of buf[0] in the document
+        self._offset = 0
+        self._lineno = 1
+        self._colno = 1
+
+    def fill(self, size=1):
+        """Drop the parsed part of the buffer and read at least ``size``
+        characters.  Return false if there is no more data.
+        """
+        if self.eof:
+            return False
+        buf, pos = self.buf, self.pos
+        if pos:
+            newlines = buf.count('\n', 0, pos)
+            if newlines:
+                self._lineno += newlines
+                self._colno = pos - buf.rfind('\n', 0, pos)
+            else:
+                self._colno += pos
+            self._offset += pos
+        chunks = [buf[pos:]]
+        n = 0
+        while n < size:
+            try:
+                chunk = self._next_chunk()
+            except StopIteration:
+                self.eof = True
+                break
+            chunks.append(chunk)
+            n += len(chunk)
+        self.buf = ''.join(chunks)
+        self.pos = 0
+        return n > 0
+
+    def skip(self, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+        """Skip whitespace and return the next character, or an empty
+        string at the end of the document.
+        """
+        buf, pos = self.buf, self.pos
+        if pos < len(buf) and buf[pos] not in _ws:
+            return buf[pos]
+        while True:
+            self.pos = _w(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def scan(self, scan):
+        """Return the value parsed by ``scan(buf, pos)`` and move past it.
+
+        If the value can continue in the next chunk, or if the scan fails
+        near the end of the buffer, read more data and scan again.  The
+        size of the buffer is at least doubled each time, so that scanning
+        a value which spans many chunks takes linear time.
+        """
+        while True:
+            buf, pos = self.buf, self.pos
+            try:
+                value, end = scan(buf, pos)
+            except StopIteration as err:
+                msg, errpos = "Expecting value", err.value
+            except JSONDecodeError as err:
+                msg, errpos = err.msg, err.pos
+            else:
+                if (self.eof or len(buf) - end >= _LOOKAHEAD
+                        or buf[pos] not in '-0123456789'):
+                    self.pos = end
+                    return value
+                self.fill(len(buf) - pos)
+                continue
+            if (self.eof or len(buf) - errpos >= _LOOKAHEAD and
+                    not msg.startswith('Unterminated string')):
+                raise self.error(msg, errpos)
+            self.fill(len(buf) - pos)
+
+    def error(self, msg, pos):
+        """Return a JSONDecodeError for the position ``pos`` of the buffer,
+        with the position, line and column in the whole document.
+        """
+        err = JSONDecodeError(msg, self.buf, pos)
+        if err.lineno == 1:
+            err.colno += self._colno - 1
+        err.lineno += self._lineno - 1
+        err.pos += self._offset
+        err.args = ('%s: line %d column %d (char %d)' %
+                    (msg, err.lineno, err.colno, err.pos),)
+        return err
@@ -33,6 +33,8 @@
 del i
 
 INFINITY = float('inf')
+# Size of the blocks passed to the write() method of files by dump()
+_BUFSIZE = 64 * 1024
 
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
@@ -244,12 +246,8 @@ def floatstr(o, allow_nan=self.allow_nan,
             return text
 
 
-        if (_one_shot and c_make_encoder is not None
-                and self.indent is None):
-            _iterencode = c_make_encoder(
-                markers, self.default, _encoder, self.indent,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+        if (_one_shot and c_make_encoder is not None):
+            _iterencode = self._make_c_encoder(markers, _encoder)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, self.indent, floatstr,
@@ -257,6 +255,43 @@ def floatstr(o, allow_nan=self.allow_nan,
                 self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def _make_c_encoder(self, markers, _encoder):
+        indent = self.indent
+        if indent is not None and not isinstance(indent, str):
+            indent = ' ' * indent
+        return c_make_encoder(
+            markers, self.default, _encoder, indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+
+    def _dump(self, o, write, bufsize=_BUFSIZE):
+        """Encode the given object and pass its JSON representation to
+        the write() callable in blocks of about bufsize characters.
+
+        The C accelerator writes directly into its output buffer, unless
+        a subclass overrides iterencode().
+        """
+        if (c_make_encoder is not None
+                and type(self).iterencode is JSONEncoder.iterencode):
+            markers = {} if self.check_circular else None
+            if self.ensure_ascii:
+                _encoder = encode_basestring_ascii
+            else:
+                _encoder = encode_basestring
+            self._make_c_encoder(markers, _encoder).dump(o, write, 0, bufsize)
+            return
+        buf = []
+        size = 0
+        for chunk in self.iterencode(o):
+            buf.append(chunk)
+            size += len(chunk)
+            if size >= bufsize:
+                write(''.join(buf))
+                buf.clear()
+                size = 0
+        if buf:
+            write(''.join(buf))
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
         ## HACK: hand-optimized bytecode; turn globals into locals
@@ -24,6 +24,14 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    # Optional attributes, contexts written for older versions may not
+    # have them
+    object_kwargs_hook = getattr(context, 'object_kwargs_hook', None)
+    key_cache_size = getattr(context, 'key_cache_size', 0)
+    if object_kwargs_hook is not None:
+        _parse_object = parse_object
+        def parse_object(*args):
+            return _parse_object(*args, object_kwargs_hook=object_kwargs_hook)
 
     def _scan_once(string, idx):
         try:
@@ -66,7 +74,8 @@ def scan_once(string, idx):
         try:
             return _scan_once(string, idx)
         finally:
-            memo.clear()
+            if len(memo) > key_cache_size:
+                memo.clear()
 
     return scan_once
 
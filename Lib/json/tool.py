@@ -11,10 +11,59 @@
 
 """
 import argparse
+import collections
 import json
+import os
 import sys
 from pathlib import Path
 
+# Size hint in characters of the blocks of lines processed by workers
+_CHUNK_SIZE = 1 << 20
+
+
+def _process_lines(lines, dump_args):
+    """Reformat a list of JSON Lines in a worker process.
+
+    Return the output and the error message for the first invalid line,
+    or None if all lines are valid.
+    """
+    output = []
+    try:
+        for line in lines:
+            output.append(json.dumps(json.loads(line), **dump_args))
+            output.append('\n')
+    except ValueError as e:
+        return ''.join(output), str(e)
+    return ''.join(output), None
+
+
+def _process_lines_parallel(infile, outfile, dump_args, jobs):
+    """Reformat JSON Lines from infile in worker processes.
+
+    The input is split into line-aligned blocks, and the output of every
+    block is written in the input order.  A limited number of blocks is
+    read ahead, so the whole input is never kept in memory.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+
+        def write_next():
+            output, error = pending.popleft().result()
+            outfile.write(output)
+            if error is not None:
+                executor.shutdown(cancel_futures=True)
+                raise ValueError(error)
+
+        for lines in iter(lambda: infile.readlines(_CHUNK_SIZE), []):
+            pending.append(executor.submit(_process_lines, lines, dump_args))
+            if len(pending) > 2 * workers:
+                write_next()
+        while pending:
+            write_next()
+
 
 def main():
     prog = 'python -m json.tool'
@@ -36,6 +85,9 @@ def main():
     parser.add_argument('--json-lines', action='store_true', default=False,
                         help='parse input using the JSON Lines format. '
                         'Use with --no-indent or --compact to produce valid JSON Lines output.')
+    parser.add_argument('-j', '--jobs', default=1, type=int,
+                        help='process JSON Lines input in this number of '
+                        'worker processes; 0 uses all CPUs (default: 1)')
     group = parser.add_mutually_exclusive_group()
     group.add_argument('--indent', default=4, type=int,
                        help='separate items with newlines and use this number '
@@ -49,6 +101,10 @@ def main():
     group.add_argument('--compact', action='store_true',
                        help='suppress all whitespace separation (most compact)')
     options = parser.parse_args()
+    if options.jobs < 0:
+        parser.error('--jobs must be non-negative')
+    if options.jobs != 1 and not options.json_lines:
+        parser.error('--jobs requires --json-lines')
 
     dump_args = {
         'sort_keys': options.sort_keys,
@@ -71,9 +127,13 @@ def main():
             else:
                 out = options.outfile.open('w', encoding='utf-8')
             with out as outfile:
-                for obj in objs:
-                    json.dump(obj, outfile, **dump_args)
-                    outfile.write('\n')
+                if options.jobs != 1:
+                    _process_lines_parallel(infile, outfile, dump_args,
+                                            options.jobs)
+                else:
+                    for obj in objs:
+                        json.dump(obj, outfile, **dump_args)
+                        outfile.write('\n')
         except ValueError as e:
             raise SystemExit(e)
 
@@ -112,12 +112,17 @@ def SimpleQueue(self):
         from .queues import SimpleQueue
         return SimpleQueue(ctx=self.get_context())
 
+    def RingQueue(self, maxsize=1024, slot_size=4096):
+        '''Returns a queue object using a ring buffer in shared memory'''
+        from .queues import RingQueue
+        return RingQueue(maxsize, slot_size, ctx=self.get_context())
+
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, *, task_affinity=False):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(), task_affinity=task_affinity)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
@@ -177,12 +182,13 @@ def set_executable(self, executable):
         from .spawn import set_executable
         set_executable(executable)
 
-    def set_forkserver_preload(self, module_names):
+    def set_forkserver_preload(self, module_names, *, warmup=(),
+                               freeze=False):
         '''Set list of module names to try to load in forkserver process.
         This is really just a hint.
         '''
         from .forkserver import set_forkserver_preload
-        set_forkserver_preload(module_names)
+        set_forkserver_preload(module_names, warmup=warmup, freeze=freeze)
 
     def get_context(self, method=None):
         if method is None:
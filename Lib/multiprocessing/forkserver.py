@@ -1,4 +1,5 @@
 import errno
+import gc
 import os
 import selectors
 import signal
@@ -38,6 +39,8 @@ def __init__(self):
         self._inherited_fds = None
         self._lock = threading.Lock()
         self._preload_modules = ['__main__']
+        self._warmup = []
+        self._freeze = False
 
     def _stop(self):
         # Method used by unit tests to stop the server
@@ -59,11 +62,24 @@ def _stop_unlocked(self):
             os.unlink(self._forkserver_address)
         self._forkserver_address = None
 
-    def set_forkserver_preload(self, modules_names):
-        '''Set list of module names to try to load in forkserver process.'''
-        if not all(type(mod) is str for mod in self._preload_modules):
+    def set_forkserver_preload(self, modules_names, *, warmup=(),
+                               freeze=False):
+        '''Set list of module names to try to load in forkserver process.
+
+        warmup is a list of 'module:function' names of functions called
+        without arguments once the modules are loaded.  If freeze is true,
+        the objects of the forkserver process are moved to the permanent
+        generation of the garbage collector before forking.
+        '''
+        if not all(type(mod) is str for mod in modules_names):
             raise TypeError('module_names must be a list of strings')
+        warmup = list(warmup)
+        if not all(type(name) is str and ':' in name for name in warmup):
+            raise TypeError("warmup must be a list of 'module:function' "
+                            "strings")
         self._preload_modules = modules_names
+        self._warmup = warmup
+        self._freeze = bool(freeze)
 
     def get_inherited_fds(self):
         '''Return list of fds inherited from parent process.
@@ -126,12 +142,16 @@ def ensure_running(self):
             cmd = ('from multiprocessing.forkserver import main; ' +
                    'main(%d, %d, %r, **%r)')
 
-            if self._preload_modules:
+            if self._preload_modules or self._warmup:
                 desired_keys = {'main_path', 'sys_path'}
                 data = spawn.get_preparation_data('ignore')
                 data = {x: y for x, y in data.items() if x in desired_keys}
             else:
                 data = {}
+            if self._warmup:
+                data['warmup'] = self._warmup
+            if self._freeze:
+                data['freeze'] = True
 
             with socket.socket(socket.AF_UNIX) as listener:
                 address = connection.arbitrary_address('AF_UNIX')
@@ -164,7 +184,8 @@ def ensure_running(self):
 #
 #
 
-def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
+def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
+         warmup=(), freeze=False):
     '''Run forkserver.'''
     if preload:
         if '__main__' in preload and main_path is not None:
@@ -178,6 +199,13 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
                 __import__(modname)
             except ImportError:
                 pass
+    for name in warmup:
+        _call_warmup(name)
+    if freeze:
+        # Objects created so far are shared with the children: keep the
+        # garbage collector of the children from writing to their pages.
+        gc.collect()
+        gc.freeze()
 
     util._close_stdin()
 
@@ -296,6 +324,20 @@ def sigchld_handler(*_unused):
                     raise
 
 
+def _call_warmup(name):
+    # Errors are reported but do not prevent the server from starting.
+    modname, _, qualname = name.partition(':')
+    try:
+        obj = __import__(modname, fromlist=['*'])
+        for attr in qualname.split('.'):
+            obj = getattr(obj, attr)
+        obj()
+    except Exception:
+        sys.stderr.write('forkserver: error in warmup function %r\n' % name)
+        sys.excepthook(*sys.exc_info())
+        sys.stderr.flush()
+
+
 def _serve_one(child_r, fds, unused_fds, handlers):
     # close unnecessary stuff and reset signal handlers
     signal.set_wakeup_fd(-1)
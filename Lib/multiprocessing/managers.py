@@ -1378,3 +1378,27 @@ def ShareableList(self, sequence):
                     sl.shm.unlink()
                     raise e
             return sl
+
+        def SharedArray(self, typecode, size_or_initializer):
+            """Returns a new SharedArray instance of values of the given
+            type, to be tracked by the manager."""
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sa = shared_memory.SharedArray(typecode, size_or_initializer)
+                try:
+                    dispatch(conn, None, 'track_segment', (sa.shm.name,))
+                except BaseException as e:
+                    sa.shm.unlink()
+                    raise e
+            return sa
+
+        def SharedRecords(self, fields, size_or_initializer):
+            """Returns a new SharedRecords instance with the given fields,
+            to be tracked by the manager."""
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sr = shared_memory.SharedRecords(fields, size_or_initializer)
+                try:
+                    dispatch(conn, None, 'track_segment', (sr.shm.name,))
+                except BaseException as e:
+                    sr.shm.unlink()
+                    raise e
+            return sr
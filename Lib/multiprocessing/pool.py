@@ -44,12 +44,39 @@
 
 job_counter = itertools.count()
 
+# Number of outstanding tasks by which the worker owning an affinity key
+# may exceed the least loaded worker before tasks with the key are sent
+# to the least loaded worker instead
+_AFFINITY_SLACK = 2
+
 def mapstar(args):
     return list(map(*args))
 
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+# Fields of /proc/<pid>/smaps_rollup, in kB
+_SMAPS_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty',
+                 'Private_Clean', 'Private_Dirty')
+
+_SMAPS_ROLLUP = '/proc/{}/smaps_rollup'
+
+def _read_memory_info(pid):
+    fields = dict.fromkeys(_SMAPS_FIELDS, 0)
+    with open(_SMAPS_ROLLUP.format(pid), 'rb') as f:
+        for line in f:
+            key, _, value = line.partition(b':')
+            key = key.decode('ascii', 'replace')
+            if key in fields:
+                fields[key] = int(value.split()[0]) * 1024
+    return {
+        'rss': fields['Rss'],
+        'pss': fields['Pss'],
+        # unique set size: the memory freed if the process exits
+        'uss': fields['Private_Clean'] + fields['Private_Dirty'],
+        'shared': fields['Shared_Clean'] + fields['Shared_Dirty'],
+    }
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -143,6 +170,59 @@ def _helper_reraises_exception(ex):
     'Pickle-able helper function for use by _guarded_task_generation.'
     raise ex
 
+#
+# Class dispatching tasks to the queues of the workers of a pool
+#
+
+class _AffinityDispatcher(object):
+    '''
+    Sends tasks with an affinity key to the worker owning the key, unless it
+    is overloaded, and other tasks to the least loaded worker
+    '''
+
+    def __init__(self, queues, get):
+        self._queues = queues
+        self._get = get
+        self._loads = [0] * len(queues)
+        # maps (job, i) of outstanding tasks to the index of their worker
+        self._assigned = {}
+        self._lock = threading.Lock()
+        self._sentinels = itertools.cycle(range(len(queues)))
+
+    def put(self, task):
+        if task is None:
+            # one sentinel per worker
+            self._queues[next(self._sentinels)]._writer.send(None)
+            return
+        job, i = task[:2]
+        with self._lock:
+            loads = self._loads
+            index = least = loads.index(min(loads))
+            if len(task) > 5:
+                owner = hash(task[5]) % len(loads)
+                if loads[owner] <= loads[least] + _AFFINITY_SLACK:
+                    index = owner
+                task = task[:5]
+            loads[index] += 1
+            self._assigned[job, i] = index
+        try:
+            self._queues[index]._writer.send(task)
+        except BaseException:
+            self.task_done(job, i)
+            raise
+
+    def get(self):
+        task = self._get()
+        if task is not None:
+            self.task_done(task[0], task[1])
+        return task
+
+    def task_done(self, job, i):
+        with self._lock:
+            index = self._assigned.pop((job, i), None)
+            if index is not None:
+                self._loads[index] -= 1
+
 #
 # Class representing a process pool
 #
@@ -181,11 +261,12 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *, task_affinity=False):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
         self._state = INIT
+        self._worker_queues = None
 
         self._ctx = context or get_context()
         self._setup_queues()
@@ -211,6 +292,15 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             raise TypeError('initializer must be a callable')
 
         self._processes = processes
+        if task_affinity:
+            # Each worker has its own queue, so that tasks can be sent to a
+            # given worker.
+            self._worker_queues = [self._ctx.SimpleQueue()
+                                   for i in range(processes)]
+            dispatcher = _AffinityDispatcher(self._worker_queues,
+                                             self._quick_get)
+            self._quick_put = dispatcher.put
+            self._quick_get = dispatcher.get
         try:
             self._repopulate_pool()
         except Exception:
@@ -228,7 +318,8 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             args=(self._cache, self._taskqueue, self._ctx, self.Process,
                   self._processes, self._pool, self._inqueue, self._outqueue,
                   self._initializer, self._initargs, self._maxtasksperchild,
-                  self._wrap_exception, sentinels, self._change_notifier)
+                  self._wrap_exception, sentinels, self._change_notifier,
+                  self._worker_queues)
             )
         self._worker_handler.daemon = True
         self._worker_handler._state = RUN
@@ -256,7 +347,7 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             self, self._terminate_pool,
             args=(self._taskqueue, self._inqueue, self._outqueue, self._pool,
                   self._change_notifier, self._worker_handler, self._task_handler,
-                  self._result_handler, self._cache),
+                  self._result_handler, self._cache, self._worker_queues),
             exitpriority=15
             )
         self._state = RUN
@@ -309,21 +400,31 @@ def _repopulate_pool(self):
                                             self._outqueue, self._initializer,
                                             self._initargs,
                                             self._maxtasksperchild,
-                                            self._wrap_exception)
+                                            self._wrap_exception,
+                                            self._worker_queues)
 
     @staticmethod
     def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                                 outqueue, initializer, initargs,
-                                maxtasksperchild, wrap_exception):
+                                maxtasksperchild, wrap_exception,
+                                worker_queues=None):
         """Bring the number of pool processes up to the specified number,
         for use after reaping workers which have exited.
         """
-        for i in range(processes - len(pool)):
+        if worker_queues is None:
+            slots = [None] * (processes - len(pool))
+        else:
+            # A new worker takes over the queue of the worker it replaces.
+            used = {w._pool_slot for w in pool}
+            slots = [i for i in range(processes) if i not in used]
+        for slot in slots:
             w = Process(ctx, target=worker,
-                        args=(inqueue, outqueue,
+                        args=(inqueue if slot is None else worker_queues[slot],
+                              outqueue,
                               initializer,
                               initargs, maxtasksperchild,
                               wrap_exception))
+            w._pool_slot = slot
             w.name = w.name.replace('Process', 'PoolWorker')
             w.daemon = True
             w.start()
@@ -333,14 +434,14 @@ def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
     @staticmethod
     def _maintain_pool(ctx, Process, processes, pool, inqueue, outqueue,
                        initializer, initargs, maxtasksperchild,
-                       wrap_exception):
+                       wrap_exception, worker_queues=None):
         """Clean up any exited workers and start replacements for them.
         """
         if Pool._join_exited_workers(pool):
             Pool._repopulate_pool_static(ctx, Process, processes, pool,
                                          inqueue, outqueue, initializer,
                                          initargs, maxtasksperchild,
-                                         wrap_exception)
+                                         wrap_exception, worker_queues)
 
     def _setup_queues(self):
         self._inqueue = self._ctx.SimpleQueue()
@@ -382,27 +483,50 @@ def starmap_async(self, func, iterable, chunksize=None, callback=None,
         return self._map_async(func, iterable, starmapstar, chunksize,
                                callback, error_callback)
 
-    def _guarded_task_generation(self, result_job, func, iterable):
+    def _guarded_task_generation(self, result_job, func, iterable,
+                                 affinity_key=None):
         '''Provides a generator of tasks for imap and imap_unordered with
         appropriate handling for iterables which throw exceptions during
         iteration.'''
         try:
             i = -1
             for i, x in enumerate(iterable):
-                yield (result_job, i, func, (x,), {})
+                if affinity_key is None:
+                    yield (result_job, i, func, (x,), {})
+                    continue
+                try:
+                    key = affinity_key(x)
+                except Exception as e:
+                    yield (result_job, i, _helper_reraises_exception, (e,), {})
+                    return
+                yield (result_job, i, func, (x,), {}, key)
         except Exception as e:
             yield (result_job, i+1, _helper_reraises_exception, (e,), {})
 
-    def imap(self, func, iterable, chunksize=1):
+    def _check_affinity(self, affinity):
+        if affinity is not None and self._worker_queues is None:
+            raise ValueError(
+                "affinity requires a pool created with task_affinity=True")
+
+    @staticmethod
+    def _chunk_affinity_key(affinity_key):
+        # The key of a chunk of tasks is the key of its first element.
+        if affinity_key is None:
+            return None
+        return lambda task_batch: affinity_key(task_batch[1][0])
+
+    def imap(self, func, iterable, chunksize=1, *, affinity_key=None):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
         '''
         self._check_running()
+        self._check_affinity(affinity_key)
         if chunksize == 1:
             result = IMapIterator(self)
             self._taskqueue.put(
                 (
-                    self._guarded_task_generation(result._job, func, iterable),
+                    self._guarded_task_generation(result._job, func, iterable,
+                                                  affinity_key),
                     result._set_length
                 ))
             return result
@@ -415,23 +539,26 @@ def imap(self, func, iterable, chunksize=1):
             result = IMapIterator(self)
             self._taskqueue.put(
                 (
-                    self._guarded_task_generation(result._job,
-                                                  mapstar,
-                                                  task_batches),
+                    self._guarded_task_generation(
+                        result._job, mapstar, task_batches,
+                        self._chunk_affinity_key(affinity_key)),
                     result._set_length
                 ))
             return (item for chunk in result for item in chunk)
 
-    def imap_unordered(self, func, iterable, chunksize=1):
+    def imap_unordered(self, func, iterable, chunksize=1, *,
+                       affinity_key=None):
         '''
         Like `imap()` method but ordering of results is arbitrary.
         '''
         self._check_running()
+        self._check_affinity(affinity_key)
         if chunksize == 1:
             result = IMapUnorderedIterator(self)
             self._taskqueue.put(
                 (
-                    self._guarded_task_generation(result._job, func, iterable),
+                    self._guarded_task_generation(result._job, func, iterable,
+                                                  affinity_key),
                     result._set_length
                 ))
             return result
@@ -443,21 +570,25 @@ def imap_unordered(self, func, iterable, chunksize=1):
             result = IMapUnorderedIterator(self)
             self._taskqueue.put(
                 (
-                    self._guarded_task_generation(result._job,
-                                                  mapstar,
-                                                  task_batches),
+                    self._guarded_task_generation(
+                        result._job, mapstar, task_batches,
+                        self._chunk_affinity_key(affinity_key)),
                     result._set_length
                 ))
             return (item for chunk in result for item in chunk)
 
     def apply_async(self, func, args=(), kwds={}, callback=None,
-            error_callback=None):
+            error_callback=None, *, affinity=None):
         '''
         Asynchronous version of `apply()` method.
         '''
         self._check_running()
+        self._check_affinity(affinity)
         result = ApplyResult(self, callback, error_callback)
-        self._taskqueue.put(([(result._job, 0, func, args, kwds)], None))
+        task = (result._job, 0, func, args, kwds)
+        if affinity is not None:
+            task += (affinity,)
+        self._taskqueue.put(([task], None))
         return result
 
     def map_async(self, func, iterable, chunksize=None, callback=None,
@@ -507,7 +638,7 @@ def _wait_for_updates(sentinels, change_notifier, timeout=None):
     def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
                         pool, inqueue, outqueue, initializer, initargs,
                         maxtasksperchild, wrap_exception, sentinels,
-                        change_notifier):
+                        change_notifier, worker_queues=None):
         thread = threading.current_thread()
 
         # Keep maintaining workers until the cache gets drained, unless the pool
@@ -515,7 +646,8 @@ def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
         while thread._state == RUN or (cache and thread._state != TERMINATE):
             cls._maintain_pool(ctx, Process, processes, pool, inqueue,
                                outqueue, initializer, initargs,
-                               maxtasksperchild, wrap_exception)
+                               maxtasksperchild, wrap_exception,
+                               worker_queues)
 
             current_sentinels = [*cls._get_worker_sentinels(pool), *sentinels]
 
@@ -644,6 +776,28 @@ def __reduce__(self):
               'pool objects cannot be passed between processes or pickled'
               )
 
+    def memory_info(self):
+        '''
+        Return a dict mapping the pid of each worker process to its memory
+        usage, only available on Linux >= 4.14
+        '''
+        self._check_running()
+        if not os.path.exists(_SMAPS_ROLLUP.format('self')):
+            raise NotImplementedError(
+                'memory_info() requires /proc/<pid>/smaps_rollup')
+        info = {}
+        for worker in list(self._pool):
+            # ThreadPool workers have no pid
+            pid = getattr(worker, 'pid', None)
+            if pid is None:
+                continue
+            try:
+                info[pid] = _read_memory_info(pid)
+            except (FileNotFoundError, ProcessLookupError):
+                # the worker exited meanwhile
+                pass
+        return info
+
     def close(self):
         util.debug('closing pool')
         if self._state == RUN:
@@ -679,7 +833,8 @@ def _help_stuff_finish(inqueue, task_handler, size):
 
     @classmethod
     def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
-                        worker_handler, task_handler, result_handler, cache):
+                        worker_handler, task_handler, result_handler, cache,
+                        worker_queues=None):
         # this is guaranteed to only be called once
         util.debug('finalizing pool')
 
@@ -693,6 +848,8 @@ def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
 
         util.debug('helping task handler/workers to finish')
         cls._help_stuff_finish(inqueue, task_handler, len(pool))
+        for worker_queue in worker_queues or ():
+            cls._help_stuff_finish(worker_queue, task_handler, len(pool))
 
         if (not result_handler.is_alive()) and (len(cache) != 0):
             raise AssertionError(
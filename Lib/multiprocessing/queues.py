@@ -7,12 +7,14 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
-__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue']
+__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue', 'RingQueue']
 
 import sys
 import os
 import threading
 import collections
+import io
+import struct
 import time
 import types
 import weakref
@@ -379,3 +381,194 @@ def put(self, obj):
                 self._writer.send_bytes(obj)
 
     __class_getitem__ = classmethod(types.GenericAlias)
+
+#
+# Queue type using a ring buffer of fixed-size slots in shared memory
+#
+
+# Number of items put and got so far
+_RING_PUT = struct.Struct('<Q')
+_RING_GOT = struct.Struct('<Q')
+_RING_HEADER_SIZE = _RING_PUT.size + _RING_GOT.size
+# Kind of the item and size of the data of a slot
+_SLOT_HEADER = struct.Struct('<BxxxI')
+_SLOT_PICKLE = 0
+_SLOT_BYTES = 1
+# Pickle data followed by its out-of-band buffers, see _pickle_items()
+_SLOT_PICKLE_BUFFERS = 2
+
+
+class RingQueue(object):
+    """Queue of a bounded number of items in shared memory.
+
+    Each item is copied into a slot of a ring buffer, whose size bounds
+    the size of the items.  The producers and the consumers never wait
+    on each other, except when the queue is full or empty.
+    """
+
+    def __init__(self, maxsize=1024, slot_size=4096, *, ctx):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(
+                f"slot_size must be greater than {_SLOT_HEADER.size}")
+        # Can raise ImportError on platforms without shared memory
+        from .shared_memory import SharedMemory
+        self._maxsize = maxsize
+        self._slot_size = slot_size
+        self._shm = SharedMemory(
+            create=True, size=_RING_HEADER_SIZE + maxsize * slot_size)
+        self._free = ctx.BoundedSemaphore(maxsize)
+        self._used = ctx.Semaphore(0)
+        self._put_lock = ctx.Lock()
+        self._get_lock = ctx.Lock()
+        self._opid = os.getpid()
+        self._reset()
+
+    def __getstate__(self):
+        context.assert_spawning(self)
+        return (self._shm.name, self._maxsize, self._slot_size, self._free,
+                self._used, self._put_lock, self._get_lock, self._opid)
+
+    def __setstate__(self, state):
+        from .shared_memory import SharedMemory
+        (name, self._maxsize, self._slot_size, self._free, self._used,
+         self._put_lock, self._get_lock, self._opid) = state
+        self._shm = SharedMemory(name)
+        self._reset()
+
+    def _reset(self):
+        self._closed = False
+        # Only the process which created the queue destroys the segment.
+        self._close = Finalize(
+            self, RingQueue._finalize_close,
+            [self._shm, os.getpid() == self._opid],
+            exitpriority=10)
+
+    @staticmethod
+    def _finalize_close(shm, unlink):
+        debug('closing ring queue segment %s', shm.name)
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+    def _slot_offset(self, count):
+        return _RING_HEADER_SIZE + (count % self._maxsize) * self._slot_size
+
+    def _serialize(self, obj):
+        # Return the kind of the slot and the list of its chunks of data.
+        if type(obj) is bytes:
+            return _SLOT_BYTES, [obj]
+        buffers = []
+
+        def buffer_callback(buffer):
+            try:
+                buffers.append(buffer.raw())
+            except BufferError:
+                # Not contiguous, serialize it in-band
+                return True
+            return False
+
+        file = io.BytesIO()
+        _ForkingPickler(file, 5, True, buffer_callback).dump(obj)
+        data = file.getbuffer()
+        if not buffers:
+            return _SLOT_PICKLE, [data]
+        sizes = [buffer.nbytes for buffer in buffers]
+        header = struct.pack(f'<II{len(sizes)}I', len(data), len(sizes),
+                             *sizes)
+        return _SLOT_PICKLE_BUFFERS, [header, data, *buffers]
+
+    def put(self, obj, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        # serialize the data before acquiring the semaphore
+        kind, chunks = self._serialize(obj)
+        size = sum(memoryview(chunk).nbytes for chunk in chunks)
+        if size > self._slot_size - _SLOT_HEADER.size:
+            raise ValueError(
+                f"object of {size} bytes too large for a slot of "
+                f"{self._slot_size} bytes")
+        if not self._free.acquire(block, timeout):
+            raise Full
+        with self._put_lock:
+            buf = self._shm.buf
+            count = _RING_PUT.unpack_from(buf, 0)[0]
+            offset = self._slot_offset(count)
+            _SLOT_HEADER.pack_into(buf, offset, kind, size)
+            offset += _SLOT_HEADER.size
+            for chunk in chunks:
+                n = memoryview(chunk).nbytes
+                buf[offset:offset + n] = chunk
+                offset += n
+            _RING_PUT.pack_into(buf, 0, count + 1)
+            del buf
+        self._used.release()
+
+    def get(self, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        if not self._used.acquire(block, timeout):
+            raise Empty
+        with self._get_lock:
+            buf = self._shm.buf
+            count = _RING_GOT.unpack_from(buf, _RING_PUT.size)[0]
+            offset = self._slot_offset(count)
+            kind, size = _SLOT_HEADER.unpack_from(buf, offset)
+            offset += _SLOT_HEADER.size
+            if kind == _SLOT_PICKLE_BUFFERS:
+                # Copy the buffers out of the slot only once.
+                data_size, nbuffers = struct.unpack_from('<II', buf, offset)
+                sizes = struct.unpack_from(f'<{nbuffers}I', buf, offset + 8)
+                offset += 8 + 4 * nbuffers
+                data = bytes(buf[offset:offset + data_size])
+                offset += data_size
+                buffers = []
+                for n in sizes:
+                    buffers.append(bytearray(buf[offset:offset + n]))
+                    offset += n
+            else:
+                data = bytes(buf[offset:offset + size])
+            _RING_GOT.pack_into(buf, _RING_PUT.size, count + 1)
+            del buf
+        self._free.release()
+        # unserialize the data after having released the lock
+        if kind == _SLOT_BYTES:
+            return data
+        if kind == _SLOT_PICKLE_BUFFERS:
+            return _ForkingPickler.loads(data, buffers=buffers)
+        return _ForkingPickler.loads(data)
+
+    def qsize(self):
+        # The result is approximate if other processes use the queue.
+        buf = self._shm.buf
+        put = _RING_PUT.unpack_from(buf, 0)[0]
+        got = _RING_GOT.unpack_from(buf, _RING_PUT.size)[0]
+        return put - got
+
+    def empty(self):
+        return self.qsize() <= 0
+
+    def full(self):
+        return self.qsize() >= self._maxsize
+
+    def get_nowait(self):
+        return self.get(False)
+
+    def put_nowait(self, obj):
+        return self.put(obj, False)
+
+    def close(self):
+        """Release the shared memory used by this process.
+
+        The segment is destroyed when it is closed by the process which
+        created the queue.  Processes already using the queue can still
+        use it.
+        """
+        self._closed = True
+        close = self._close
+        if close:
+            self._close = None
+            close()
+
+    __class_getitem__ = classmethod(types.GenericAlias)
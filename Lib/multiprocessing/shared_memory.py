@@ -5,10 +5,12 @@
 """
 
 
-__all__ = [ 'SharedMemory', 'ShareableList' ]
+__all__ = [ 'SharedMemory', 'ShareableList', 'SharedArray', 'SharedRecords' ]
 
 
 from functools import partial
+import array
+import collections
 import mmap
 import os
 import errno
@@ -532,3 +534,243 @@ def index(self, value):
             raise ValueError(f"{value!r} not in this container")
 
     __class_getitem__ = classmethod(types.GenericAlias)
+
+
+# Type codes of the array module usable in SharedArray and SharedRecords
+_typecodes = frozenset('bBhHiIlLqQfd')
+_header = struct.Struct("qq")
+
+
+def _align(size, alignment=8):
+    return -(-size // alignment) * alignment
+
+
+def _parse_fields(spec):
+    "Parses the 'name:typecode,...' field specification of a block."
+    return [tuple(field.split(":")) for field in spec.split(",")]
+
+
+def _format_fields(fields):
+    "Validates fields and returns its 'name:typecode,...' specification."
+    fields = [(name, typecode) for name, typecode in fields]
+    if not fields:
+        raise ValueError("at least one field is required")
+    for name, typecode in fields:
+        if typecode not in _typecodes:
+            raise ValueError(
+                f"typecode must be one of {''.join(sorted(_typecodes))!r}, "
+                f"not {typecode!r}")
+        if "," in name or ":" in name:
+            raise ValueError(f"invalid field name {name!r}")
+    return ",".join(f"{name}:{typecode}" for name, typecode in fields)
+
+
+def _column_offsets(fields, spec_size, length):
+    "Returns the offsets of the columns and the size of the block."
+    offset = _header.size + _align(spec_size)
+    offsets = []
+    for _, typecode in fields:
+        offsets.append(offset)
+        offset += _align(length * array.array(typecode).itemsize)
+    return offsets, offset
+
+
+class _SharedColumns:
+    """Fixed number of values stored as typed columns in a shared
+    memory block."""
+
+    # The shared memory area is organized as follows:
+    # - 8 bytes: number of values in each column (N) as a 64-bit integer
+    # - 8 bytes: size of the field specification (S) as a 64-bit integer
+    # - S bytes: the field specification, "name:typecode" pairs separated
+    #            by commas, padded to a multiple of 8 bytes
+    # - for each field, N values of its type, padded to a multiple of 8
+    #   bytes
+
+    def _create(self, spec, length, name):
+        if length < 0:
+            raise ValueError("length must be a non-negative integer")
+        encoded_spec = spec.encode(_encoding)
+        _, size = _column_offsets(_parse_fields(spec), len(encoded_spec),
+                                  length)
+        self.shm = SharedMemory(name, create=True, size=size)
+        _header.pack_into(self.shm.buf, 0, length, len(encoded_spec))
+        start = _header.size
+        self.shm.buf[start:start + len(encoded_spec)] = encoded_spec
+        self._map(spec, length)
+
+    def _attach(self, name):
+        self.shm = SharedMemory(name)
+        length, spec_size = _header.unpack_from(self.shm.buf, 0)
+        start = _header.size
+        spec = bytes(self.shm.buf[start:start + spec_size])
+        self._map(spec.decode(_encoding), length)
+
+    def _map(self, spec, length):
+        self._length = length
+        self._fields = _parse_fields(spec)
+        offsets, _ = _column_offsets(self._fields, len(spec.encode(_encoding)),
+                                     length)
+        # The typed views are created once: values are indexed and sliced
+        # by the memoryview itself, without unpacking them one at a time.
+        buf = self.shm.buf
+        self._columns = [
+            buf[start:start + length * array.array(typecode).itemsize]
+                .cast(typecode)
+            for (_, typecode), start in zip(self._fields, offsets)
+        ]
+
+    @staticmethod
+    def _as_array(typecode, values):
+        if isinstance(values, array.array) and values.typecode == typecode:
+            return values
+        return array.array(typecode, values)
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __len__(self):
+        return self._length
+
+    def close(self):
+        """Releases the typed views and closes access to the shared
+        memory from this instance, without destroying the block."""
+        for column in self._columns:
+            column.release()
+        self.shm.close()
+
+    __class_getitem__ = classmethod(types.GenericAlias)
+
+
+class SharedArray(_SharedColumns):
+    """Fixed-length array of values of a single type, shareable via a
+    shared memory block.
+
+    The type of the values is given by a type code of the array module.
+    Values are stored contiguously and accessed through a typed
+    memoryview, so indexing and slicing do not unpack them one at a time."""
+
+    def __init__(self, typecode=None, size_or_initializer=None, *, name=None):
+        if name is None or size_or_initializer is not None:
+            spec = _format_fields([("", typecode)])
+            if isinstance(size_or_initializer, int):
+                self._create(spec, size_or_initializer, name)
+            else:
+                values = self._as_array(typecode, size_or_initializer or ())
+                self._create(spec, len(values), name)
+                self._columns[0][:] = values
+        else:
+            self._attach(name)
+
+    def __getitem__(self, index):
+        value = self._columns[0][index]
+        if isinstance(index, slice):
+            return value.tolist()
+        return value
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self._as_array(self.typecode, value)
+        self._columns[0][index] = value
+
+    def __iter__(self):
+        return iter(self._columns[0])
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self.typecode!r}, '
+                f'{self.tolist()}, name={self.shm.name!r})')
+
+    @property
+    def typecode(self):
+        "The array module type code of the values."
+        return self._fields[0][1]
+
+    @property
+    def view(self):
+        "A memoryview of the values, cast to the type of the values."
+        return self._columns[0]
+
+    def tolist(self):
+        "Returns the values as a list."
+        return self._columns[0].tolist()
+
+
+class SharedRecords(_SharedColumns):
+    """Fixed number of records with typed fields, shareable via a shared
+    memory block.
+
+    *fields* is a sequence of (name, typecode) pairs, where typecode is a
+    type code of the array module.  The records are stored by column: each
+    field is a contiguous array, which can be scanned through the typed
+    memoryview returned by column().  Records are returned as named
+    tuples."""
+
+    def __init__(self, fields=None, size_or_initializer=None, *, name=None):
+        if name is None or size_or_initializer is not None:
+            spec = _format_fields(fields)
+            self._fields = _parse_fields(spec)
+            self._record = self._make_record_type()
+            if isinstance(size_or_initializer, int):
+                self._create(spec, size_or_initializer, name)
+            else:
+                # Convert the records before creating the block, so that
+                # invalid values do not leave an orphan block behind.
+                records = list(size_or_initializer or ())
+                values = self._to_columns(records)
+                self._create(spec, len(records), name)
+                for column, column_values in zip(self._columns, values):
+                    column[:] = column_values
+        else:
+            self._attach(name)
+            self._record = self._make_record_type()
+
+    def _make_record_type(self):
+        return collections.namedtuple(
+            'Record', [name for name, _ in self._fields])
+
+    def _to_columns(self, records):
+        "Converts a sequence of records to one array per field."
+        nfields = len(self._fields)
+        for record in records:
+            if len(record) != nfields:
+                raise ValueError(f"records must have {nfields} fields")
+        values = list(zip(*records)) or [()] * nfields
+        return [self._as_array(typecode, column_values)
+                for (_, typecode), column_values in zip(self._fields, values)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(self._record._make,
+                            zip(*(column[index].tolist()
+                                  for column in self._columns))))
+        return self._record._make(column[index] for column in self._columns)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            values = self._to_columns(list(value))
+        else:
+            values = self._to_columns([value])
+            values = [column_values[0] for column_values in values]
+        for column, column_values in zip(self._columns, values):
+            column[index] = column_values
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self.fields!r}, '
+                f'{self._length}, name={self.shm.name!r})')
+
+    @property
+    def fields(self):
+        "The (name, typecode) pairs of the fields of the records."
+        return list(self._fields)
+
+    def column(self, field):
+        """Returns a memoryview of the values of a field, cast to the type
+        of the field."""
+        for (name, _), column in zip(self._fields, self._columns):
+            if name == field:
+                return column
+        raise KeyError(field)
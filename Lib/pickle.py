@@ -196,23 +196,37 @@ class _Framer:
     _FRAME_SIZE_MIN = 4
     _FRAME_SIZE_TARGET = 64 * 1024
 
-    def __init__(self, file_write):
+    def __init__(self, file_write, reuse_buffer=False):
         self.file_write = file_write
         self.current_frame = None
+        self.reuse_buffer = reuse_buffer
+        # io.BytesIO instance kept for the next frame if reuse_buffer is true
+        self.free_frame = None
 
     def start_framing(self):
-        self.current_frame = io.BytesIO()
+        if self.free_frame is not None:
+            self.current_frame = self.free_frame
+            self.free_frame = None
+        else:
+            self.current_frame = io.BytesIO()
 
     def end_framing(self):
         if self.current_frame and self.current_frame.tell() > 0:
             self.commit_frame(force=True)
+            if self.reuse_buffer:
+                self.free_frame = self.current_frame
             self.current_frame = None
 
     def commit_frame(self, force=False):
         if self.current_frame:
             f = self.current_frame
             if f.tell() >= self._FRAME_SIZE_TARGET or force:
-                data = f.getbuffer()
+                if self.reuse_buffer:
+                    # The buffer can hold data of a previous frame past the
+                    # current position.
+                    data = f.getbuffer()[:f.tell()].toreadonly()
+                else:
+                    data = f.getbuffer()
                 write = self.file_write
                 if len(data) >= self._FRAME_SIZE_MIN:
                     # Issue a single call to the write method of the underlying
@@ -226,11 +240,27 @@ def commit_frame(self, force=False):
                 # memory copy.
                 write(data)
 
-                # Start the new frame with a new io.BytesIO instance so that
-                # the file object can have delayed access to the previous frame
-                # contents via an unreleased memoryview of the previous
-                # io.BytesIO instance.
-                self.current_frame = io.BytesIO()
+                if self.reuse_buffer:
+                    del data
+                    self.current_frame = self._reset_frame(f)
+                else:
+                    # Start the new frame with a new io.BytesIO instance so
+                    # that the file object can have delayed access to the
+                    # previous frame contents via an unreleased memoryview of
+                    # the previous io.BytesIO instance.
+                    self.current_frame = io.BytesIO()
+
+    @staticmethod
+    def _reset_frame(f):
+        # Return f rewound for a new frame, or a new io.BytesIO instance if
+        # the file object kept a view of the previous frame contents.
+        f.seek(0)
+        try:
+            # Fails if f is exported
+            f.write(b'')
+        except BufferError:
+            return io.BytesIO()
+        return f
 
     def write(self, data):
         if self.current_frame:
@@ -256,9 +286,11 @@ def write_large_bytes(self, header, payload):
 
 class _Unframer:
 
-    def __init__(self, file_read, file_readline, file_tell=None):
+    def __init__(self, file_read, file_readline, file_tell=None, *,
+                 file_read_view=None):
         self.file_read = file_read
         self.file_readline = file_readline
+        self.file_read_view = file_read_view
         self.current_frame = None
 
     def readinto(self, buf):
@@ -291,6 +323,19 @@ def read(self, n):
         else:
             return self.file_read(n)
 
+    def read_view(self, n):
+        if self.current_frame:
+            data = self.current_frame.read_view(n)
+            if not data and n != 0:
+                self.current_frame = None
+                return self.file_read_view(n)
+            if len(data) < n:
+                raise UnpicklingError(
+                    "pickle exhausted before end of frame")
+            return data
+        else:
+            return self.file_read_view(n)
+
     def readline(self):
         if self.current_frame:
             data = self.current_frame.readline()
@@ -308,7 +353,50 @@ def load_frame(self, frame_size):
         if self.current_frame and self.current_frame.read() != b'':
             raise UnpicklingError(
                 "beginning of a new frame before end of current frame")
-        self.current_frame = io.BytesIO(self.file_read(frame_size))
+        if self.file_read_view is not None:
+            self.current_frame = _MemoryReader(self.file_read_view(frame_size))
+        else:
+            self.current_frame = io.BytesIO(self.file_read(frame_size))
+
+
+class _MemoryReader:
+    """Binary file reading from a buffer, used by loads(zero_copy=True).
+
+    read_view() returns read-only views of the buffer instead of copies.
+    """
+
+    def __init__(self, data):
+        self._view = memoryview(data).cast('B').toreadonly()
+        self._pos = 0
+
+    def read_view(self, n):
+        start = self._pos
+        view = self._view[start:start + n]
+        self._pos = start + len(view)
+        return view
+
+    def read(self, n=-1):
+        if n < 0:
+            n = len(self._view) - self._pos
+        return bytes(self.read_view(n))
+
+    def readinto(self, buf):
+        view = self.read_view(len(buf))
+        buf[:len(view)] = view
+        return len(view)
+
+    def readline(self):
+        view = self._view
+        start = end = self._pos
+        while end < len(view):
+            chunk = bytes(view[end:end + 256])
+            i = chunk.find(b'\n')
+            if i >= 0:
+                end += i + 1
+                break
+            end += len(chunk)
+        self._pos = end
+        return bytes(view[start:end])
 
 
 # Tools used for pickling.
@@ -401,7 +489,7 @@ def decode_long(data):
 class _Pickler:
 
     def __init__(self, file, protocol=None, *, fix_imports=True,
-                 buffer_callback=None):
+                 buffer_callback=None, reuse_buffer=False):
         """This takes a binary file for writing a pickle data stream.
 
         The optional *protocol* argument tells the pickler to use the
@@ -434,6 +522,11 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
 
         It is an error if *buffer_callback* is not None and *protocol*
         is None or smaller than 5.
+
+        If *reuse_buffer* is True, the pickle data is passed to write()
+        as read-only memoryviews of an internal buffer, which the pickler
+        reuses for the next writes and dump() calls unless write() keeps
+        a view of it.
         """
         if protocol is None:
             protocol = DEFAULT_PROTOCOL
@@ -448,7 +541,7 @@ def __init__(self, file, protocol=None, *, fix_imports=True,
             self._file_write = file.write
         except AttributeError:
             raise TypeError("file must have a 'write' attribute")
-        self.framer = _Framer(self._file_write)
+        self.framer = _Framer(self._file_write, reuse_buffer)
         self.write = self.framer.write
         self._write_large_bytes = self.framer.write_large_bytes
         self.memo = {}
@@ -1170,6 +1263,10 @@ def __init__(self, file, *, fix_imports=True,
         self._buffers = iter(buffers) if buffers is not None else None
         self._file_readline = file.readline
         self._file_read = file.read
+        if isinstance(file, _MemoryReader):
+            self._file_read_view = file.read_view
+        else:
+            self._file_read_view = None
         self.memo = {}
         self.encoding = encoding
         self.errors = errors
@@ -1186,10 +1283,15 @@ def load(self):
         if not hasattr(self, "_file_read"):
             raise UnpicklingError("Unpickler.__init__() was not called by "
                                   "%s.__init__()" % (self.__class__.__name__,))
-        self._unframer = _Unframer(self._file_read, self._file_readline)
+        self._unframer = _Unframer(self._file_read, self._file_readline,
+                                   file_read_view=self._file_read_view)
         self.read = self._unframer.read
         self.readinto = self._unframer.readinto
         self.readline = self._unframer.readline
+        if self._file_read_view is not None:
+            self._read_bytes = self._unframer.read_view
+        else:
+            self._read_bytes = self.read
         self.metastack = []
         self.stack = []
         self.append = self.stack.append
@@ -1344,7 +1446,7 @@ def load_binbytes(self):
         if len > maxsize:
             raise UnpicklingError("BINBYTES exceeds system's maximum size "
                                   "of %d bytes" % maxsize)
-        self.append(self.read(len))
+        self.append(self._read_bytes(len))
     dispatch[BINBYTES[0]] = load_binbytes
 
     def load_unicode(self):
@@ -1372,7 +1474,7 @@ def load_binbytes8(self):
         if len > maxsize:
             raise UnpicklingError("BINBYTES8 exceeds system's maximum size "
                                   "of %d bytes" % maxsize)
-        self.append(self.read(len))
+        self.append(self._read_bytes(len))
     dispatch[BINBYTES8[0]] = load_binbytes8
 
     def load_bytearray8(self):
@@ -1380,6 +1482,9 @@ def load_bytearray8(self):
         if len > maxsize:
             raise UnpicklingError("BYTEARRAY8 exceeds system's maximum size "
                                   "of %d bytes" % maxsize)
+        if self._file_read_view is not None:
+            self.append(self._read_bytes(len))
+            return
         b = bytearray(len)
         self.readinto(b)
         self.append(b)
@@ -1411,7 +1516,7 @@ def load_short_binstring(self):
 
     def load_short_binbytes(self):
         len = self.read(1)[0]
-        self.append(self.read(len))
+        self.append(self._read_bytes(len))
     dispatch[SHORT_BINBYTES[0]] = load_short_binbytes
 
     def load_short_binunicode(self):
@@ -1757,10 +1862,13 @@ def _load(file, *, fix_imports=True, encoding="ASCII", errors="strict",
                      encoding=encoding, errors=errors).load()
 
 def _loads(s, /, *, fix_imports=True, encoding="ASCII", errors="strict",
-           buffers=None):
+           buffers=None, zero_copy=False):
     if isinstance(s, str):
         raise TypeError("Can't load pickle from unicode string")
-    file = io.BytesIO(s)
+    if zero_copy:
+        file = _MemoryReader(s)
+    else:
+        file = io.BytesIO(s)
     return _Unpickler(file, fix_imports=fix_imports, buffers=buffers,
                       encoding=encoding, errors=errors).load()
 
@@ -2652,6 +2652,30 @@ def test_context(self):
             p.join()
             self.assertRaises(ValueError, p.map_async, sqr, L)
 
+    @unittest.skipUnless(os.path.exists('/proc/self/smaps_rollup'),
+                         'requires /proc/<pid>/smaps_rollup')
+    def test_memory_info(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        info = self.pool.memory_info()
+        self.assertEqual(sorted(info),
+                         sorted(worker.pid for worker in self.pool._pool))
+        for usage in info.values():
+            self.assertEqual(set(usage), {'rss', 'pss', 'uss', 'shared'})
+            self.assertGreater(usage['rss'], 0)
+            self.assertLessEqual(usage['uss'], usage['pss'])
+            self.assertLessEqual(usage['pss'], usage['rss'])
+            self.assertEqual(usage['uss'] + usage['shared'], usage['rss'])
+
+    def test_memory_info_unavailable(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        # Missing on other platforms and on Linux older than 4.14
+        with unittest.mock.patch('multiprocessing.pool._SMAPS_ROLLUP',
+                                 '/nonexistent/{}/smaps_rollup'):
+            with self.assertRaises(NotImplementedError):
+                self.pool.memory_info()
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -2886,12 +2910,93 @@ def test():
         rc, out, err = test.support.script_helper.assert_python_ok('-c', cmd)
         self.assertEqual(rc, 0)
 
+def worker_pid(x, wait=0.0):
+    time.sleep(wait)
+    return os.getpid()
+
+class _TestPoolAffinity(BaseTestCase):
+    ALLOWED_TYPES = ('processes', )
+
+    def test_apply_async_affinity(self):
+        with multiprocessing.Pool(4, task_affinity=True) as p:
+            for key in ('a', 'b', 3):
+                pids = {p.apply_async(worker_pid, (i,), affinity=key).get()
+                        for i in range(5)}
+                self.assertEqual(len(pids), 1)
+            # Tasks without affinity are spread among the workers.
+            results = [p.apply_async(sqr, (i,)) for i in range(20)]
+            self.assertEqual([r.get() for r in results],
+                             [sqr(i) for i in range(20)])
+        p.join()
+
+    def test_imap_affinity(self):
+        with multiprocessing.Pool(3, task_affinity=True) as p:
+            self.assertEqual(list(p.imap(sqr, range(50), affinity_key=abs)),
+                             [sqr(i) for i in range(50)])
+            self.assertEqual(
+                list(p.imap(sqr, range(50), 7, affinity_key=abs)),
+                [sqr(i) for i in range(50)])
+            self.assertEqual(
+                sorted(p.imap_unordered(sqr, range(50),
+                                        affinity_key=lambda x: x % 2)),
+                [sqr(i) for i in range(50)])
+            self.assertEqual(
+                sorted(p.imap_unordered(sqr, range(50), 4,
+                                        affinity_key=lambda x: 0)),
+                [sqr(i) for i in range(50)])
+            # Errors of the key function are reported like errors of the
+            # iterable.
+            it = p.imap(sqr, [1, 2, None], affinity_key=lambda x: x + 1)
+            self.assertEqual(next(it), 1)
+            self.assertEqual(next(it), 4)
+            self.assertRaises(TypeError, next, it)
+        p.join()
+
+    def test_overloaded_worker(self):
+        # Tasks of a worker which has too many outstanding tasks are sent
+        # to other workers.
+        with multiprocessing.Pool(3, task_affinity=True) as p:
+            results = [p.apply_async(worker_pid, (i, 0.05), affinity='key')
+                       for i in range(12)]
+            pids = {r.get() for r in results}
+            self.assertGreater(len(pids), 1)
+        p.join()
+
+    def test_affinity_maxtasksperchild(self):
+        with multiprocessing.Pool(2, maxtasksperchild=2,
+                                  task_affinity=True) as p:
+            results = [p.apply_async(sqr, (i,), affinity=i % 2)
+                       for i in range(20)]
+            self.assertEqual([r.get() for r in results],
+                             [sqr(i) for i in range(20)])
+            self.assertEqual(list(p.imap(sqr, range(10), affinity_key=abs)),
+                             [sqr(i) for i in range(10)])
+        p.join()
+
+    def test_affinity_terminate(self):
+        p = multiprocessing.Pool(2, task_affinity=True)
+        for i in range(100):
+            p.apply_async(sqr, (i, 0.1), affinity=0)
+        p.terminate()
+        p.join()
+
+    def test_affinity_requires_task_affinity(self):
+        with multiprocessing.Pool(1) as p:
+            with self.assertRaises(ValueError):
+                p.apply_async(sqr, (1,), affinity=1)
+            with self.assertRaises(ValueError):
+                p.imap(sqr, [1], affinity_key=abs)
+            with self.assertRaises(ValueError):
+                p.imap_unordered(sqr, [1], affinity_key=abs)
+        p.join()
+
 #
 # Test of creating a customized manager class
 #
 
 from multiprocessing.managers import BaseManager, BaseProxy, RemoteError
 
+
 class FooBar(object):
     def f(self):
         return 'f()'
@@ -3833,6 +3938,79 @@ def test_copy(self):
         self.assertEqual(bar.z, 2 ** 33)
 
 
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestRingQueue(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @classmethod
+    def _test_producer(cls, queue, n):
+        for i in range(n):
+            queue.put(i)
+        queue.put(b'x' * 100)
+        queue.put(None)
+
+    def test_put_get(self):
+        queue = self.RingQueue(4, 256)
+        self.addCleanup(queue.close)
+        self.assertTrue(queue.empty())
+        items = [b'bytes', {'a': [1, 2]}, bytearray(b'buffer'),
+                 array.array('i', range(10))]
+        for item in items:
+            queue.put(item)
+        self.assertEqual(queue.qsize(), 4)
+        self.assertTrue(queue.full())
+        self.assertRaises(pyqueue.Full, queue.put, 1, timeout=0.01)
+        self.assertRaises(pyqueue.Full, queue.put_nowait, 1)
+
+        self.assertEqual([queue.get() for _ in items], items)
+        self.assertTrue(queue.empty())
+        self.assertRaises(pyqueue.Empty, queue.get, timeout=0.01)
+        self.assertRaises(pyqueue.Empty, queue.get_nowait)
+
+        # Wrap around the ring
+        for i in range(10):
+            queue.put_nowait(i)
+            self.assertEqual(queue.get_nowait(), i)
+
+    def test_item_too_large(self):
+        queue = self.RingQueue(2, 64)
+        self.addCleanup(queue.close)
+        self.assertRaises(ValueError, queue.put, b'x' * 64)
+        self.assertRaises(ValueError, queue.put, list(range(100)))
+        self.assertTrue(queue.empty())
+        queue.put(b'x' * 56)
+        self.assertEqual(queue.get(), b'x' * 56)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, self.RingQueue, 0)
+        self.assertRaises(ValueError, self.RingQueue, 1, 8)
+
+    def test_close(self):
+        queue = self.RingQueue()
+        name = queue._shm.name
+        queue.close()
+        self.assertRaises(ValueError, queue.put, 1)
+        self.assertRaises(ValueError, queue.get)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+        queue.close()
+
+    def test_processes(self):
+        n = 1000
+        queue = self.RingQueue(16, 256)
+        self.addCleanup(queue.close)
+        p = self.Process(target=self._test_producer, args=(queue, n))
+        p.daemon = True
+        p.start()
+        self.assertEqual([queue.get(timeout=support.SHORT_TIMEOUT)
+                          for _ in range(n)], list(range(n)))
+        self.assertEqual(queue.get(timeout=support.SHORT_TIMEOUT),
+                         b'x' * 100)
+        self.assertIsNone(queue.get(timeout=support.SHORT_TIMEOUT))
+        p.join()
+
+
 @unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
 @hashlib_helper.requires_hashdigest('md5')
 class _TestSharedMemory(BaseTestCase):
@@ -4139,10 +4317,18 @@ def test_shared_memory_SharedMemoryManager_basics(self):
             sl = smm2.ShareableList("howdy")
             shm = smm2.SharedMemory(size=128)
             held_name = sl.shm.name
+            sa = smm2.SharedArray('d', range(3))
+            sr = smm2.SharedRecords([('x', 'i')], 4)
+            held_names = [sa.shm.name, sr.shm.name]
+            sa.close()
+            sr.close()
         if sys.platform != "win32":
             with self.assertRaises(FileNotFoundError):
                 # No longer there to be attached to again.
                 absent_sl = shared_memory.ShareableList(name=held_name)
+            for name in held_names:
+                with self.assertRaises(FileNotFoundError):
+                    shared_memory.SharedMemory(name=name)
 
 
     def test_shared_memory_ShareableList_basics(self):
@@ -4299,6 +4485,112 @@ def test_shared_memory_ShareableList_pickling_dead_object(self):
                 with self.assertRaises(FileNotFoundError):
                     pickle.loads(serialized_sl)
 
+    @classmethod
+    def _double_shared_values(cls, shared):
+        if isinstance(shared, shared_memory.SharedRecords):
+            view = shared.column('price')
+        else:
+            view = shared.view
+        view[:] = array.array(view.format, [2 * value for value in view])
+        shared.close()
+
+    def test_shared_memory_SharedArray_basics(self):
+        sa = shared_memory.SharedArray('d', range(5))
+        self.addCleanup(sa.shm.unlink)
+        self.addCleanup(sa.close)
+
+        self.assertEqual(len(sa), 5)
+        self.assertEqual(sa.typecode, 'd')
+        self.assertIn(sa.shm.name, repr(sa))
+        self.assertEqual(sa[1], 1.0)
+        self.assertEqual(sa[-1], 4.0)
+        self.assertEqual(sa[1:4], [1.0, 2.0, 3.0])
+        self.assertEqual(sa[::2], [0.0, 2.0, 4.0])
+        with self.assertRaises(IndexError):
+            sa[5]
+
+        sa[0] = 7.5
+        sa[1:3] = [9, 8]
+        sa[3:] = array.array('d', [-1, -2])
+        self.assertEqual(list(sa), [7.5, 9.0, 8.0, -1.0, -2.0])
+        self.assertEqual(sa.tolist(), list(sa))
+        self.assertEqual(sa.view.format, 'd')
+        self.assertEqual(sum(sa.view), 21.5)
+        with self.assertRaises(ValueError):
+            sa[1:3] = [1.0]
+        with self.assertRaises(TypeError):
+            sa[0] = 'x'
+
+        zeros = shared_memory.SharedArray('q', 3)
+        self.addCleanup(zeros.shm.unlink)
+        self.assertEqual(zeros.tolist(), [0, 0, 0])
+        zeros.close()
+
+        with self.assertRaises(ValueError):
+            shared_memory.SharedArray('u', 'abc')
+        with self.assertRaises(ValueError):
+            shared_memory.SharedArray(None, 3)
+
+    def test_shared_memory_SharedRecords_basics(self):
+        fields = [('id', 'q'), ('price', 'd')]
+        sr = shared_memory.SharedRecords(fields, [(1, 2.5), (2, 3.5), (3, 0)])
+        self.addCleanup(sr.shm.unlink)
+        self.addCleanup(sr.close)
+
+        self.assertEqual(len(sr), 3)
+        self.assertEqual(sr.fields, fields)
+        self.assertIn(sr.shm.name, repr(sr))
+        self.assertEqual(sr[0], (1, 2.5))
+        self.assertEqual(sr[0].price, 2.5)
+        self.assertEqual(sr[-1], (3, 0.0))
+        self.assertEqual(sr[1:], [(2, 3.5), (3, 0.0)])
+        self.assertEqual(list(sr), [(1, 2.5), (2, 3.5), (3, 0.0)])
+        self.assertEqual(sr.column('id').tolist(), [1, 2, 3])
+        self.assertEqual(sr.column('price').format, 'd')
+        with self.assertRaises(KeyError):
+            sr.column('spam')
+
+        sr[0] = (10, 1.0)
+        sr[1:] = [(20, 2.0), (30, 3.0)]
+        self.assertEqual(sr[:], [(10, 1.0), (20, 2.0), (30, 3.0)])
+        with self.assertRaises(ValueError):
+            sr[0] = (1,)
+        with self.assertRaises(ValueError):
+            sr[:2] = [(1, 1.0)]
+
+        empty = shared_memory.SharedRecords(fields, 2)
+        self.addCleanup(empty.shm.unlink)
+        self.assertEqual(empty[:], [(0, 0.0), (0, 0.0)])
+        empty.close()
+
+        with self.assertRaises(ValueError):
+            shared_memory.SharedRecords([], 1)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedRecords([('a b', 'q')], 1)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedRecords([('a', 'q')], [(1, 2)])
+
+    def test_shared_memory_SharedArray_across_processes(self):
+        for shared in (shared_memory.SharedArray('d', [1, 2, 3]),
+                       shared_memory.SharedRecords(
+                           [('id', 'q'), ('price', 'd')], [(1, 1), (2, 2)])):
+            with self.subTest(type=type(shared).__name__):
+                self.addCleanup(shared.shm.unlink)
+                self.addCleanup(shared.close)
+                copy = pickle.loads(pickle.dumps(shared))
+                self.assertEqual(list(copy), list(shared))
+                copy.close()
+
+                p = self.Process(target=self._double_shared_values,
+                                 args=(shared,))
+                p.daemon = True
+                p.start()
+                p.join()
+                if isinstance(shared, shared_memory.SharedRecords):
+                    self.assertEqual(shared[:], [(1, 2.0), (2, 4.0)])
+                else:
+                    self.assertEqual(shared[:], [2.0, 4.0, 6.0])
+
     def test_shared_memory_cleaned_after_process_termination(self):
         cmd = '''if 1:
             import os, time, sys
@@ -5283,6 +5575,27 @@ def test_preload_resources(self):
             print(err)
             self.fail("failed spawning forkserver or grandchild")
 
+    @unittest.skipUnless(os.path.exists('/proc/self/smaps_rollup'),
+                         'requires /proc/<pid>/smaps_rollup')
+    def test_preload_warmup(self):
+        if multiprocessing.get_start_method() != 'forkserver':
+            self.skipTest("test only relevant for 'forkserver' method")
+        name = os.path.join(os.path.dirname(__file__), 'mp_preload_warmup.py')
+        rc, out, err = test.support.script_helper.assert_python_ok(name)
+        out = out.decode()
+        err = err.decode()
+        if out.rstrip() != 'ok' or err != '':
+            print(out)
+            print(err)
+            self.fail("failed warming up forkserver")
+
+    def test_preload_warmup_validation(self):
+        ctx = multiprocessing.get_context()
+        with self.assertRaises(TypeError):
+            ctx.set_forkserver_preload([1])
+        with self.assertRaises(TypeError):
+            ctx.set_forkserver_preload([], warmup=['module'])
+
 
 @unittest.skipIf(sys.platform == "win32",
                  "test semantics don't make sense on Windows")
@@ -5854,6 +6167,7 @@ class ProcessesMixin(BaseMixin):
     Pipe = staticmethod(multiprocessing.Pipe)
     Queue = staticmethod(multiprocessing.Queue)
     JoinableQueue = staticmethod(multiprocessing.JoinableQueue)
+    RingQueue = staticmethod(multiprocessing.RingQueue)
     Lock = staticmethod(multiprocessing.Lock)
     RLock = staticmethod(multiprocessing.RLock)
     Semaphore = staticmethod(multiprocessing.Semaphore)
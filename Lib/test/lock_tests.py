@@ -1043,3 +1043,283 @@ def f():
         self.assertRegex(repr(b), r"<\w+\.Barrier at .*: waiters=0/3>")
         b.abort()
         self.assertRegex(repr(b), r"<\w+\.Barrier at .*: broken>")
+
+
+class RWLockTests(BaseTestCase):
+    """
+    Tests for reader-writer locks.
+    """
+
+    def test_readers(self):
+        rwlock = self.rwlocktype()
+        self.assertTrue(rwlock.acquire_read())
+        self.assertTrue(rwlock.acquire_read(False))
+        self.assertTrue(rwlock.acquire_read(timeout=0.01))
+        self.assertFalse(rwlock.acquire_write(False))
+        rwlock.release_read()
+        rwlock.release_read()
+        self.assertFalse(rwlock.acquire_write(timeout=0.01))
+        rwlock.release_read()
+        self.assertTrue(rwlock.acquire_write(False))
+        rwlock.release_write()
+
+    def test_writer(self):
+        rwlock = self.rwlocktype()
+        self.assertTrue(rwlock.acquire_write())
+        results = []
+        def f():
+            results.append(rwlock.acquire_read(False))
+            results.append(rwlock.acquire_write(False))
+            results.append(rwlock.acquire_read(timeout=0.01))
+        Bunch(f, 1).wait_for_finished()
+        self.assertEqual(results, [False, False, False])
+        rwlock.release_write()
+        self.assertTrue(rwlock.acquire_read(False))
+        rwlock.release_read()
+
+    def test_concurrent_readers(self):
+        rwlock = self.rwlocktype()
+        N = 5
+        inside = []
+        def f():
+            with rwlock.read_lock:
+                inside.append(None)
+                # All the readers hold the lock at the same time
+                while len(inside) < N:
+                    _wait()
+        Bunch(f, N).wait_for_finished()
+        self.assertEqual(len(inside), N)
+
+    def test_writer_exclusion(self):
+        rwlock = self.rwlocktype()
+        rwlock.acquire_read()
+        phase = []
+        def f():
+            with rwlock.write_lock:
+                phase.append('writer')
+        b = Bunch(f, 1)
+        b.wait_for_started()
+        _wait()
+        self.assertEqual(phase, [])
+        phase.append('reader')
+        rwlock.release_read()
+        b.wait_for_finished()
+        self.assertEqual(phase, ['reader', 'writer'])
+
+    def test_writer_preference(self):
+        # New readers wait while a writer is waiting
+        rwlock = self.rwlocktype()
+        rwlock.acquire_read()
+        order = []
+        def writer():
+            with rwlock.write_lock:
+                order.append('writer')
+        def reader():
+            with rwlock.read_lock:
+                order.append('reader')
+        w = Bunch(writer, 1)
+        while not rwlock._waiting_writers:
+            _wait()
+        r = Bunch(reader, 3)
+        r.wait_for_started()
+        _wait()
+        self.assertEqual(order, [])
+        # The lock is held by a reader, but a writer is waiting
+        self.assertFalse(rwlock.acquire_read(False))
+        rwlock.release_read()
+        w.wait_for_finished()
+        r.wait_for_finished()
+        self.assertEqual(order, ['writer'] + ['reader'] * 3)
+
+    def test_writer_timeout_wakes_readers(self):
+        # Readers blocked by a waiting writer proceed when it gives up
+        rwlock = self.rwlocktype()
+        rwlock.acquire_read()
+        results = []
+        def writer():
+            results.append(rwlock.acquire_write(timeout=0.2))
+        def reader():
+            results.append(rwlock.acquire_read())
+            rwlock.release_read()
+        w = Bunch(writer, 1)
+        while not rwlock._waiting_writers:
+            _wait()
+        r = Bunch(reader, 2)
+        w.wait_for_finished()
+        r.wait_for_finished()
+        self.assertEqual(results, [False, True, True])
+        rwlock.release_read()
+
+    def test_acquire_timeout(self):
+        rwlock = self.rwlocktype()
+        self.assertRaises(ValueError, rwlock.acquire_read, False, timeout=1.0)
+        self.assertRaises(ValueError, rwlock.acquire_write, False, timeout=1.0)
+        rwlock.acquire_read()
+        t = time.monotonic()
+        self.assertFalse(rwlock.acquire_write(timeout=0.5))
+        dt = time.monotonic() - t
+        self.assertTimeout(dt, 0.5)
+        rwlock.release_read()
+
+    def test_release_unacquired(self):
+        rwlock = self.rwlocktype()
+        self.assertRaises(RuntimeError, rwlock.release_read)
+        self.assertRaises(RuntimeError, rwlock.release_write)
+        rwlock.acquire_read()
+        self.assertRaises(RuntimeError, rwlock.release_write)
+        rwlock.release_read()
+
+    def test_release_write_other_thread(self):
+        rwlock = self.rwlocktype()
+        rwlock.acquire_write()
+        errors = []
+        def f():
+            try:
+                rwlock.release_write()
+            except RuntimeError as exc:
+                errors.append(exc)
+        Bunch(f, 1).wait_for_finished()
+        self.assertEqual(len(errors), 1)
+        rwlock.release_write()
+
+    def test_reacquire_write(self):
+        rwlock = self.rwlocktype()
+        rwlock.acquire_write()
+        self.assertRaises(RuntimeError, rwlock.acquire_write)
+        self.assertRaises(RuntimeError, rwlock.acquire_read)
+        rwlock.release_write()
+
+    def test_with(self):
+        rwlock = self.rwlocktype()
+        def _with(err=None):
+            with rwlock.write_lock:
+                self.assertEqual(rwlock._writer, threading.get_ident())
+                if err:
+                    raise err
+        self.assertRaises(TypeError, _with, TypeError)
+        self.assertIsNone(rwlock._writer)
+        with rwlock.read_lock as result:
+            self.assertTrue(result)
+            self.assertFalse(rwlock.acquire_write(False))
+        self.assertTrue(rwlock.acquire_write(False))
+        rwlock.release_write()
+
+    def test_repr(self):
+        rwlock = self.rwlocktype()
+        self.assertRegex(repr(rwlock), r"<\w+\.RWLock at .*: readers=0 "
+                                       r"writer=False waiting_writers=0>")
+        rwlock.acquire_read()
+        rwlock.acquire_read()
+        self.assertRegex(repr(rwlock), r"<\w+\.RWLock at .*: readers=2 "
+                                       r"writer=False waiting_writers=0>")
+        rwlock.release_read()
+        rwlock.release_read()
+        rwlock.acquire_write()
+        self.assertRegex(repr(rwlock), r"<\w+\.RWLock at .*: readers=0 "
+                                       r"writer=True waiting_writers=0>")
+        rwlock.release_write()
+
+
+class ShardedLockTests(BaseTestCase):
+    """
+    Tests for sharded locks.
+    """
+
+    def test_constructor(self):
+        self.assertEqual(len(self.shardedlocktype()), 16)
+        self.assertEqual(len(self.shardedlocktype(5)), 5)
+        self.assertEqual(len(self.shardedlocktype(shards=1)), 1)
+        self.assertRaises(ValueError, self.shardedlocktype, 0)
+        self.assertRaises(ValueError, self.shardedlocktype, -1)
+        self.assertRaises(TypeError, self.shardedlocktype, 1.0)
+
+    def test_repr(self):
+        locks = self.shardedlocktype(3)
+        self.assertRegex(repr(locks), r"<\w+\.ShardedLock object at .*, shards=3>")
+
+    def test_shard(self):
+        locks = self.shardedlocktype(8)
+        shards = {locks.shard(i) for i in range(100)}
+        self.assertEqual(shards, set(range(8)))
+        self.assertEqual(locks.shard(1), locks.shard(1.0))
+        self.assertEqual(locks.shard('key'), locks.shard('key'))
+        self.assertEqual(locks.shard(1 << 70), locks.shard(1 << 70))
+        self.assertRaises(TypeError, locks.shard, [])
+        self.assertRaises(TypeError, locks.lock_for, [])
+        self.assertRaises(TypeError, locks.acquire, [])
+
+    def test_lock_for(self):
+        locks = self.shardedlocktype(8)
+        lock = locks.lock_for('key')
+        self.assertIs(locks.lock_for('key'), lock)
+        self.assertFalse(lock.locked())
+        for i in range(100):
+            if locks.shard(i) == locks.shard('key'):
+                self.assertIs(locks.lock_for(i), lock)
+            else:
+                self.assertIsNot(locks.lock_for(i), lock)
+
+    def test_acquire(self):
+        locks = self.shardedlocktype(4)
+        self.assertTrue(locks.acquire('a'))
+        self.assertTrue(locks.lock_for('a').locked())
+        self.assertFalse(locks.acquire('a', False))
+        self.assertFalse(locks.acquire('a', timeout=0.01))
+        for key in range(20):
+            if locks.shard(key) != locks.shard('a'):
+                self.assertTrue(locks.acquire(key, blocking=False))
+                locks.release(key)
+        locks.release('a')
+        self.assertFalse(locks.lock_for('a').locked())
+        self.assertRaises(RuntimeError, locks.release, 'a')
+        self.assertRaises(TypeError, locks.acquire)
+
+    def test_acquire_contended(self):
+        locks = self.shardedlocktype(4)
+        locks.acquire(0)
+        results = []
+        def f():
+            results.append(locks.acquire(0))
+            locks.release(0)
+        b = Bunch(f, 1)
+        b.wait_for_started()
+        _wait()
+        self.assertEqual(results, [])
+        locks.release(0)
+        b.wait_for_finished()
+        self.assertEqual(results, [True])
+
+    def test_acquire_all(self):
+        locks = self.shardedlocktype(4)
+        self.assertTrue(locks.acquire_all())
+        self.assertTrue(all(locks.lock_for(i).locked() for i in range(20)))
+        self.assertFalse(locks.acquire(0, False))
+        locks.release_all()
+        self.assertFalse(any(locks.lock_for(i).locked() for i in range(20)))
+        self.assertRaises(RuntimeError, locks.release_all)
+
+    def test_acquire_all_timeout(self):
+        locks = self.shardedlocktype(4)
+        self.assertRaises(ValueError, locks.acquire_all, False, timeout=1.0)
+        locks.acquire('key')
+        self.assertFalse(locks.acquire_all(False))
+        t = time.monotonic()
+        self.assertFalse(locks.acquire_all(timeout=0.5))
+        dt = time.monotonic() - t
+        self.assertTimeout(dt, 0.5)
+        # The locks acquired before the timeout were released
+        locked = [locks.lock_for(i).locked() for i in range(20)]
+        self.assertEqual(locked, [locks.shard(i) == locks.shard('key')
+                                  for i in range(20)])
+        # A partial release_all() doesn't release anything
+        self.assertRaises(RuntimeError, locks.release_all)
+        self.assertTrue(locks.lock_for('key').locked())
+        locks.release('key')
+
+    def test_weakref(self):
+        locks = self.shardedlocktype()
+        ref = weakref.ref(locks)
+        self.assertIs(ref(), locks)
+        del locks
+        gc.collect()  # For PyPy or other GCs.
+        self.assertIsNone(ref())
@@ -0,0 +1,30 @@
+import gc
+import multiprocessing
+
+warmed_up = False
+
+
+def warmup():
+    global warmed_up
+    warmed_up = True
+
+
+def f():
+    return warmed_up, gc.get_freeze_count() > 0
+
+
+if __name__ == "__main__":
+    ctx = multiprocessing.get_context("forkserver")
+    modname = "test.mp_preload_warmup"
+    # Make sure it's importable
+    module = __import__(modname, fromlist=['f'])
+    ctx.set_forkserver_preload([modname], warmup=[modname + ":warmup"],
+                               freeze=True)
+    with ctx.Pool(2) as pool:
+        assert pool.apply(module.f) == (True, True)
+        info = pool.memory_info()
+        assert len(info) == 2, info
+        for usage in info.values():
+            assert set(usage) == {'rss', 'pss', 'uss', 'shared'}, usage
+            assert 0 < usage['uss'] <= usage['rss'], usage
+    print("ok")
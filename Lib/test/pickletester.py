@@ -3523,6 +3523,47 @@ def loads(data, **kwargs):
 
         self.check_dumps_loads_oob_buffers(dumps, loads)
 
+    def test_loads_zero_copy(self):
+        payload = b'abcdefgh' * 20000
+        obj = [b'xyz', payload, bytearray(payload), {'key': b'', 'n': 42},
+               'text', (b'ab', bytearray(b'cd'))]
+        for proto in protocols:
+            with self.subTest(proto=proto):
+                data = self.dumps(obj, proto)
+                new = self.loads(data, zero_copy=True)
+                self.assertEqual(new, obj)
+                if proto < 3:
+                    # bytes are pickled as a reduce call
+                    continue
+                self.assertIsInstance(new[0], memoryview)
+                self.assertIsInstance(new[1], memoryview)
+                self.assertTrue(new[1].readonly)
+                self.assertIs(new[1].obj, new[0].obj)
+                if proto >= 5:
+                    self.assertIsInstance(new[2], memoryview)
+                    self.assertIsInstance(new[5][1], memoryview)
+                else:
+                    self.assertIsInstance(new[2], bytearray)
+                # The views reference the input data
+                self.assertIs(new[1].obj, data)
+
+        # Any bytes-like object is accepted
+        data = self.dumps(obj, 5)
+        for buf in (bytearray(data), memoryview(data)):
+            new = self.loads(buf, zero_copy=True)
+            self.assertEqual(new, obj)
+            self.assertIsInstance(new[1], memoryview)
+            self.assertTrue(new[1].readonly)
+        # Truncated input
+        for i in (len(data) // 2, len(data) - len(payload) // 2):
+            with self.assertRaises((pickle.UnpicklingError, EOFError)):
+                self.loads(data[:i], zero_copy=True)
+
+        for proto in protocols:
+            data = self.dumps(obj, proto)
+            self.assertEqual(self.loads(data, zero_copy=False), obj)
+            self.assertIsInstance(self.loads(data, zero_copy=False)[1], bytes)
+
 
 class AbstractPersistentPicklerTests:
 
@@ -3634,6 +3675,39 @@ def test_clear_pickler_memo(self):
             self.assertNotEqual(first_pickled, second_pickled)
             self.assertEqual(first_pickled, third_pickled)
 
+    def test_reuse_buffer(self):
+        # The output buffer can be reused between frames and dump() calls,
+        # what was passed to write() must not be modified afterwards.
+        class KeepingWriter:
+            def __init__(self):
+                self.chunks = []
+            def write(self, chunk):
+                self.chunks.append(chunk)
+
+        class CopyingWriter(KeepingWriter):
+            def write(self, chunk):
+                self.chunks.append(bytes(chunk))
+
+        objs = [[str(i) * 10 for i in range(20000)],
+                {'a': b'x' * 100000, 'b': list(range(1000))},
+                'small']
+        for proto in protocols:
+            for writer_class in KeepingWriter, CopyingWriter:
+                with self.subTest(proto=proto, writer=writer_class.__name__):
+                    writer = writer_class()
+                    pickler = self.pickler_class(writer, proto,
+                                                 reuse_buffer=True)
+                    for obj in objs:
+                        pickler.clear_memo()
+                        pickler.dump(obj)
+                    for chunk in writer.chunks:
+                        if isinstance(chunk, memoryview):
+                            self.assertTrue(chunk.readonly)
+                    f = io.BytesIO(b''.join(writer.chunks))
+                    unpickler = self.unpickler_class(f)
+                    for obj in objs:
+                        self.assertEqual(unpickler.load(), obj)
+
     def test_priming_pickler_memo(self):
         # Verify that we can set the Pickler's memo attribute.
         data = ["abcdefg", "abcdefg", 44]
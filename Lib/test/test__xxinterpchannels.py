@@ -340,6 +340,19 @@ def test_shareable(self):
         # XXX Check the following in the channel tests?
         #self.assertIsNot(got, obj)
 
+    def test_shareable_after_interpreters_destroyed(self):
+        # Each isolated interpreter registers its own ChannelID type,
+        # which must not outlive the interpreter in the registry.
+        cid = channels.create()
+        for _ in range(3):
+            interp = interpreters.create(isolated=True)
+            interpreters.run_string(interp, 'import _xxinterpchannels')
+            interpreters.destroy(interp)
+
+        self.assertTrue(interpreters.is_shareable(b'spam'))
+        self.assertTrue(interpreters.is_shareable(cid))
+        self.assertFalse(interpreters.is_shareable(object()))
+
 
 class ChannelTests(TestBase):
 
@@ -373,6 +373,163 @@ def test__run_once(self):
         self.assertEqual([h2], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
+    def test_get_stats(self):
+        self.loop._process_events = mock.Mock()
+        stats = self.loop.get_stats()
+        self.assertEqual(stats, {
+            'tasks_created': 0,
+            'tasks_completed_eagerly': 0,
+            'callbacks_run': 0,
+            'callbacks_time': 0.0,
+            'average_callback_time': 0.0,
+            'iterations': 0,
+            'select_time': 0.0,
+        })
+
+        h = self.loop.call_soon(lambda: None)
+        self.loop.call_soon(lambda: None)
+        h.cancel()
+        self.loop._run_once()
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['callbacks_run'], 1)
+        self.assertGreaterEqual(stats['callbacks_time'], 0.0)
+        self.assertEqual(stats['average_callback_time'],
+                         stats['callbacks_time'])
+        self.assertEqual(stats['iterations'], 1)
+        self.assertGreaterEqual(stats['select_time'], 0.0)
+
+    def test_get_stats_debug(self):
+        # The timing of slow callbacks in debug mode must not affect
+        # callbacks_time.
+        self.loop._process_events = mock.Mock()
+        self.loop.set_debug(True)
+        self.loop.time = mock.Mock(return_value=0.0)
+        self.loop.call_soon(lambda: None)
+        self.loop._run_once()
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['callbacks_run'], 1)
+        self.assertLess(stats['callbacks_time'], 1.0)
+
+    def test_get_stats_tasks(self):
+        async def coro():
+            pass
+
+        async def main():
+            self.loop.create_task(coro())
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+            self.loop.create_task(coro())
+            self.loop.set_task_factory(None)
+
+        self.loop._process_events = mock.Mock()
+        self.loop.run_until_complete(main())
+        stats = self.loop.get_stats()
+        # main() is created by run_until_complete().
+        self.assertEqual(stats['tasks_created'], 3)
+        self.assertEqual(stats['tasks_completed_eagerly'], 1)
+        self.assertGreaterEqual(stats['callbacks_run'], 3)
+
+    def test_callback_profiling(self):
+        def slow():
+            time.sleep(0.01)
+
+        def fast():
+            pass
+
+        self.loop._process_events = mock.Mock()
+        self.assertIsNone(self.loop.get_callback_profile())
+        with self.assertRaises(ValueError):
+            self.loop.set_callback_profiling(True, top=-1)
+        self.loop.set_callback_profiling(True, top=2)
+        for callback in (fast, slow, fast, fast):
+            self.loop.call_soon(callback)
+        self.loop._run_once()
+
+        profile = self.loop.get_callback_profile()
+        histogram = profile['histogram']
+        self.assertEqual(sum(count for bound, count in histogram), 4)
+        bounds = [bound for bound, count in histogram]
+        self.assertEqual(bounds, sorted(bounds))
+        self.assertEqual(bounds[-1], float('inf'))
+        # slow() ran for at least 10 ms.
+        self.assertEqual(
+            sum(count for bound, count in histogram if bound > 0.01), 1)
+        slowest = profile['slowest']
+        self.assertEqual(len(slowest), 2)
+        self.assertGreaterEqual(slowest[0][0], 0.01)
+        self.assertIn('slow', slowest[0][1])
+        self.assertIn('test_base_events.py', slowest[0][1])
+        self.assertLessEqual(slowest[1][0], slowest[0][0])
+
+        # Enabling the profiling again resets it.
+        self.loop.set_callback_profiling(True)
+        profile = self.loop.get_callback_profile()
+        self.assertEqual(sum(count for bound, count in profile['histogram']),
+                         0)
+        self.assertEqual(profile['slowest'], [])
+        self.loop.set_callback_profiling(False)
+        self.assertIsNone(self.loop.get_callback_profile())
+
+    def test_callback_profiling_task(self):
+        async def coro():
+            pass
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_callback_profiling(True)
+        self.loop.run_until_complete(coro())
+        profile = self.loop.get_callback_profile()
+        descriptions = [desc for duration, desc in profile['slowest']]
+        self.assertTrue(any('coro' in desc for desc in descriptions),
+                        descriptions)
+
+    def test_timer_wheel(self):
+        calls = []
+        self.loop._process_events = mock.Mock()
+        self.assertIsNone(self.loop.get_timer_wheel_resolution())
+        with self.assertRaises(ValueError):
+            self.loop.set_timer_wheel(0)
+
+        h1 = self.loop.call_later(-1, calls.append, 'a')
+        self.loop.set_timer_wheel(0.001)
+        self.assertEqual(self.loop.get_timer_wheel_resolution(), 0.001)
+        # Already scheduled handles are moved to the wheel.
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(list(self.loop._timer_wheel), [h1])
+
+        self.loop.call_later(-2, calls.append, 'b')
+        h2 = self.loop.call_later(10.0, calls.append, 'c')
+        h3 = self.loop.call_later(-3, calls.append, 'd')
+        h3.cancel()
+        self.assertFalse(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 3)
+
+        self.loop._run_once()
+        self.assertEqual(calls, ['b', 'a'])
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertEqual(t, 0)
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        # The loop may wake up earlier to cascade the wheel.
+        self.assertTrue(0 < t < 10.5, t)
+        self.assertEqual(calls, ['b', 'a'])
+
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop.get_timer_wheel_resolution())
+        self.assertEqual(self.loop._scheduled, [h2])
+        self.assertTrue(h2._scheduled)
+
+    def test_timer_wheel_cancel(self):
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(0.001)
+        handles = [self.loop.call_later(10.0, lambda: None)
+                   for _ in range(10)]
+        for h in handles:
+            h.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertIsNone(t)
+
     def test_set_debug(self):
         self.loop.set_debug(True)
         self.assertTrue(self.loop.get_debug())
@@ -52,6 +52,20 @@ def test_datagram_protocol(self):
         self.assertIsNone(dp.datagram_received(f, f))
         self.assertFalse(hasattr(dp, '__dict__'))
 
+    def test_batched_datagram_protocol(self):
+        f = mock.Mock()
+        dp = asyncio.BatchedDatagramProtocol()
+        self.assertIsInstance(dp, asyncio.DatagramProtocol)
+        self.assertIsNone(dp.connection_made(f))
+        self.assertIsNone(dp.connection_lost(f))
+        self.assertIsNone(dp.error_received(f))
+        self.assertIsNone(dp.datagrams_received([(f, f)]))
+        self.assertFalse(hasattr(dp, '__dict__'))
+
+        dp = mock.Mock(wraps=asyncio.BatchedDatagramProtocol())
+        asyncio.BatchedDatagramProtocol.datagram_received(dp, b'data', f)
+        dp.datagrams_received.assert_called_once_with([(b'data', f)])
+
     def test_subprocess_protocol(self):
         f = mock.Mock()
         sp = asyncio.SubprocessProtocol()
@@ -432,6 +432,106 @@ async def test_cancelled_put_silence_value_error_exception(self):
             await put_task
 
 
+class QueueBatchTests(unittest.IsolatedAsyncioTestCase):
+
+    def test_get_many_nowait(self):
+        q = asyncio.Queue()
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait, 10)
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual([0, 1, 2], q.get_many_nowait(3))
+        self.assertEqual([3, 4], q.get_many_nowait(10))
+        self.assertTrue(q.empty())
+        with self.assertRaises(ValueError):
+            q.get_many_nowait(0)
+
+    async def test_get_many(self):
+        q = asyncio.Queue()
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual([0, 1, 2, 3], await q.get_many(4))
+        self.assertEqual([4], await q.get_many(4))
+        with self.assertRaises(ValueError):
+            await q.get_many(0)
+
+    async def test_get_many_wait(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many(10))
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await q.put_many([1, 2, 3])
+        self.assertEqual([1, 2, 3], await getter)
+
+    async def test_get_many_wakes_putters(self):
+        q = asyncio.Queue(maxsize=2)
+        q.put_nowait(1)
+        q.put_nowait(2)
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4, 5)]
+        await asyncio.sleep(0)
+        self.assertEqual([1, 2], await q.get_many(2))
+        await asyncio.sleep(0)
+        self.assertEqual([3, 4], q.get_many_nowait(10))
+        await asyncio.sleep(0)
+        self.assertEqual([5], q.get_many_nowait(10))
+        await asyncio.gather(*putters)
+
+    def test_put_many_nowait(self):
+        q = asyncio.Queue(maxsize=3)
+        q.put_many_nowait([1, 2])
+        self.assertEqual(2, q.qsize())
+        self.assertRaises(asyncio.QueueFull, q.put_many_nowait, [3, 4])
+        self.assertEqual(2, q.qsize())
+        q.put_many_nowait([3])
+        self.assertTrue(q.full())
+        self.assertEqual([1, 2, 3], q.get_many_nowait(3))
+
+    async def test_put_many(self):
+        q = asyncio.Queue()
+        await q.put_many(range(3))
+        await q.put_many(iter([]))
+        self.assertEqual(3, q.qsize())
+        self.assertEqual(3, q._unfinished_tasks)
+        self.assertEqual([0, 1, 2], q.get_many_nowait(10))
+
+    async def test_put_many_wait(self):
+        q = asyncio.Queue(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual([0, 1], q.get_many_nowait(10))
+        received = []
+        while len(received) < 3:
+            received.extend(await q.get_many(10))
+        self.assertEqual([2, 3, 4], received)
+        await putter
+        self.assertEqual(5, q._unfinished_tasks)
+
+    async def test_put_many_wakes_getters(self):
+        q = asyncio.Queue()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await q.put_many([1, 2])
+        self.assertEqual({1, 2}, set(await asyncio.gather(*getters[:2])))
+        self.assertFalse(getters[2].done())
+        q.put_nowait(3)
+        self.assertEqual(3, await getters[2])
+
+    async def test_put_many_cancelled(self):
+        q = asyncio.Queue(maxsize=1)
+        putter = asyncio.create_task(q.put_many([1, 2, 3]))
+        await asyncio.sleep(0)
+        putter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await putter
+        self.assertEqual([1], q.get_many_nowait(10))
+        self.assertEqual(1, q._unfinished_tasks)
+
+    async def test_priority_queue(self):
+        q = asyncio.PriorityQueue()
+        await q.put_many([3, 1, 2])
+        self.assertEqual([1, 2, 3], await q.get_many(3))
+
+
 class LifoQueueTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_order(self):
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import array
 import collections
 import selectors
 import socket
@@ -805,6 +806,72 @@ def test_writelines_send_partial(self):
         self.assertTrue(self.sock.send.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_no_concatenation(self):
+        header = b'header'
+        body = bytearray(b'body')
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 0
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([header, b'', body])
+        self.assertTrue(self.sock.sendmsg.called)
+        # Each chunk is buffered separately as a view on the original data.
+        self.assertEqual(list_to_buffer([header, body]), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 10)
+        self.loop.assert_writer(7, transport._write_ready)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_buffer_not_empty(self):
+        self.sock.sendmsg = mock.Mock()
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(memoryview(b'data1'))
+        transport.writelines([b'data2', b'data3'])
+        # A write handler is already pending: the data is only buffered.
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_buffer([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+
+    def test_writelines_empty(self):
+        transport = self.socket_transport()
+        transport.writelines([])
+        transport.writelines([b'', bytearray()])
+        transport.writelines(iter([]))
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_generator(self):
+        self.sock.send.return_value = 0
+        transport = self.socket_transport()
+        transport.writelines(chunk for chunk in [b'data1', b'data2'])
+        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+                         transport._buffer)
+        self.loop.assert_writer(7, transport._write_ready)
+
+    def test_writelines_non_byte_format(self):
+        self.sock.send.return_value = 0
+        transport = self.socket_transport()
+        data = array.array('i', [1, 2])
+        transport.writelines([data])
+        self.assertEqual(transport.get_write_buffer_size(), data.itemsize * 2)
+
+    def test_writelines_pause_protocol(self):
+        self.sock.send.return_value = 0
+        transport = self.socket_transport()
+        transport.set_write_buffer_limits(high=4)
+        transport.writelines([b'data1', b'data2'])
+        self.assertTrue(self.protocol.pause_writing.called)
+
+    @mock.patch('asyncio.selector_events.logger')
+    def test_writelines_conn_lost(self, m_log):
+        transport = self.socket_transport()
+        transport._conn_lost = 1
+        transport.writelines([b'data'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport._conn_lost, 2)
+
     @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
     def test_write_sendmsg_full(self):
         data = memoryview(b'data')
@@ -1254,6 +1321,76 @@ def test_read_ready_oserr(self):
         self.assertFalse(transport._fatal_error.called)
         self.protocol.error_received.assert_called_with(err)
 
+    def test_read_ready_batched(self):
+        self.protocol = test_utils.make_test_protocol(
+            asyncio.BatchedDatagramProtocol)
+        transport = self.datagram_transport()
+
+        addr = ('0.0.0.0', 1234)
+        self.sock.recvfrom.side_effect = [(b'data1', addr), (b'data2', addr),
+                                          BlockingIOError]
+        transport._read_ready()
+
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data1', addr), (b'data2', addr)])
+        self.assertFalse(self.protocol.datagram_received.called)
+
+    def test_read_ready_batched_max_batch(self):
+        self.protocol = test_utils.make_test_protocol(
+            asyncio.BatchedDatagramProtocol)
+        transport = self.datagram_transport()
+        transport.max_batch = 2
+
+        addr = ('0.0.0.0', 1234)
+        self.sock.recvfrom.return_value = (b'data', addr)
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recvfrom.call_count, 2)
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data', addr), (b'data', addr)])
+
+    def test_read_ready_batched_tryagain(self):
+        self.protocol = test_utils.make_test_protocol(
+            asyncio.BatchedDatagramProtocol)
+        transport = self.datagram_transport()
+
+        self.sock.recvfrom.side_effect = BlockingIOError
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.assertFalse(transport._fatal_error.called)
+        self.assertFalse(self.protocol.datagrams_received.called)
+
+    def test_read_ready_batched_oserr(self):
+        self.protocol = test_utils.make_test_protocol(
+            asyncio.BatchedDatagramProtocol)
+        transport = self.datagram_transport()
+
+        addr = ('0.0.0.0', 1234)
+        err = OSError()
+        self.sock.recvfrom.side_effect = [(b'data', addr), err]
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.assertFalse(transport._fatal_error.called)
+        self.protocol.datagrams_received.assert_called_once_with(
+            [(b'data', addr)])
+        self.protocol.error_received.assert_called_with(err)
+
+    def test_read_ready_batched_err(self):
+        self.protocol = test_utils.make_test_protocol(
+            asyncio.BatchedDatagramProtocol)
+        transport = self.datagram_transport()
+
+        err = self.sock.recvfrom.side_effect = RuntimeError()
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal read error on datagram transport')
+        self.assertFalse(self.protocol.datagrams_received.called)
+
     def test_sendto(self):
         data = b'data'
         transport = self.datagram_transport()
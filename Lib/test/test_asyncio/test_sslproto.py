@@ -160,6 +160,67 @@ def test_write_after_closing(self):
         self.assertIsNone(transp.write(b'data'))
 
 
+    def test_write_coalesces_small_chunks(self):
+        ssl_proto = self.ssl_protocol()
+        self.connection_made(ssl_proto)
+        ssl_proto._sslobj.write.side_effect = len
+        self.assertEqual(ssl_proto._state, sslproto.SSLProtocolState.WRAPPED)
+
+        big = b'b' * sslproto._MAX_RECORD_SIZE
+        ssl_proto._write_appdata([b'a' * 10, b'a' * 20, big, b'c'])
+
+        writes = [bytes(c.args[0])
+                  for c in ssl_proto._sslobj.write.call_args_list]
+        self.assertEqual(writes, [b'a' * 30, big, b'c'])
+        self.assertEqual(ssl_proto._write_buffer_size, 0)
+        self.assertFalse(ssl_proto._write_backlog)
+
+    def test_write_partial(self):
+        ssl_proto = self.ssl_protocol()
+        self.connection_made(ssl_proto)
+        ssl_proto._sslobj.write.side_effect = [2, ssl.SSLWantReadError]
+        self.assertEqual(ssl_proto._state, sslproto.SSLProtocolState.WRAPPED)
+
+        ssl_proto._write_appdata([b'data'])
+        self.assertEqual(list(ssl_proto._write_backlog), [b'ta'])
+        self.assertEqual(ssl_proto._write_buffer_size, 2)
+
+    def test_read_copied(self):
+        app_proto = mock.Mock(spec=asyncio.Protocol)
+        ssl_proto = self.ssl_protocol(proto=app_proto)
+        self.connection_made(ssl_proto)
+        self.assertEqual(ssl_proto._state, sslproto.SSLProtocolState.WRAPPED)
+
+        records = [b'rec1', b'rec2']
+        sizes = []
+        def read(n, buf):
+            sizes.append(len(buf))
+            if not records:
+                raise ssl.SSLWantReadError
+            data = records.pop(0)
+            buf[:len(data)] = data
+            return len(data)
+
+        ssl_proto._sslobj.read.side_effect = read
+        ssl_proto._sslobj.pending.return_value = 0
+        # Encrypted records waiting to be decrypted
+        ssl_proto._incoming.write(b'x' * 20)
+        ssl_proto._do_read()
+        # Records decrypted in a row are delivered at once.
+        app_proto.data_received.assert_called_once_with(b'rec1rec2')
+        self.assertIsInstance(app_proto.data_received.call_args.args[0],
+                              bytes)
+        # The read buffer is sized for the pending data.
+        self.assertEqual(sizes, [21, 17, 13])
+
+        records.append(b'rec3')
+        sizes.clear()
+        ssl_proto._sslobj.pending.return_value = 4
+        ssl_proto._do_read()
+        app_proto.data_received.assert_called_with(b'rec3')
+        self.assertEqual(sizes[0], 25)
+
+
 ##############################################################################
 # Start TLS Tests
 ##############################################################################
@@ -534,6 +534,55 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(8)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        nbytes = self.loop.run_until_complete(read_task)
+        self.assertEqual(8, nbytes)
+        self.assertEqual(self.DATA[:8], buf)
+        self.assertEqual(self.DATA[8:], stream._buffer)
+
+    def test_readinto_short(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk')
+        buf = bytearray(10)
+        nbytes = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(5, nbytes)
+        self.assertEqual(b'chunk', buf[:nbytes])
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto_zero(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        nbytes = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(0, nbytes)
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(4)))
+
+        def cb():
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        nbytes = self.loop.run_until_complete(read_task)
+        self.assertEqual(0, nbytes)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line\n')
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -770,6 +819,56 @@ async def client(addr):
         self.assertEqual(msg1, b"hello world 1!\n")
         self.assertEqual(msg2, b"hello world 2!\n")
 
+    def test_buffered_protocol(self):
+        reader = asyncio.StreamReader(limit=4, loop=self.loop)
+        protocol = asyncio.BufferedStreamReaderProtocol(reader,
+                                                        loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        buf = protocol.get_buffer(-1)
+        self.assertEqual(4, len(buf))
+        buf[:3] = b'abc'
+        protocol.buffer_updated(3)
+        # The receive buffer is reused for the next chunk.
+        self.assertIs(buf, protocol.get_buffer(-1))
+        buf[:2] = b'de'
+        protocol.buffer_updated(2)
+        protocol.eof_received()
+
+        data = self.loop.run_until_complete(reader.read())
+        self.assertEqual(b'abcde', data)
+
+    def test_buffered_protocol_buffer_size(self):
+        reader = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.BufferedStreamReaderProtocol(
+            reader, loop=self.loop, buffer_size=16)
+        self.assertEqual(16, len(protocol.get_buffer(-1)))
+        with self.assertRaises(ValueError):
+            asyncio.BufferedStreamReaderProtocol(
+                reader, loop=self.loop, buffer_size=0)
+
+    def test_buffered_protocol_connection(self):
+        with test_utils.run_test_server() as httpd:
+            async def client():
+                loop = asyncio.get_running_loop()
+                reader = asyncio.StreamReader(loop=loop)
+                protocol = asyncio.BufferedStreamReaderProtocol(reader,
+                                                                loop=loop)
+                transport, _ = await loop.create_connection(
+                    lambda: protocol, *httpd.address)
+                writer = asyncio.StreamWriter(transport, protocol, reader,
+                                              loop)
+                writer.write(b'GET / HTTP/1.0\r\n\r\n')
+                line = await reader.readline()
+                rest = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+                return line, rest
+
+            line, rest = self.loop.run_until_complete(client())
+            self.assertEqual(line, b'HTTP/1.0 200 OK\r\n')
+            self.assertTrue(rest.endswith(b'\r\n\r\nTest message'))
+
     @unittest.skipIf(sys.platform == 'win32', "Don't have pipes")
     def test_read_all_from_pipe_reader(self):
         # See asyncio issue 168.  This test is derived from the example
@@ -1075,5 +1174,161 @@ def test_eof_feed_when_closing_writer(self):
         self.assertEqual(messages, [])
 
 
+
+class ConnectionPoolTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.connections = 0
+
+        async def handle(reader, writer):
+            self.connections += 1
+            while line := await reader.readline():
+                writer.write(line)
+            writer.close()
+            await writer.wait_closed()
+
+        self.server = await asyncio.start_server(
+            handle, socket_helper.HOSTv4, 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def echo(self, reader, writer, data):
+        writer.write(data)
+        return await reader.readline()
+
+    async def test_reuse(self):
+        async with asyncio.ConnectionPool() as pool:
+            for _ in range(3):
+                async with pool.connection(socket_helper.HOSTv4,
+                                           self.port) as (reader, writer):
+                    self.assertEqual(b'ping\n',
+                                     await self.echo(reader, writer,
+                                                     b'ping\n'))
+        self.assertEqual(1, self.connections)
+
+    async def test_acquire_concurrently(self):
+        async with asyncio.ConnectionPool(max_size=1) as pool:
+            r1, w1 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            r2, w2 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            self.assertIsNot(w1, w2)
+            pool.release(w1)
+            # The pool is full: the second connection is closed.
+            pool.release(w2)
+            self.assertTrue(w2.is_closing())
+            self.assertFalse(w1.is_closing())
+            r3, w3 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            self.assertIs(w3, w1)
+            pool.release(w3)
+        self.assertTrue(w1.is_closing())
+
+    async def test_discard_on_error(self):
+        async with asyncio.ConnectionPool() as pool:
+            with self.assertRaises(ZeroDivisionError):
+                async with pool.connection(socket_helper.HOSTv4,
+                                           self.port) as (reader, writer):
+                    1/0
+            self.assertTrue(writer.is_closing())
+            async with pool.connection(socket_helper.HOSTv4, self.port):
+                pass
+        self.assertEqual(2, self.connections)
+
+    async def test_unusable_connection(self):
+        async with asyncio.ConnectionPool() as pool:
+            reader, writer = await pool.acquire(socket_helper.HOSTv4,
+                                                self.port)
+            # Pending unread data: the connection is not reusable.
+            writer.write(b'ping\n')
+            await writer.drain()
+            while not reader._buffer:
+                await asyncio.sleep(0.01)
+            pool.release(writer)
+            self.assertTrue(writer.is_closing())
+
+    async def test_idle_timeout(self):
+        async with asyncio.ConnectionPool(idle_timeout=0.01) as pool:
+            reader, writer = await pool.acquire(socket_helper.HOSTv4,
+                                                self.port)
+            pool.release(writer)
+            await asyncio.sleep(0.05)
+            r2, w2 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            self.assertIsNot(w2, writer)
+            self.assertTrue(writer.is_closing())
+            pool.release(w2)
+
+    async def test_idle_timeout_unused_pool(self):
+        # Idle connections are closed even if the pool is not used.
+        async with asyncio.ConnectionPool(idle_timeout=0.01) as pool:
+            r1, w1 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            r2, w2 = await pool.acquire(socket_helper.HOSTv4, self.port)
+            pool.release(w1)
+            await asyncio.sleep(0.005)
+            pool.release(w2)
+            for _ in range(100):
+                if w1.is_closing() and w2.is_closing():
+                    break
+                await asyncio.sleep(0.01)
+            self.assertTrue(w1.is_closing())
+            self.assertTrue(w2.is_closing())
+            self.assertIsNone(pool._evict_handle)
+
+    async def test_close_cancels_eviction(self):
+        pool = asyncio.ConnectionPool()
+        reader, writer = await pool.acquire(socket_helper.HOSTv4, self.port)
+        pool.release(writer)
+        handle = pool._evict_handle
+        self.assertIsNotNone(handle)
+        await pool.close()
+        self.assertTrue(handle.cancelled())
+
+    async def test_release_unknown(self):
+        async with asyncio.ConnectionPool() as pool:
+            reader, writer = await asyncio.open_connection(
+                socket_helper.HOSTv4, self.port)
+            with self.assertRaises(ValueError):
+                pool.release(writer)
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_closed(self):
+        pool = asyncio.ConnectionPool()
+        reader, writer = await pool.acquire(socket_helper.HOSTv4, self.port)
+        await pool.close()
+        with self.assertRaises(RuntimeError):
+            await pool.acquire(socket_helper.HOSTv4, self.port)
+        pool.release(writer)
+        self.assertTrue(writer.is_closing())
+
+    async def test_dns_cache(self):
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, 'getaddrinfo',
+                               wraps=loop.getaddrinfo) as getaddrinfo:
+            async with asyncio.ConnectionPool(max_size=0) as pool:
+                for _ in range(2):
+                    async with pool.connection('localhost', self.port):
+                        pass
+                self.assertEqual(1, getaddrinfo.call_count)
+                pool.clear_dns_cache()
+                async with pool.connection('localhost', self.port):
+                    pass
+                self.assertEqual(2, getaddrinfo.call_count)
+
+            async with asyncio.ConnectionPool(max_size=0,
+                                              dns_ttl=0) as pool:
+                for _ in range(2):
+                    async with pool.connection('localhost', self.port):
+                        pass
+                self.assertEqual(4, getaddrinfo.call_count)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(max_size=-1)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(idle_timeout=0)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(dns_ttl=-1)
+
 if __name__ == '__main__':
     unittest.main()
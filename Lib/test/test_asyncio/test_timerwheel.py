@@ -0,0 +1,154 @@
+"""Tests for timerwheel.py"""
+
+import random
+import unittest
+from unittest import mock
+
+import asyncio
+from asyncio import timerwheel
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = mock.Mock()
+
+    def handle(self, when):
+        return asyncio.TimerHandle(when, lambda: None, (), self.loop, None)
+
+    def test_ctor(self):
+        with self.assertRaises(ValueError):
+            timerwheel.TimerWheel(0, 0.0)
+        wheel = timerwheel.TimerWheel(0.001, 10.0)
+        self.assertEqual(wheel.resolution, 0.001)
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+        self.assertEqual(wheel.pop_expired(20.0), [])
+
+    def test_push_pop(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        h1 = self.handle(0.0105)
+        h2 = self.handle(0.0101)
+        h3 = self.handle(5.0)
+        for h in (h1, h2, h3):
+            wheel.push(h)
+        self.assertEqual(len(wheel), 3)
+        self.assertCountEqual(wheel, [h1, h2, h3])
+
+        self.assertEqual(wheel.pop_expired(0.005), [])
+        # Timers of the current tick expire individually.
+        self.assertEqual(wheel.pop_expired(0.0102), [h2])
+        self.assertEqual(wheel.pop_expired(0.011), [h1])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_expired(4.999), [])
+        self.assertEqual(wheel.pop_expired(5.001), [h3])
+        self.assertEqual(len(wheel), 0)
+
+    def test_past_deadline(self):
+        wheel = timerwheel.TimerWheel(0.001, 10.0)
+        h = self.handle(9.0)
+        wheel.push(h)
+        self.assertEqual(wheel.next_deadline(), 9.0)
+        self.assertEqual(wheel.pop_expired(10.0), [h])
+
+    def test_discard(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        handles = [self.handle(when) for when in (0.002, 1.0, 100.0, 1e5,
+                                                  1e8)]
+        for h in handles:
+            wheel.push(h)
+        for h in handles:
+            wheel.discard(h)
+            h._cancelled = True
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(list(wheel), [])
+        self.assertEqual(wheel.pop_expired(1e9), [])
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_equal_handles(self):
+        # TimerHandle equality compares attributes, make sure that distinct
+        # handles don't replace each other.
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        callback = lambda: None
+        h1 = asyncio.TimerHandle(1.0, callback, (), self.loop, None)
+        h2 = asyncio.TimerHandle(1.0, callback, (), self.loop, None)
+        self.assertEqual(h1, h2)
+        wheel.push(h1)
+        wheel.push(h2)
+        wheel.discard(h1)
+        expired = wheel.pop_expired(2.0)
+        self.assertEqual(len(expired), 1)
+        self.assertIs(expired[0], h2)
+
+    def test_next_deadline(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        wheel.push(self.handle(0.0105))
+        wheel.push(self.handle(0.0103))
+        self.assertEqual(wheel.next_deadline(), 0.0103)
+
+        # Far timers wake up the loop when they must be cascaded.
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        wheel.push(self.handle(100.0))
+        deadlines = []
+        while (deadline := wheel.next_deadline()) != 100.0:
+            self.assertLess(deadline, 100.0)
+            self.assertEqual(wheel.pop_expired(deadline), [])
+            deadlines.append(deadline)
+        # One wakeup per level.
+        self.assertLessEqual(len(deadlines), timerwheel._LEVELS)
+        self.assertEqual(deadlines, sorted(deadlines))
+
+    def test_overflow(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        far = self.handle(1e8)
+        farther = self.handle(2e8)
+        wheel.push(farther)
+        wheel.push(far)
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.pop_expired(1e8 - 1), [])
+        self.assertEqual(wheel.pop_expired(1e8 + 1), [far])
+        self.assertEqual(wheel.pop_expired(3e8), [farther])
+
+    def test_clear(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        wheel.push(self.handle(1.0))
+        wheel.push(self.handle(1e8))
+        wheel.clear()
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.pop_expired(1e9), [])
+
+    def test_random_order(self):
+        rng = random.Random(42)
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        handles = [self.handle(rng.expovariate(0.01)) for _ in range(2000)]
+        cancelled = set()
+        for h in handles:
+            wheel.push(h)
+        for h in rng.sample(handles, 500):
+            wheel.discard(h)
+            h._cancelled = True
+            cancelled.add(id(h))
+
+        now = 0.0
+        expired = []
+        while len(wheel):
+            deadline = wheel.next_deadline()
+            self.assertIsNotNone(deadline)
+            # Simulate loop iterations which wake up late or early.
+            now = max(now, deadline) + rng.choice([0, 0.0005, 0.3, 7.0])
+            for h in wheel.pop_expired(now):
+                self.assertLess(h.when(), now)
+                expired.append(h)
+
+        expected = sorted((h for h in handles if id(h) not in cancelled),
+                          key=lambda h: h.when())
+        self.assertEqual([h.when() for h in expired],
+                         [h.when() for h in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@
 from test.support import hashlib_helper
 from test.support.script_helper import assert_python_ok
 
+import array
 import contextlib
 import itertools
 import logging
@@ -20,6 +21,7 @@
 import time
 import unittest
 import weakref
+import pickle
 from pickle import PicklingError
 
 from concurrent import futures
@@ -27,6 +29,10 @@
     PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future,
     BrokenExecutor)
 from concurrent.futures.process import BrokenProcessPool, _check_system_limits
+try:
+    from concurrent.futures.interpreter import InterpreterPoolExecutor
+except ImportError:
+    InterpreterPoolExecutor = None
 
 import multiprocessing.process
 import multiprocessing.util
@@ -78,6 +84,9 @@ def init(x):
 def get_init_status():
     return INITIALIZER_STATUS
 
+def get_bytes(size):
+    return b'x' * size
+
 def init_fail(log_queue=None):
     if log_queue is not None:
         logger = logging.getLogger('concurrent.futures')
@@ -88,6 +97,11 @@ def init_fail(log_queue=None):
     raise ValueError('error in initializer')
 
 
+class UnpicklableError(Exception):
+    def __reduce__(self):
+        raise TypeError('cannot pickle UnpicklableError')
+
+
 class MyObject(object):
     def my_method(self):
         pass
@@ -151,6 +165,19 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ThreadPoolMixin):
+    executor_kwargs = {'work_stealing': True}
+
+
+class InterpreterPoolMixin(ExecutorMixin):
+    executor_type = InterpreterPoolExecutor
+
+    def setUp(self):
+        if self.executor_type is None:
+            self.skipTest("InterpreterPoolExecutor requires subinterpreters")
+        super().setUp()
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
@@ -193,6 +220,8 @@ def get_context(self):
 
 def create_executor_tests(mixin, bases=(BaseTestCase,),
                           executor_mixins=(ThreadPoolMixin,
+                                           WorkStealingThreadPoolMixin,
+                                           InterpreterPoolMixin,
                                            ProcessPoolForkMixin,
                                            ProcessPoolForkserverMixin,
                                            ProcessPoolSpawnMixin)):
@@ -873,6 +902,71 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    def test_map_buffersize(self):
+        ref = list(map(pow, range(40), range(40)))
+        for buffersize in (1, 2, 100):
+            self.assertEqual(
+                list(self.executor.map(pow, range(40), range(40),
+                                       buffersize=buffersize)),
+                ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=3,
+                                   buffersize=2)),
+            ref)
+
+    def test_map_buffersize_validation(self):
+        for buffersize in (0, -1):
+            with self.assertRaisesRegex(ValueError, "buffersize"):
+                self.executor.map(str, range(4), buffersize=buffersize)
+            with self.assertRaisesRegex(ValueError, "buffersize"):
+                self.executor.map_unordered(str, range(4),
+                                            buffersize=buffersize)
+        with self.assertRaisesRegex(TypeError, "buffersize"):
+            self.executor.map(str, range(4), buffersize=2.0)
+
+    def test_map_buffersize_lazy(self):
+        # An infinite iterable is consumed as results are yielded.
+        it = itertools.count()
+        results = self.executor.map(str, it, buffersize=2)
+        self.assertEqual(next(results), '0')
+        self.assertEqual(next(results), '1')
+        results.close()
+        self.assertLessEqual(next(it), 5)
+
+        it = itertools.count()
+        results = self.executor.map_unordered(str, it, buffersize=2)
+        # Results are yielded as they complete: a call submitted after
+        # the first result was yielded may complete before the second one.
+        first, second = next(results), next(results)
+        self.assertNotEqual(first, second)
+        self.assertLessEqual({first, second}, {'0', '1', '2'})
+        results.close()
+        self.assertLessEqual(next(it), 5)
+
+    def test_map_unordered(self):
+        ref = sorted(map(pow, range(40), range(40)))
+        for buffersize in (None, 1, 3):
+            self.assertEqual(
+                sorted(self.executor.map_unordered(pow, range(40), range(40),
+                                                   buffersize=buffersize)),
+                ref)
+        self.assertEqual(
+            sorted(self.executor.map_unordered(pow, range(40), range(40),
+                                               chunksize=3, buffersize=2)),
+            ref)
+
+    def test_map_unordered_exception(self):
+        results = self.executor.map_unordered(divmod, [1, 1], [0, 0])
+        self.assertRaises(ZeroDivisionError, next, results)
+
+    def test_map_unordered_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            for i in self.executor.map_unordered(time.sleep, [0, 0, 6],
+                                                 timeout=5):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -929,6 +1023,26 @@ def test_default_workers(self):
         expected = min(32, (os.cpu_count() or 1) + 4)
         self.assertEqual(executor._max_workers, expected)
 
+    @support.cpython_only
+    def test_map_unordered_no_reference_cycles(self):
+        # The futures left in the queue of completed futures are freed
+        # when the iterator is closed, without the help of the GC.
+        refs = []
+        class Executor(self.executor_type):
+            def submit(self, *args, **kwargs):
+                future = super().submit(*args, **kwargs)
+                refs.append(weakref.ref(future))
+                return future
+
+        with support.disable_gc():
+            executor = Executor(2)
+            results = executor.map_unordered(abs, range(3))
+            next(results)
+            executor.shutdown(wait=True)
+            del results
+            self.assertEqual(len(refs), 3)
+            self.assertEqual([ref() for ref in refs], [None] * 3)
+
     def test_saturation(self):
         executor = self.executor_type(4)
         def acquire_lock(lock):
@@ -992,6 +1106,127 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class WorkStealingThreadPoolExecutorTest(WorkStealingThreadPoolMixin,
+                                         ThreadPoolExecutorTest):
+    def test_steal(self):
+        executor = self.executor_type(2, work_stealing=True)
+
+        def spawn():
+            # These calls are pushed to the local queue of this worker,
+            # which waits for them: the other worker must steal them.
+            fs = [executor.submit(mul, i, 2) for i in range(10)]
+            futures.wait(fs, timeout=support.SHORT_TIMEOUT)
+            return fs
+
+        try:
+            fs = executor.submit(spawn).result()
+            self.assertEqual([f.result() for f in fs],
+                             [i * 2 for i in range(10)])
+            self.assertEqual(executor.get_stats()['steals'], 10)
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_get_stats(self):
+        stats = self.executor.get_stats()
+        self.assertEqual(stats['tasks_completed'], 0)
+        self.assertEqual(stats['average_run_time'], 0.0)
+        self.executor.submit(time.sleep, 0.01).result()
+        list(self.executor.map(pow, range(10), range(10)))
+        stats = self.executor.get_stats()
+        # The worker can be interrupted before updating the counters.
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            stats = self.executor.get_stats()
+            if stats['tasks_completed'] == 11:
+                break
+        self.assertGreaterEqual(stats['run_time'], 0.01)
+        self.assertGreaterEqual(stats['queue_wait_time'], 0.0)
+        self.assertGreaterEqual(stats['threads'], 1)
+        self.assertAlmostEqual(stats['average_run_time'],
+                               stats['run_time'] / 11)
+
+
+class IdleTimeoutTests:
+    def test_idle_timeout(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(idle_timeout=0)
+        executor = self.executor_type(3, idle_timeout=0.05,
+                                      **self.executor_kwargs)
+        try:
+            barrier = threading.Barrier(3)
+            fs = [executor.submit(barrier.wait, support.SHORT_TIMEOUT)
+                  for _ in range(3)]
+            for f in fs:
+                f.result()
+            self.assertEqual(executor.get_stats()['threads'], 3)
+            for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                if not executor._threads:
+                    break
+            # Threads are started again for new calls.
+            self.assertEqual(executor.submit(pow, 2, 5).result(), 32)
+            self.assertEqual(executor.get_stats()['threads'], 1)
+        finally:
+            executor.shutdown(wait=True)
+        # The retired threads are joined too.
+        for t in executor._threads | executor._retired_threads:
+            self.assertFalse(t.is_alive())
+
+
+class ThreadPoolIdleTimeoutTest(ThreadPoolMixin, IdleTimeoutTests,
+                                BaseTestCase):
+    pass
+
+
+class WorkStealingThreadPoolIdleTimeoutTest(WorkStealingThreadPoolMixin,
+                                            IdleTimeoutTests, BaseTestCase):
+    pass
+
+
+class InterpreterPoolExecutorTest(InterpreterPoolMixin, ExecutorTest,
+                                  BaseTestCase):
+    def test_bytes(self):
+        # Large bytes arguments and results are passed as separate objects.
+        data = os.urandom(100_000)
+        future = self.executor.submit(capture, data, b'small', key=data)
+        self.assertEqual(future.result(), ((data, b'small'), {'key': data}))
+        self.assertEqual(self.executor.submit(get_bytes, 10).result(),
+                         b'x' * 10)
+        self.assertEqual(self.executor.submit(get_bytes, 100_000).result(),
+                         b'x' * 100_000)
+
+    def test_out_of_band_buffers(self):
+        buffers = [pickle.PickleBuffer(b'abc' * 1000),
+                   pickle.PickleBuffer(bytearray(b'def' * 1000)),
+                   pickle.PickleBuffer(memoryview(b'ghi' * 1000)[1:])]
+        args, kwargs = self.executor.submit(capture, *buffers).result()
+        self.assertEqual([bytes(arg) for arg in args],
+                         [b'abc' * 1000, b'def' * 1000, (b'ghi' * 1000)[1:]])
+
+    def test_exception(self):
+        future = self.executor.submit(divmod, 1, 0)
+        with self.assertRaises(ZeroDivisionError) as cm:
+            future.result()
+        cause = cm.exception.__cause__
+        self.assertIn('ZeroDivisionError', str(cause))
+
+    def test_unpicklable_exception(self):
+        future = self.executor.submit(_raise_error, UnpicklableError)
+        with self.assertRaises(RuntimeError) as cm:
+            future.result()
+        self.assertIn('UnpicklableError', str(cm.exception))
+
+    def test_isolation(self):
+        # Each worker has its own interpreter and its own modules.
+        global INITIALIZER_STATUS
+        INITIALIZER_STATUS = 'main'
+        self.assertEqual(self.executor.submit(init, 'sub').result(), None)
+        self.assertEqual(INITIALIZER_STATUS, 'main')
+
+    def test_unpicklable_callable(self):
+        future = self.executor.submit(lambda: None)
+        with self.assertRaises((PicklingError, AttributeError)):
+            future.result()
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -1028,6 +1263,41 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_chunksize_auto(self):
+        ref = list(map(pow, range(1000), range(1000)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize="auto")),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize="auto", buffersize=1)),
+            ref)
+        self.assertEqual(
+            sorted(self.executor.map_unordered(pow, range(1000), range(1000),
+                                               chunksize="auto")),
+            sorted(ref))
+        results = self.executor.map(divmod, [1, 1, 1], [2, 0, 5],
+                                    chunksize="auto")
+        self.assertEqual(next(results), (0, 1))
+        self.assertRaises(ZeroDivisionError, next, results)
+
+    def test_adaptive_chunker(self):
+        chunker = futures.process._AdaptiveChunker(range(100000))
+        chunks = iter(chunker)
+        self.assertEqual(next(chunks), ((0,),))
+        # Fast calls: the chunks grow progressively.
+        chunker.record(1, 1e-7)
+        self.assertEqual(chunker.chunksize, 2)
+        self.assertEqual(next(chunks), ((1,), (2,)))
+        for _ in range(30):
+            chunker.record(chunker.chunksize, 1e-7 * chunker.chunksize)
+        self.assertEqual(chunker.chunksize, futures.process._AUTO_CHUNK_MAX)
+        # Slow calls: the chunks shrink immediately.
+        chunker.record(2, 10.0)
+        self.assertEqual(chunker.chunksize, 1)
+        self.assertEqual(len(next(chunks)), 1)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -1136,6 +1406,63 @@ def test_max_tasks_per_child(self):
 
         executor.shutdown()
 
+    @unittest.skipIf(sys.platform == 'win32', 'not supported on Windows')
+    def test_shared_memory_threshold(self):
+        for threshold in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(1, shared_memory_threshold=threshold)
+        with self.assertRaises(TypeError):
+            self.executor_type(1, shared_memory_threshold=1.5)
+
+        executor = self.executor_type(
+                2, mp_context=self.get_context(),
+                shared_memory_threshold=1024)
+        self.addCleanup(executor.shutdown)
+        data = bytes(range(256)) * 1024
+        self.assertEqual(executor.submit(bytes, data).result(), data)
+        self.assertEqual(executor.submit(bytearray, data).result(),
+                         bytearray(data))
+        doubles = array.array('d', range(10000))
+        self.assertEqual(executor.submit(array.array, 'd', doubles).result(),
+                         doubles)
+        view = executor.submit(memoryview, doubles).result()
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(view.tolist(), doubles.tolist())
+        # Nested and small buffers.
+        self.assertEqual(executor.submit(list, (data, b'small')).result(),
+                         [data, b'small'])
+        self.assertEqual(executor.submit(pow, 2, 8).result(), 256)
+        self.assertEqual(
+            list(executor.map(bytes, [data] * 5, chunksize=2)), [data] * 5)
+        with self.assertRaises(TypeError):
+            executor.submit(divmod, data, 0).result()
+        # The segments of the arguments are reused.
+        self.assertGreater(executor._shared_memory_pool._nfree, 0)
+        self.assertEqual(executor._shared_memory_pool._in_use, {})
+        executor.shutdown()
+        self.assertEqual(executor._shared_memory_pool._nfree, 0)
+
+    @unittest.skipIf(sys.platform == 'win32', 'not supported on Windows')
+    def test_dump_shared(self):
+        segments = []
+        def allocate(size):
+            shm = futures.process._create_segment(size)
+            segments.append(shm)
+            return shm
+
+        data = b'x' * 100
+        obj = {'a': data, 'b': [1, 2]}
+        self.assertEqual(futures.process._dump_shared(obj, 1000, allocate),
+                         (obj, None))
+        message, shm = futures.process._dump_shared(obj, 50, allocate)
+        self.assertEqual(segments, [shm])
+        self.assertNotIn(data, message.data)
+        try:
+            self.assertEqual(message.load(), obj)
+        finally:
+            shm.close()
+            shm.unlink()
+
     def test_max_tasks_per_child_defaults_to_spawn_context(self):
         # not using self.executor as we need to control construction.
         # arguably this could go in another class w/o that mixin.
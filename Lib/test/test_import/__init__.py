@@ -1832,6 +1832,29 @@ def test_single_init_extension_compat(self):
         with self.subTest(f'{module}: strict, fresh'):
             self.check_incompatible_fresh(module)
 
+    @requires_singlephase_init
+    def test_single_init_extension_not_added(self):
+        # The module dict of a single-phase init module holds objects of
+        # the main interpreter: it must not be copied into a subinterpreter
+        # which does not support the module.
+        module = '_testsinglephase'
+        require_extension(module)
+        __import__(module)
+        r, w = self.pipe()
+        script = textwrap.dedent(f'''
+            import os, sys
+            try:
+                import {module}
+            except ImportError:
+                pass
+            os.write({w}, repr({module!r} in sys.modules).encode())
+            ''')
+        ret = run_in_subinterp_with_config(
+            script, **self.RUN_KWARGS, **self.ISOLATED,
+            check_multi_interp_extensions=True)
+        self.assertEqual(ret, 0)
+        self.assertEqual(os.read(r, 100), b'False')
+
     @unittest.skipIf(_testmultiphase is None, "test requires _testmultiphase module")
     def test_multi_init_extension_compat(self):
         module = '_testmultiphase'
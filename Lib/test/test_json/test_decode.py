@@ -1,6 +1,6 @@
 import decimal
 from io import StringIO
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from test.test_json import PyTest, CTest
 from test import support
 
@@ -63,6 +63,48 @@ def test_keys_reuse(self):
         self.check_keys_reuse(s, decoder.decode)
         self.assertFalse(decoder.memo)
 
+    def test_key_cache(self):
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=3)
+        a = decoder.decode('{"a_key": 1, "b_\xe9": 2}')
+        b = decoder.decode('[{"b_\xe9": 3}, {"a_key": 4}]')
+        self.assertIs(sorted(a)[0], list(b[1])[0])
+        self.assertIs(sorted(a)[1], list(b[0])[0])
+        # The cache is emptied when it grows over the limit
+        decoder.decode('{"c_key": 1, "d_key": 2}')
+        c = decoder.decode('{"a_key": 5}')
+        self.assertEqual(c, {'a_key': 5})
+        self.assertIsNot(list(c)[0], sorted(a)[0])
+        self.assertRaises(ValueError, self.json.decoder.JSONDecoder,
+                          key_cache_size=-1)
+
+    def test_object_kwargs_hook(self):
+        Point = namedtuple('Point', 'x y')
+        self.assertEqual(
+            self.loads('[{"x": 1, "y": 2}, {"y": {"y": 4, "x": 3}, "x": 5}]',
+                       object_kwargs_hook=Point),
+            [Point(1, 2), Point(5, Point(3, 4))])
+        self.assertEqual(self.loads('{}', object_kwargs_hook=tuple), ())
+        # the last of duplicate keys wins, like in a dict
+        self.assertEqual(self.loads('{"a": 1, "b": 2, "a": 3}',
+                                    object_kwargs_hook=dict),
+                         {'a': 3, 'b': 2})
+        # large objects
+        s = '{%s, "k0": -1}' % ', '.join('"k%d": %d' % (i, i)
+                                         for i in range(100))
+        self.assertEqual(self.loads(s, object_kwargs_hook=dict),
+                         self.loads(s))
+        with self.assertRaises(TypeError):
+            self.loads('{"x": 1}', object_kwargs_hook=Point)
+        # the object_pairs_hook takes priority over the object_kwargs_hook,
+        # which takes priority over the object_hook
+        s = '{"x": 1, "y": 2}'
+        self.assertEqual(self.loads(s, object_pairs_hook=list,
+                                    object_kwargs_hook=Point),
+                         [('x', 1), ('y', 2)])
+        self.assertEqual(self.loads(s, object_kwargs_hook=Point,
+                                    object_hook=lambda x: None),
+                         Point(1, 2))
+
     def test_extra_data(self):
         s = '[1, 2, 3]5'
         msg = 'Extra data'
@@ -12,6 +12,19 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_custom_encoder(self):
+        # An encoder class doesn't need to inherit from JSONEncoder
+        class Encoder:
+            def __init__(self, **kwargs):
+                pass
+            def iterencode(self, o):
+                yield '['
+                yield str(o)
+                yield ']'
+        sio = StringIO()
+        self.json.dump(5, sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[5]')
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
@@ -57,6 +70,43 @@ def __lt__(self, o):
         d[1337] = "true.dat"
         self.assertEqual(self.dumps(d, sort_keys=True), '{"1337": "true.dat"}')
 
+    def test_dump_writes_blocks(self):
+        # dump() buffers the output instead of writing every token
+        class File:
+            def __init__(self):
+                self.chunks = []
+            def write(self, s):
+                self.chunks.append(s)
+        obj = [{'key': i, 'value': [str(i)] * 3} for i in range(10000)]
+        for indent in (None, 2):
+            f = File()
+            self.json.dump(obj, f, indent=indent)
+            self.assertEqual(''.join(f.chunks), self.dumps(obj, indent=indent))
+            self.assertLess(len(f.chunks), 50)
+
+    def test_dump_bufsize(self):
+        obj = {'a': list(range(100)), 'b': 'x' * 1000}
+        chunks = []
+        self.json.JSONEncoder()._dump(obj, chunks.append, bufsize=10)
+        self.assertEqual(''.join(chunks), self.dumps(obj))
+        self.assertGreater(len(chunks), 10)
+
+    def test_dump_iterencode_override(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield from super().iterencode(o, _one_shot)
+                yield '\n'
+        sio = StringIO()
+        self.json.dump([1, 2], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[1, 2]\n')
+
+    def test_dump_write_error(self):
+        class File:
+            def write(self, s):
+                raise OSError('disk full')
+        with self.assertRaisesRegex(OSError, 'disk full'):
+            self.json.dump(list(range(100000)), File())
+
 
 class TestPyDump(TestDump, PyTest): pass
 
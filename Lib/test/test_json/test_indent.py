@@ -62,6 +62,30 @@ def check(indent, expected):
         # indent=None is more compact
         check(None, '{"3": 1}')
 
+    def test_indent_nested(self):
+        h = {'a': [1, {'b': [], 'c': {}}, [[2]]], 'd': 'e'}
+        expected = ('{\n'
+                    '..."a": [\n'
+                    '......1,\n'
+                    '......{\n'
+                    '........."b": [],\n'
+                    '........."c": {}\n'
+                    '......},\n'
+                    '......[\n'
+                    '.........[\n'
+                    '............2\n'
+                    '.........]\n'
+                    '......]\n'
+                    '...],\n'
+                    '..."d": "e"\n'
+                    '}')
+        self.assertEqual(self.dumps(h, indent='...'), expected)
+        self.assertEqual(self.dumps(h, indent=3),
+                         expected.replace('.', ' '))
+        sio = StringIO()
+        self.json.dump(h, sio, indent='...')
+        self.assertEqual(sio.getvalue(), expected)
+
 
 class TestPyIndent(TestIndent, PyTest): pass
 class TestCIndent(TestIndent, CTest): pass
@@ -0,0 +1,234 @@
+import decimal
+from io import StringIO, BytesIO
+from test.test_json import PyTest, CTest
+
+
+DOC = [
+    {"id": 1, "name": "café \U0001f600", "tags": ["a", "b"], "ok": True},
+    {"id": -2, "ratio": -1.5e-10, "big": 12345678901234567890123, "none": None},
+    {"nested": {"x": [[], {}, [1, [2, [3]]]]}, "esc": "\"\\\n\t "},
+    "-Infinity", 0, 1e100, False, "",
+]
+
+# Chunk sizes which cut tokens at every position
+CHUNK_SIZES = [1, 2, 3, 5, 7, 64, 1 << 16]
+
+
+class TestIterload:
+    def iterload(self, s, **kw):
+        fp = BytesIO(s) if isinstance(s, bytes) else StringIO(s)
+        return list(self.json.iterload(fp, **kw))
+
+    def iterparse(self, s, **kw):
+        fp = BytesIO(s) if isinstance(s, bytes) else StringIO(s)
+        return list(self.json.iterparse(fp, **kw))
+
+    def test_array(self):
+        s = self.dumps(DOC)
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.iterload(s, chunk_size=chunk_size), DOC)
+        for indent in (None, 0, 2, '\t'):
+            s = self.dumps(DOC, indent=indent)
+            self.assertEqual(self.iterload(s, chunk_size=5), DOC)
+        self.assertEqual(self.iterload(' [ ] \n'), [])
+        self.assertEqual(self.iterload('[1]'), [1])
+
+    def test_numbers_cut_by_chunks(self):
+        numbers = [12345, -6, 1.5, -2.25e-3, 1E+20, float('inf'),
+                   float('-inf')]
+        s = self.dumps(numbers, separators=(',', ':'))
+        for chunk_size in CHUNK_SIZES:
+            self.assertEqual(self.iterload(s, chunk_size=chunk_size), numbers)
+            self.assertEqual(
+                self.iterload(s.replace(',', '\n')[1:-1], lines=True,
+                              chunk_size=chunk_size),
+                numbers)
+
+    def test_lines(self):
+        s = ''.join(self.dumps(item) + '\n' for item in DOC)
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.iterload(s, lines=True,
+                                               chunk_size=chunk_size), DOC)
+        self.assertEqual(self.iterload('', lines=True), [])
+        self.assertEqual(self.iterload(' \n\r\n ', lines=True), [])
+        self.assertEqual(self.iterload('1 2\n[3]{}{"a": 4}"5"', lines=True),
+                         [1, 2, [3], {}, {"a": 4}, "5"])
+
+    def test_bytes(self):
+        s = self.dumps(DOC)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be',
+                         'utf-32-le'):
+            with self.subTest(encoding=encoding):
+                data = s.encode(encoding)
+                self.assertEqual(self.iterload(data, chunk_size=1), DOC)
+                self.assertEqual(self.iterload(data, chunk_size=3), DOC)
+        # lone surrogates are decoded like by loads()
+        self.assertEqual(self.iterload(b'["\xed\xa0\x80"]'), ['\ud800'])
+
+    def test_hooks(self):
+        s = '[{"a": 1.5, "b": 2}, [NaN]]'
+        self.assertEqual(
+            self.iterload(s, object_pairs_hook=list, parse_float=str,
+                          parse_int=float, parse_constant=repr, chunk_size=3),
+            [[('a', '1.5'), ('b', 2.0)], ["'NaN'"]])
+        self.assertEqual(self.iterload('[{"a": 1}, {}]', object_hook=len),
+                         [1, 0])
+        rval = self.iterload('[1.1]', parse_float=decimal.Decimal)
+        self.assertIsInstance(rval[0], decimal.Decimal)
+
+    def test_strict(self):
+        s = '["a\tb"]'
+        with self.assertRaises(self.JSONDecodeError):
+            self.iterload(s)
+        self.assertEqual(self.iterload(s, strict=False), ['a\tb'])
+
+    def test_iterator(self):
+        # Values are generated before the end of the document is read
+        it = self.json.iterload(StringIO('[1, 2, x'), chunk_size=1)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        with self.assertRaises(self.JSONDecodeError):
+            next(it)
+
+    def test_errors(self):
+        test_cases = [
+            ('[1,]', 'Expecting value', 3),
+            ('[1 2]', "Expecting ',' delimiter", 3),
+            ('[1,\n {"a": 1.}]', "Expecting ',' delimiter", 12),
+            ('[1] x', 'Extra data', 4),
+            ('[tru]', 'Expecting value', 1),
+            ('["abc', 'Unterminated string starting at', 1),
+            ('[1.5e]', "Expecting ',' delimiter", 4),
+            ('[-]', 'Expecting value', 1),
+            ('[[1]', "Expecting ',' delimiter", 4),
+        ]
+        for s, msg, idx in test_cases:
+            for chunk_size in (1, 3, 1 << 16):
+                with self.subTest(s=s, chunk_size=chunk_size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iterload(s, chunk_size=chunk_size)
+                    self.assertEqual(cm.exception.msg, msg)
+                    self.assertEqual(cm.exception.pos, idx)
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iterparse(s, chunk_size=chunk_size)
+                    self.assertEqual(cm.exception.msg, msg)
+                    self.assertEqual(cm.exception.pos, idx)
+
+    def test_not_array(self):
+        for s in ('', '{}', ' 1'):
+            with self.assertRaises(self.JSONDecodeError) as cm:
+                self.iterload(s)
+            self.assertEqual(cm.exception.msg, 'Expecting array')
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iterload('1 x', lines=True)
+        self.assertEqual(cm.exception.msg, 'Expecting value')
+        self.assertEqual(cm.exception.pos, 2)
+
+    def test_error_position(self):
+        s = '[\n' + '"%s",\n' % ('x' * 100) * 1000 + '  }]'
+        for chunk_size in (7, 1 << 16):
+            with self.assertRaises(self.JSONDecodeError) as cm:
+                self.iterload(s, chunk_size=chunk_size)
+            err = cm.exception
+            self.assertEqual(err.msg, 'Expecting value')
+            self.assertEqual(err.pos, len(s) - 2)
+            self.assertEqual(err.lineno, 1002)
+            self.assertEqual(err.colno, 3)
+            self.assertEqual(str(err), 'Expecting value: line 1002 column 3 '
+                                       '(char %d)' % (len(s) - 2))
+
+    def test_bom(self):
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iterload('\ufeff[]')
+        self.assertIn('BOM', str(cm.exception))
+        self.assertEqual(self.iterload('\ufeff[]'.encode('utf-8')), [])
+
+    def test_not_file(self):
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(StringIO('[]'), chunk_size='1'))
+        class NotFile:
+            def read(self, size):
+                return [1]
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(NotFile()))
+
+    def test_iterparse(self):
+        s = '{"a": [1, "x", {"b": null}, []], "c": {}, "d": -1.5}'
+        expected = [
+            ('start_map', None),
+            ('key', 'a'), ('start_array', None),
+            ('value', 1), ('value', 'x'),
+            ('start_map', None), ('key', 'b'), ('value', None),
+            ('end_map', None),
+            ('start_array', None), ('end_array', None),
+            ('end_array', None),
+            ('key', 'c'), ('start_map', None), ('end_map', None),
+            ('key', 'd'), ('value', -1.5),
+            ('end_map', None),
+        ]
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.iterparse(s, chunk_size=chunk_size),
+                                 expected)
+        self.assertEqual(self.iterparse(' "x" '), [('value', 'x')])
+        self.assertEqual(self.iterparse('[]'.encode('utf-16')),
+                         [('start_array', None), ('end_array', None)])
+        self.assertEqual(self.iterparse('[1.5]', parse_float=str),
+                         [('start_array', None), ('value', '1.5'),
+                          ('end_array', None)])
+
+    def test_iterparse_roundtrip(self):
+        def build(events):
+            stack = [[]]
+            keys = [None]
+            for event, value in events:
+                if event == 'key':
+                    keys[-1] = value
+                    continue
+                if event in ('start_map', 'start_array'):
+                    stack.append({} if event == 'start_map' else [])
+                    keys.append(None)
+                    continue
+                if event in ('end_map', 'end_array'):
+                    value = stack.pop()
+                    keys.pop()
+                if isinstance(stack[-1], list):
+                    stack[-1].append(value)
+                else:
+                    stack[-1][keys[-1]] = value
+            return stack[0][0]
+        s = self.dumps(DOC)
+        for chunk_size in CHUNK_SIZES:
+            self.assertEqual(build(self.iterparse(s, chunk_size=chunk_size)),
+                             DOC)
+
+    def test_iterparse_errors(self):
+        for s, msg in [('{"a" 1}', "Expecting ':' delimiter"),
+                       ('{"a": 1,}', 'Expecting property name enclosed '
+                                     'in double quotes'),
+                       ('{1: 2}', 'Expecting property name enclosed '
+                                  'in double quotes'),
+                       ('[1} ', "Expecting ',' delimiter"),
+                       ('{"a": 1]', "Expecting ',' delimiter"),
+                       ('', 'Expecting value'),
+                       ('1 2', 'Extra data')]:
+            with self.subTest(s=s):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.iterparse(s, chunk_size=2)
+                self.assertEqual(cm.exception.msg, msg)
+                with self.assertRaises(self.JSONDecodeError) as cm2:
+                    self.loads(s)
+                self.assertEqual(cm.exception.pos, cm2.exception.pos)
+
+    def test_iterparse_deep(self):
+        # Nested containers are not parsed recursively
+        depth = 100_000
+        s = '[' * depth + ']' * depth
+        events = self.iterparse(s)
+        self.assertEqual(len(events), 2 * depth)
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
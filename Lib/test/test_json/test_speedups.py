@@ -68,6 +68,24 @@ def test_bad_markers_argument_to_encoder(self):
             self.json.encoder.c_make_encoder(1, None, None, None, ': ', ', ',
                                              False, False, False)
 
+    def test_bad_indent_argument_to_encoder(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r'make_encoder\(\) argument 4 must be str or None, not int',
+        ):
+            self.json.encoder.c_make_encoder(None, None, None, 4, ': ', ', ',
+                                             False, False, False)
+
+    def test_dump(self):
+        enc = self.json.encoder.c_make_encoder(None, None, repr, '  ',
+                                               ': ', ',', False, False, False)
+        chunks = []
+        self.assertIsNone(enc.dump([[1], 2], chunks.append, bufsize=1))
+        self.assertEqual(''.join(chunks), "[\n  [\n    1\n  ],\n  2\n]")
+        self.assertGreater(len(chunks), 1)
+        self.assertRaises(TypeError, enc.dump, [], None)
+        self.assertRaises(ValueError, enc.dump, [], chunks.append, bufsize=0)
+
     def test_bad_bool_args(self):
         def test(name):
             self.json.encoder.JSONEncoder(**{name: BadBool()}).encode({'a': 1})
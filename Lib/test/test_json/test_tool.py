@@ -1,4 +1,5 @@
 import errno
+import io
 import os
 import sys
 import textwrap
@@ -7,7 +8,7 @@
 
 from test import support
 from test.support import os_helper
-from test.support.script_helper import assert_python_ok
+from test.support.script_helper import assert_python_ok, assert_python_failure
 
 
 @support.requires_subprocess()
@@ -147,6 +148,40 @@ def test_jsonlines(self):
         self.assertEqual(process.stdout, self.jsonlines_expect)
         self.assertEqual(process.stderr, '')
 
+    def test_jsonlines_jobs(self):
+        args = sys.executable, '-m', 'json.tool', '--json-lines', '-j', '2'
+        process = subprocess.run(args, input=self.jsonlines_raw, capture_output=True, text=True, check=True)
+        self.assertEqual(process.stdout, self.jsonlines_expect)
+        self.assertEqual(process.stderr, '')
+
+    def test_jsonlines_jobs_invalid_line(self):
+        input_ = '1\n[2]\n{x\n4\n'
+        args = sys.executable, '-m', 'json.tool', '--json-lines', '--jobs', '0'
+        process = subprocess.run(args, input=input_, capture_output=True, text=True)
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(process.stdout, '1\n[\n    2\n]\n')
+        self.assertIn('Expecting property name', process.stderr)
+
+    def test_jobs_requires_jsonlines(self):
+        rc, out, err = assert_python_failure('-m', 'json.tool', '-j', '2')
+        self.assertEqual(rc, 2)
+        self.assertIn(b'--jobs requires --json-lines', err)
+
+    def test_process_lines_parallel(self):
+        support.skip_if_broken_multiprocessing_synchronize()
+        from json import tool
+        lines = [f'{{"b": {i}, "a": [{i}, "x"]}}\n' for i in range(1000)]
+        dump_args = {'sort_keys': True, 'indent': None,
+                     'separators': (',', ':')}
+        expected = ''.join(f'{{"a":[{i},"x"],"b":{i}}}\n'
+                           for i in range(1000))
+        outfile = io.StringIO()
+        # Split the input into many blocks
+        with support.swap_attr(tool, '_CHUNK_SIZE', 100):
+            tool._process_lines_parallel(io.StringIO(''.join(lines)), outfile,
+                                         dump_args, 2)
+        self.assertEqual(outfile.getvalue(), expected)
+
     def test_help_flag(self):
         rc, out, err = assert_python_ok('-m', 'json.tool', '-h')
         self.assertEqual(rc, 0)
@@ -326,7 +326,7 @@ class SizeofTests(unittest.TestCase):
         check_sizeof = support.check_sizeof
 
         def test_pickler(self):
-            basesize = support.calcobjsize('7P2n3i2n3i2P')
+            basesize = support.calcobjsize('7P2n3i2n4i2P')
             p = _pickle.Pickler(io.BytesIO())
             self.assertEqual(object.__sizeof__(p), basesize)
             MT_size = struct.calcsize('3nP0n')
@@ -342,8 +342,14 @@ def test_pickler(self):
                                           # save references to 6 objects.
                 0)  # Write buffer is cleared after every dump().
 
+            p = _pickle.Pickler(io.BytesIO(), reuse_buffer=True)
+            p.dump('x')
+            check(p, basesize +
+                MT_size + 8 * ME_size +
+                sys.getsizeof(b'x'*4096))  # The write buffer is kept.
+
         def test_unpickler(self):
-            basesize = support.calcobjsize('2P2n2P 2P2n2i5P 2P3n8P2n2i')
+            basesize = support.calcobjsize('2P2n2P 2P2n2i5P 2P3n9P2n2i')
             unpickler = _pickle.Unpickler
             P = struct.calcsize('P')  # Size of memo table entry.
             n = struct.calcsize('n')  # Size of mark table entry.
@@ -1771,6 +1771,12 @@ class BoundedSemaphoreTests(lock_tests.BoundedSemaphoreTests):
 class BarrierTests(lock_tests.BarrierTests):
     barriertype = staticmethod(threading.Barrier)
 
+class RWLockTests(lock_tests.RWLockTests):
+    rwlocktype = staticmethod(threading.RWLock)
+
+class ShardedLockTests(lock_tests.ShardedLockTests):
+    shardedlocktype = staticmethod(threading.ShardedLock)
+
 
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
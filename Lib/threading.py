@@ -26,6 +26,7 @@
 __all__ = ['get_ident', 'active_count', 'Condition', 'current_thread',
            'enumerate', 'main_thread', 'TIMEOUT_MAX',
            'Event', 'Lock', 'RLock', 'Semaphore', 'BoundedSemaphore', 'Thread',
+           'RWLock', 'ShardedLock',
            'Barrier', 'BrokenBarrierError', 'Timer', 'ThreadError',
            'setprofile', 'settrace', 'local', 'stack_size',
            'excepthook', 'ExceptHookArgs', 'gettrace', 'getprofile',
@@ -36,6 +37,7 @@
 _daemon_threads_allowed = _thread.daemon_threads_allowed
 _allocate_lock = _thread.allocate_lock
 _set_sentinel = _thread._set_sentinel
+ShardedLock = _thread.ShardedLock
 get_ident = _thread.get_ident
 try:
     get_native_id = _thread.get_native_id
@@ -553,6 +555,143 @@ def release(self, n=1):
             self._cond.notify(n)
 
 
+class RWLock:
+    """This class implements reader-writer lock objects.
+
+    A reader-writer lock can be held either by any number of readers at the
+    same time, or by a single writer.  The lock prefers writers: once a thread
+    waits for the write lock, new readers block until no writer is waiting,
+    so that a steady flow of readers cannot starve the writers.
+
+    The read_lock and write_lock attributes are lock-like objects with
+    acquire() and release() methods which support the context management
+    protocol, for use in "with" statements.
+
+    The write lock must be released by the thread that acquired it; it is not
+    reentrant, and a thread holding it cannot acquire the read lock.
+
+    """
+
+    def __init__(self):
+        lock = Lock()
+        self._read_ok = Condition(lock)
+        self._write_ok = Condition(lock)
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        self.read_lock = _RWLockSide(self.acquire_read, self.release_read)
+        self.write_lock = _RWLockSide(self.acquire_write, self.release_write)
+
+    def __repr__(self):
+        cls = self.__class__
+        return (f"<{cls.__module__}.{cls.__qualname__} at {id(self):#x}:"
+                f" readers={self._readers}"
+                f" writer={self._writer is not None}"
+                f" waiting_writers={self._waiting_writers}>")
+
+    def _can_read(self):
+        return self._writer is None and not self._waiting_writers
+
+    def _can_write(self):
+        return self._writer is None and not self._readers
+
+    def acquire_read(self, blocking=True, timeout=None):
+        """Acquire the lock for reading.
+
+        Block while a thread holds the write lock or waits for it, then
+        return true.  The arguments have the same meaning as for
+        Semaphore.acquire(): return false if the lock cannot be acquired
+        without blocking, or within timeout seconds.
+
+        """
+        if not blocking and timeout is not None:
+            raise ValueError("can't specify timeout for non-blocking acquire")
+        with self._read_ok:
+            if self._writer == get_ident():
+                raise RuntimeError("cannot acquire the read lock while "
+                                   "holding the write lock")
+            rc = self._read_ok.wait_for(self._can_read,
+                                        timeout if blocking else 0)
+            if rc:
+                self._readers += 1
+        return rc
+
+    def release_read(self):
+        """Release the lock acquired for reading.
+
+        When the last reader releases the lock, wake up one of the threads
+        waiting for the write lock.
+
+        """
+        with self._read_ok:
+            if not self._readers:
+                raise RuntimeError("release unlocked lock")
+            self._readers -= 1
+            if not self._readers:
+                self._write_ok.notify()
+
+    def acquire_write(self, blocking=True, timeout=None):
+        """Acquire the lock for writing.
+
+        Block while a thread holds the lock, for reading or writing, then
+        return true.  The arguments have the same meaning as for
+        Semaphore.acquire(): return false if the lock cannot be acquired
+        without blocking, or within timeout seconds.
+
+        """
+        if not blocking and timeout is not None:
+            raise ValueError("can't specify timeout for non-blocking acquire")
+        me = get_ident()
+        with self._write_ok:
+            if self._writer == me:
+                raise RuntimeError("cannot acquire the write lock twice")
+            rc = False
+            self._waiting_writers += 1
+            try:
+                rc = self._write_ok.wait_for(self._can_write,
+                                             timeout if blocking else 0)
+            finally:
+                self._waiting_writers -= 1
+                if rc:
+                    self._writer = me
+                elif self._can_read():
+                    # Wake up the readers blocked by this writer
+                    self._read_ok.notify_all()
+        return rc
+
+    def release_write(self):
+        """Release the lock acquired for writing.
+
+        Wake up one of the threads waiting for the write lock if any,
+        otherwise all the threads waiting for the read lock.
+
+        """
+        with self._write_ok:
+            if self._writer != get_ident():
+                raise RuntimeError("cannot release un-acquired lock")
+            self._writer = None
+            if self._waiting_writers:
+                self._write_ok.notify()
+            else:
+                self._read_ok.notify_all()
+
+
+class _RWLockSide:
+    # The read or write side of a RWLock
+
+    __slots__ = ('acquire', 'release')
+
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, t, v, tb):
+        self.release()
+
+
 class Event:
     """Class implementing event objects.
 
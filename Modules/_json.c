@@ -21,19 +21,23 @@ typedef struct _PyScannerObject {
     signed char strict;
     PyObject *object_hook;
     PyObject *object_pairs_hook;
+    PyObject *object_kwargs_hook;
     PyObject *parse_float;
     PyObject *parse_int;
     PyObject *parse_constant;
     PyObject *memo;
+    Py_ssize_t key_cache_size;
 } PyScannerObject;
 
 static PyMemberDef scanner_members[] = {
     {"strict", T_BOOL, offsetof(PyScannerObject, strict), READONLY, "strict"},
     {"object_hook", T_OBJECT, offsetof(PyScannerObject, object_hook), READONLY, "object_hook"},
     {"object_pairs_hook", T_OBJECT, offsetof(PyScannerObject, object_pairs_hook), READONLY},
+    {"object_kwargs_hook", T_OBJECT, offsetof(PyScannerObject, object_kwargs_hook), READONLY},
     {"parse_float", T_OBJECT, offsetof(PyScannerObject, parse_float), READONLY, "parse_float"},
     {"parse_int", T_OBJECT, offsetof(PyScannerObject, parse_int), READONLY, "parse_int"},
     {"parse_constant", T_OBJECT, offsetof(PyScannerObject, parse_constant), READONLY, "parse_constant"},
+    {"key_cache_size", T_PYSSIZET, offsetof(PyScannerObject, key_cache_size), READONLY, "key_cache_size"},
     {NULL}
 };
 
@@ -637,6 +641,7 @@ scanner_traverse(PyScannerObject *self, visitproc visit, void *arg)
     Py_VISIT(Py_TYPE(self));
     Py_VISIT(self->object_hook);
     Py_VISIT(self->object_pairs_hook);
+    Py_VISIT(self->object_kwargs_hook);
     Py_VISIT(self->parse_float);
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
@@ -649,6 +654,7 @@ scanner_clear(PyScannerObject *self)
 {
     Py_CLEAR(self->object_hook);
     Py_CLEAR(self->object_pairs_hook);
+    Py_CLEAR(self->object_kwargs_hook);
     Py_CLEAR(self->parse_float);
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
@@ -656,6 +662,41 @@ scanner_clear(PyScannerObject *self)
     return 0;
 }
 
+/* Maximum number of members of a JSON object passed to object_kwargs_hook
+   directly from the C stack.  Larger objects are collected in a dict. */
+#define KWARGS_HOOK_MAX 32
+
+static PyObject *
+_call_kwargs_hook(PyScannerObject *s, PyObject **kwnames, PyObject **kwvalues,
+                  Py_ssize_t nkwargs)
+{
+    /* Call object_kwargs_hook(**members).  Steals the references to the
+       names and values. */
+    PyObject *names = NULL;
+    PyObject *rval;
+    Py_ssize_t i;
+
+    if (nkwargs) {
+        names = PyTuple_New(nkwargs);
+        if (names == NULL) {
+            for (i = 0; i < nkwargs; i++) {
+                Py_DECREF(kwnames[i]);
+                Py_DECREF(kwvalues[i]);
+            }
+            return NULL;
+        }
+        for (i = 0; i < nkwargs; i++) {
+            PyTuple_SET_ITEM(names, i, kwnames[i]);
+        }
+    }
+    rval = PyObject_Vectorcall(s->object_kwargs_hook, kwvalues, 0, names);
+    Py_XDECREF(names);
+    for (i = 0; i < nkwargs; i++) {
+        Py_DECREF(kwvalues[i]);
+    }
+    return rval;
+}
+
 static PyObject *
 _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
@@ -673,6 +714,13 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     PyObject *rval = NULL;
     PyObject *key = NULL;
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    /* With object_kwargs_hook, the members are kept in kwnames and kwvalues
+       while rval is NULL.  Keys are memoized, so duplicates are found by
+       identity. */
+    int has_kwargs_hook = (!has_pairs_hook && s->object_kwargs_hook != Py_None);
+    PyObject *kwnames[KWARGS_HOOK_MAX];
+    PyObject *kwvalues[KWARGS_HOOK_MAX];
+    Py_ssize_t nkwargs = 0;
     Py_ssize_t next_idx;
 
     if (PyUnicode_READY(pystr) == -1)
@@ -682,12 +730,16 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
 
-    if (has_pairs_hook)
+    if (has_pairs_hook) {
         rval = PyList_New(0);
-    else
+        if (rval == NULL)
+            return NULL;
+    }
+    else if (!has_kwargs_hook) {
         rval = PyDict_New();
-    if (rval == NULL)
-        return NULL;
+        if (rval == NULL)
+            return NULL;
+    }
 
     /* skip whitespace after { */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
@@ -738,6 +790,44 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
                 }
                 Py_DECREF(item);
             }
+            else if (rval == NULL) {
+                Py_ssize_t i;
+                for (i = 0; i < nkwargs; i++) {
+                    if (kwnames[i] == key)
+                        break;
+                }
+                if (i < nkwargs) {
+                    /* Duplicate key: the last value wins, like in a dict */
+                    Py_SETREF(kwvalues[i], val);
+                    val = NULL;
+                    Py_CLEAR(key);
+                }
+                else if (nkwargs < KWARGS_HOOK_MAX) {
+                    kwnames[nkwargs] = key;
+                    kwvalues[nkwargs] = val;
+                    nkwargs++;
+                    key = val = NULL;
+                }
+                else {
+                    /* Too many members, continue with a dict */
+                    rval = PyDict_New();
+                    if (rval == NULL)
+                        goto bail;
+                    for (i = 0; i < nkwargs; i++) {
+                        if (PyDict_SetItem(rval, kwnames[i], kwvalues[i]) < 0)
+                            goto bail;
+                    }
+                    for (i = 0; i < nkwargs; i++) {
+                        Py_DECREF(kwnames[i]);
+                        Py_DECREF(kwvalues[i]);
+                    }
+                    nkwargs = 0;
+                    if (PyDict_SetItem(rval, key, val) < 0)
+                        goto bail;
+                    Py_CLEAR(key);
+                    Py_CLEAR(val);
+                }
+            }
             else {
                 if (PyDict_SetItem(rval, key, val) < 0)
                     goto bail;
@@ -771,6 +861,15 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
         return val;
     }
 
+    if (has_kwargs_hook) {
+        if (rval == NULL) {
+            return _call_kwargs_hook(s, kwnames, kwvalues, nkwargs);
+        }
+        val = PyObject_VectorcallDict(s->object_kwargs_hook, NULL, 0, rval);
+        Py_DECREF(rval);
+        return val;
+    }
+
     /* if object_hook is not None: rval = object_hook(rval) */
     if (s->object_hook != Py_None) {
         val = PyObject_CallOneArg(s->object_hook, rval);
@@ -779,6 +878,10 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     }
     return rval;
 bail:
+    for (Py_ssize_t i = 0; i < nkwargs; i++) {
+        Py_DECREF(kwnames[i]);
+        Py_DECREF(kwvalues[i]);
+    }
     Py_XDECREF(key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
@@ -1136,18 +1239,39 @@ scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
                  Py_TYPE(pystr)->tp_name);
         return NULL;
     }
-    PyDict_Clear(self->memo);
+    /* Keep the memoized keys for the next call as long as the cache is
+       not full */
+    if (PyDict_GET_SIZE(self->memo) > self->key_cache_size) {
+        PyDict_Clear(self->memo);
+    }
     if (rval == NULL)
         return NULL;
     return _build_rval_index_tuple(rval, next_idx);
 }
 
+static int
+_get_optional_attr(PyObject *obj, const char *name, PyObject **result)
+{
+    /* Like PyObject_GetAttrString(), but set *result to NULL and return 0
+       if the attribute does not exist */
+    PyObject *oname = PyUnicode_FromString(name);
+    int rv;
+    if (oname == NULL) {
+        *result = NULL;
+        return -1;
+    }
+    rv = _PyObject_LookupAttr(obj, oname, result);
+    Py_DECREF(oname);
+    return rv;
+}
+
 static PyObject *
 scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
     PyScannerObject *s;
     PyObject *ctx;
     PyObject *strict;
+    PyObject *key_cache_size = NULL;
     static char *kwlist[] = {"context", NULL};
 
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:make_scanner", kwlist, &ctx))
@@ -1176,6 +1300,27 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->object_pairs_hook = PyObject_GetAttrString(ctx, "object_pairs_hook");
     if (s->object_pairs_hook == NULL)
         goto bail;
+    /* Optional attributes, contexts written for older versions may
+       not have them */
+    if (_get_optional_attr(ctx, "object_kwargs_hook",
+                           &s->object_kwargs_hook) < 0)
+        goto bail;
+    if (s->object_kwargs_hook == NULL)
+        s->object_kwargs_hook = Py_NewRef(Py_None);
+    if (_get_optional_attr(ctx, "key_cache_size", &key_cache_size) < 0)
+        goto bail;
+    if (key_cache_size != NULL) {
+        s->key_cache_size = PyNumber_AsSsize_t(key_cache_size,
+                                               PyExc_OverflowError);
+        Py_DECREF(key_cache_size);
+        if (s->key_cache_size == -1 && PyErr_Occurred())
+            goto bail;
+        if (s->key_cache_size < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "key_cache_size must be non-negative");
+            goto bail;
+        }
+    }
     s->parse_float = PyObject_GetAttrString(ctx, "parse_float");
     if (s->parse_float == NULL)
         goto bail;
@@ -1214,6 +1359,55 @@ static PyType_Spec PyScannerType_spec = {
     .slots = PyScannerType_slots,
 };
 
+/* Output buffer of the encoder.  The encoding functions only see the
+   _PyUnicodeWriter, which must therefore be the first member.  If write is
+   not NULL, the buffered text is passed to it whenever more than bufsize
+   characters have accumulated at the end of a list item or dict member. */
+typedef struct {
+    _PyUnicodeWriter writer;
+    PyObject *write;
+    Py_ssize_t bufsize;
+} EncoderWriter;
+
+#define ENCODER_BUFSIZE (64 * 1024)
+
+static void
+encoder_writer_init(EncoderWriter *w, PyObject *write, Py_ssize_t bufsize)
+{
+    _PyUnicodeWriter_Init(&w->writer);
+    w->writer.overallocate = 1;
+    w->write = write;
+    w->bufsize = bufsize;
+    if (write != NULL) {
+        /* Avoid growing the buffer from scratch after every flush */
+        w->writer.min_length = Py_MIN(bufsize, ENCODER_BUFSIZE) + 1;
+    }
+}
+
+static int
+encoder_flush(_PyUnicodeWriter *writer, int force)
+{
+    EncoderWriter *w = (EncoderWriter *)writer;
+    PyObject *chunk, *res;
+
+    if (w->write == NULL || writer->pos == 0 ||
+            (!force && writer->pos < w->bufsize)) {
+        return 0;
+    }
+    chunk = _PyUnicodeWriter_Finish(writer);
+    encoder_writer_init(w, w->write, w->bufsize);
+    if (chunk == NULL) {
+        return -1;
+    }
+    res = PyObject_CallOneArg(w->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
@@ -1236,6 +1430,12 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return NULL;
     }
+    if (indent != Py_None && !PyUnicode_Check(indent)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 4 must be str or None, "
+                     "not %.200s", Py_TYPE(indent)->tp_name);
+        return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1270,29 +1470,68 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     static char *kwlist[] = {"obj", "_current_indent_level", NULL};
     PyObject *obj, *result;
     Py_ssize_t indent_level;
-    _PyUnicodeWriter writer;
+    EncoderWriter writer;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
         &obj, &indent_level))
         return NULL;
 
-    _PyUnicodeWriter_Init(&writer);
-    writer.overallocate = 1;
+    encoder_writer_init(&writer, NULL, 0);
 
-    if (encoder_listencode_obj(self, &writer, obj, indent_level)) {
-        _PyUnicodeWriter_Dealloc(&writer);
+    if (encoder_listencode_obj(self, &writer.writer, obj, indent_level)) {
+        _PyUnicodeWriter_Dealloc(&writer.writer);
         return NULL;
     }
 
     result = PyTuple_New(1);
     if (result == NULL ||
-            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&writer)) < 0) {
+            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&writer.writer)) < 0) {
         Py_XDECREF(result);
         return NULL;
     }
     return result;
 }
 
+PyDoc_STRVAR(encoder_dump_doc,
+"dump($self, /, obj, write, _current_indent_level=0, bufsize=65536)\n"
+"--\n"
+"\n"
+"Encode obj and pass the output to write() in blocks of about bufsize\n"
+"characters.");
+
+static PyObject *
+encoder_dump(PyEncoderObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"obj", "write", "_current_indent_level",
+                             "bufsize", NULL};
+    PyObject *obj, *write;
+    Py_ssize_t indent_level = 0;
+    Py_ssize_t bufsize = ENCODER_BUFSIZE;
+    EncoderWriter writer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|nn:dump", kwlist,
+        &obj, &write, &indent_level, &bufsize))
+        return NULL;
+    if (!PyCallable_Check(write)) {
+        PyErr_Format(PyExc_TypeError, "write must be callable, not %.200s",
+                     Py_TYPE(write)->tp_name);
+        return NULL;
+    }
+    if (bufsize <= 0) {
+        PyErr_SetString(PyExc_ValueError, "bufsize must be positive");
+        return NULL;
+    }
+
+    encoder_writer_init(&writer, write, bufsize);
+    if (encoder_listencode_obj(self, &writer.writer, obj, indent_level) ||
+            encoder_flush(&writer.writer, 1)) {
+        _PyUnicodeWriter_Dealloc(&writer.writer);
+        return NULL;
+    }
+    _PyUnicodeWriter_Dealloc(&writer.writer);
+    Py_RETURN_NONE;
+}
+
 static PyObject *
 _encoded_const(PyObject *obj)
 {
@@ -1368,6 +1607,31 @@ _steal_accumulate(_PyUnicodeWriter *writer, PyObject *stolen)
     return rval;
 }
 
+static int
+encoder_write_newline_indent(PyEncoderObject *s, _PyUnicodeWriter *writer,
+                             Py_ssize_t indent_level)
+{
+    /* Write '\n' + indent * indent_level */
+    if (_PyUnicodeWriter_WriteChar(writer, '\n') < 0)
+        return -1;
+    for (Py_ssize_t i = 0; i < indent_level; i++) {
+        if (_PyUnicodeWriter_WriteStr(writer, s->indent) < 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int
+encoder_write_item_separator(PyEncoderObject *s, _PyUnicodeWriter *writer,
+                             Py_ssize_t indent_level)
+{
+    if (_PyUnicodeWriter_WriteStr(writer, s->item_separator) < 0)
+        return -1;
+    if (s->indent != Py_None)
+        return encoder_write_newline_indent(s, writer, indent_level);
+    return 0;
+}
+
 static int
 encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
                        PyObject *obj, Py_ssize_t indent_level)
@@ -1505,7 +1769,7 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
         *first = false;
     }
     else {
-        if (_PyUnicodeWriter_WriteStr(writer, s->item_separator) < 0) {
+        if (encoder_write_item_separator(s, writer, indent_level) < 0) {
             Py_DECREF(keystr);
             return -1;
         }
@@ -1562,13 +1826,9 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
         goto bail;
 
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        if (encoder_write_newline_indent(s, writer, indent_level) < 0)
+            goto bail;
     }
 
     if (s->sort_keys || !PyDict_CheckExact(dct)) {
@@ -1588,6 +1848,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
             value = PyTuple_GET_ITEM(item, 1);
             if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
                 goto bail;
+            if (encoder_flush(writer, 0) < 0)
+                goto bail;
         }
         Py_CLEAR(items);
 
@@ -1596,6 +1858,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
         while (PyDict_Next(dct, &pos, &key, &value)) {
             if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
                 goto bail;
+            if (encoder_flush(writer, 0) < 0)
+                goto bail;
         }
     }
 
@@ -1604,12 +1868,11 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
             goto bail;
         Py_CLEAR(ident);
     }
-    /* TODO DOES NOT RUN; dead code
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (encoder_write_newline_indent(s, writer, indent_level) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, '}'))
         goto bail;
     return 0;
@@ -1656,22 +1919,20 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
     if (_PyUnicodeWriter_WriteChar(writer, '['))
         goto bail;
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        if (encoder_write_newline_indent(s, writer, indent_level) < 0)
+            goto bail;
     }
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyUnicodeWriter_WriteStr(writer, s->item_separator))
+            if (encoder_write_item_separator(s, writer, indent_level))
                 goto bail;
         }
         if (encoder_listencode_obj(s, writer, obj, indent_level))
             goto bail;
+        if (encoder_flush(writer, 0) < 0)
+            goto bail;
     }
     if (ident != NULL) {
         if (PyDict_DelItem(s->markers, ident))
@@ -1679,12 +1940,11 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
         Py_CLEAR(ident);
     }
 
-    /* TODO: DOES NOT RUN
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (encoder_write_newline_indent(s, writer, indent_level) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, ']'))
         goto bail;
     Py_DECREF(s_fast);
@@ -1735,8 +1995,15 @@ encoder_clear(PyEncoderObject *self)
 
 PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level) -> iterable");
 
+static PyMethodDef encoder_methods[] = {
+    {"dump", _PyCFunction_CAST(encoder_dump), METH_VARARGS | METH_KEYWORDS,
+     encoder_dump_doc},
+    {NULL, NULL}
+};
+
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
+    {Py_tp_methods, encoder_methods},
     {Py_tp_dealloc, encoder_dealloc},
     {Py_tp_call, encoder_call},
     {Py_tp_traverse, encoder_traverse},
@@ -693,6 +693,9 @@ typedef struct PicklerObject {
     int fast_nesting;
     int fix_imports;            /* Indicate whether Pickler should fix
                                    the name of globals for Python 2.x. */
+    int reuse_buffer;           /* Pass memoryviews of output_buffer to
+                                   write() and keep output_buffer for the
+                                   next frames and dump() calls. */
     PyObject *fast_memo;
     PyObject *buffer_callback;  /* Callback for out-of-band buffers, or NULL */
 } PicklerObject;
@@ -723,6 +726,8 @@ typedef struct UnpicklerObject {
     PyObject *readline;         /* readline() method of the input stream. */
     PyObject *peek;             /* peek() method of the input stream, or NULL */
     PyObject *buffers;          /* iterable of out-of-band buffers, or NULL */
+    PyObject *source_view;      /* read-only memoryview of the input returned
+                                   by loads(zero_copy=True), or NULL */
 
     char *encoding;             /* Name of the encoding to be used for
                                    decoding strings pickled using Python
@@ -980,10 +985,14 @@ PyMemoTable_Set(PyMemoTable *self, PyObject *key, Py_ssize_t value)
 static int
 _Pickler_ClearBuffer(PicklerObject *self)
 {
-    Py_XSETREF(self->output_buffer,
-              PyBytes_FromStringAndSize(NULL, self->max_output_len));
-    if (self->output_buffer == NULL)
-        return -1;
+    if (self->output_buffer == NULL || !self->reuse_buffer) {
+        Py_XSETREF(self->output_buffer,
+                  PyBytes_FromStringAndSize(NULL, self->max_output_len));
+        if (self->output_buffer == NULL)
+            return -1;
+    }
+    /* else the buffer was never passed to Python code, only views of it:
+       see _Pickler_FlushToFile(). */
     self->output_len = 0;
     self->frame_start = -1;
     return 0;
@@ -1043,6 +1052,41 @@ _Pickler_GetString(PicklerObject *self)
     return output_buffer;
 }
 
+/* Write the output buffer to the file through a read-only memoryview and
+   keep the buffer for reuse, unless write() kept a view of it. */
+static int
+_Pickler_FlushViewToFile(PicklerObject *self)
+{
+    PyObject *view, *output_view, *result;
+
+    assert(self->write != NULL && self->reuse_buffer);
+
+    if (_Pickler_CommitFrame(self))
+        return -1;
+
+    view = PyMemoryView_FromObject(self->output_buffer);
+    if (view == NULL)
+        return -1;
+    output_view = PySequence_GetSlice(view, 0, self->output_len);
+    Py_DECREF(view);
+    if (output_view == NULL)
+        return -1;
+
+    result = PyObject_CallOneArg(self->write, output_view);
+    Py_DECREF(output_view);
+    /* The views of the buffer hold a reference to it: if one of them is
+       still alive, allocate a new buffer for the next frame rather than
+       modifying its data. */
+    if (Py_REFCNT(self->output_buffer) > 1) {
+        Py_CLEAR(self->output_buffer);
+    }
+    self->output_len = 0;
+    self->frame_start = -1;
+
+    Py_XDECREF(result);
+    return (result == NULL) ? -1 : 0;
+}
+
 static int
 _Pickler_FlushToFile(PicklerObject *self)
 {
@@ -1050,12 +1094,16 @@ _Pickler_FlushToFile(PicklerObject *self)
 
     assert(self->write != NULL);
 
+    if (self->reuse_buffer)
+        return _Pickler_FlushViewToFile(self);
+
     /* This will commit the frame first */
     output = _Pickler_GetString(self);
     if (output == NULL)
         return -1;
 
     result = _Pickle_FastCall(self->write, output);
+
     Py_XDECREF(result);
     return (result == NULL) ? -1 : 0;
 }
@@ -1162,6 +1210,7 @@ _Pickler_New(PickleState *st)
     self->fast = 0;
     self->fast_nesting = 0;
     self->fix_imports = 0;
+    self->reuse_buffer = 0;
     self->fast_memo = NULL;
     self->max_output_len = WRITE_BUF_SIZE;
     self->output_len = 0;
@@ -1643,6 +1692,7 @@ _Unpickler_New(PyObject *module)
     self->readline = NULL;
     self->peek = NULL;
     self->buffers = NULL;
+    self->source_view = NULL;
     self->encoding = NULL;
     self->errors = NULL;
     self->marks = NULL;
@@ -4697,6 +4747,7 @@ _pickle.Pickler.__init__
   protocol: object = None
   fix_imports: bool = True
   buffer_callback: object = None
+  reuse_buffer: bool = False
 
 This takes a binary file for writing a pickle data stream.
 
@@ -4729,13 +4780,17 @@ buffer is serialized in-band, i.e. inside the pickle stream.
 It is an error if *buffer_callback* is not None and *protocol*
 is None or smaller than 5.
 
+If *reuse_buffer* is True, the pickle data is passed to write() as
+read-only memoryviews of an internal buffer, which the pickler reuses
+for the next writes and dump() calls unless write() keeps a view of it.
+
 [clinic start generated code]*/
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback)
-/*[clinic end generated code: output=0abedc50590d259b input=a7c969699bf5dad3]*/
+                              PyObject *buffer_callback, int reuse_buffer)
+/*[clinic end generated code: output=54ec87946a8a2aba input=7570ccd222dc7694]*/
 {
     /* In case of multiple __init__() calls, clear previous content. */
     if (self->write != NULL)
@@ -4750,6 +4805,8 @@ _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
     if (_Pickler_SetBufferCallback(self, buffer_callback) < 0)
         return -1;
 
+    self->reuse_buffer = reuse_buffer;
+
     /* memo and output_buffer may have already been created in _Pickler_New */
     if (self->memo == NULL) {
         self->memo = PyMemoTable_New();
@@ -5478,6 +5535,23 @@ load_counted_binstring(PickleState *st, UnpicklerObject *self, int nbytes)
     return 0;
 }
 
+/* Return a read-only memoryview of the next `size` bytes of the input,
+   without copying them.  Only used by loads(zero_copy=True), where the
+   whole input is in self->input_buffer. */
+static PyObject *
+_Unpickler_ReadView(PickleState *state, UnpicklerObject *self, Py_ssize_t size)
+{
+    Py_ssize_t start = self->next_read_idx;
+
+    assert(self->source_view != NULL && self->read == NULL);
+    if (size > self->input_len - start) {
+        bad_readline(state);
+        return NULL;
+    }
+    self->next_read_idx = start + size;
+    return PySequence_GetSlice(self->source_view, start, start + size);
+}
+
 static int
 load_counted_binbytes(PickleState *state, UnpicklerObject *self, int nbytes)
 {
@@ -5496,6 +5570,14 @@ load_counted_binbytes(PickleState *state, UnpicklerObject *self, int nbytes)
         return -1;
     }
 
+    if (self->source_view != NULL) {
+        bytes = _Unpickler_ReadView(state, self, size);
+        if (bytes == NULL)
+            return -1;
+        PDATA_PUSH(self->stack, bytes, -1);
+        return 0;
+    }
+
     bytes = PyBytes_FromStringAndSize(NULL, size);
     if (bytes == NULL)
         return -1;
@@ -5527,6 +5609,15 @@ load_counted_bytearray(PickleState *state, UnpicklerObject *self)
         return -1;
     }
 
+    if (self->source_view != NULL) {
+        bytearray = _Unpickler_ReadView(state, self, size);
+        if (bytearray == NULL) {
+            return -1;
+        }
+        PDATA_PUSH(self->stack, bytearray, -1);
+        return 0;
+    }
+
     bytearray = PyByteArray_FromStringAndSize(NULL, size);
     if (bytearray == NULL) {
         return -1;
@@ -7106,6 +7197,7 @@ Unpickler_clear(UnpicklerObject *self)
     Py_CLEAR(self->stack);
     Py_CLEAR(self->pers_func);
     Py_CLEAR(self->buffers);
+    Py_CLEAR(self->source_view);
     if (self->buffer.buf != NULL) {
         PyBuffer_Release(&self->buffer);
         self->buffer.buf = NULL;
@@ -7145,6 +7237,7 @@ Unpickler_traverse(UnpicklerObject *self, visitproc visit, void *arg)
     Py_VISIT(self->stack);
     Py_VISIT(self->pers_func);
     Py_VISIT(self->buffers);
+    Py_VISIT(self->source_view);
     return 0;
 }
 
@@ -7741,6 +7834,24 @@ _pickle_load_impl(PyObject *module, PyObject *file, int fix_imports,
     return NULL;
 }
 
+/* Return memoryview(data).cast('B').toreadonly() */
+static PyObject *
+_Pickle_SourceView(PyObject *data)
+{
+    PyObject *view, *bytes_view, *result;
+
+    view = PyMemoryView_FromObject(data);
+    if (view == NULL)
+        return NULL;
+    bytes_view = PyObject_CallMethod(view, "cast", "s", "B");
+    Py_DECREF(view);
+    if (bytes_view == NULL)
+        return NULL;
+    result = PyObject_CallMethod(bytes_view, "toreadonly", NULL);
+    Py_DECREF(bytes_view);
+    return result;
+}
+
 /*[clinic input]
 
 _pickle.loads
@@ -7752,6 +7863,7 @@ _pickle.loads
   encoding: str = 'ASCII'
   errors: str = 'strict'
   buffers: object(c_default="NULL") = ()
+  zero_copy: bool = False
 
 Read and return an object from the given pickle data.
 
@@ -7767,13 +7879,16 @@ map the old Python 2 names to the new names used in Python 3.  The
 instances pickled by Python 2; these default to 'ASCII' and 'strict',
 respectively.  The *encoding* can be 'bytes' to read these 8-bit
 string instances as bytes objects.
+
+If *zero_copy* is True, bytes and bytearray objects are loaded as
+read-only memoryviews of *data* instead of copies.
 [clinic start generated code]*/
 
 static PyObject *
 _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
                    const char *encoding, const char *errors,
-                   PyObject *buffers)
-/*[clinic end generated code: output=82ac1e6b588e6d02 input=b3615540d0535087]*/
+                   PyObject *buffers, int zero_copy)
+/*[clinic end generated code: output=fcd658005b49060e input=a8fd52210c93ad22]*/
 {
     PyObject *result;
     UnpicklerObject *unpickler = _Unpickler_New(module);
@@ -7790,6 +7905,12 @@ _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
     if (_Unpickler_SetBuffers(unpickler, buffers) < 0)
         goto error;
 
+    if (zero_copy) {
+        unpickler->source_view = _Pickle_SourceView(data);
+        if (unpickler->source_view == NULL)
+            goto error;
+    }
+
     unpickler->fix_imports = fix_imports;
 
     PickleState *state = _Pickle_GetState(module);
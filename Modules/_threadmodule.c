@@ -619,6 +619,325 @@ newlockobject(PyObject *module)
     return self;
 }
 
+/* Sharded lock objects */
+
+/* A sharded (or striped) lock is an array of locks: a key is mapped to one
+ * of the locks by its hash, so that threads using different keys rarely
+ * contend on the same lock, while the memory used doesn't grow with the
+ * number of keys. */
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t nshards;
+    lockobject **shards;
+    PyObject *in_weakreflist;
+} shardedlockobject;
+
+static int
+shardedlock_traverse(shardedlockobject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(Py_TYPE(self));
+    if (self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < self->nshards; i++) {
+            Py_VISIT(self->shards[i]);
+        }
+    }
+    return 0;
+}
+
+static void
+shardedlock_dealloc(shardedlockobject *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (self->in_weakreflist != NULL) {
+        PyObject_ClearWeakRefs((PyObject *) self);
+    }
+    if (self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < self->nshards; i++) {
+            Py_XDECREF(self->shards[i]);
+        }
+        PyMem_Free(self->shards);
+    }
+    PyTypeObject *tp = Py_TYPE(self);
+    tp->tp_free((PyObject*)self);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+shardedlock_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    char *kwlist[] = {"shards", NULL};
+    Py_ssize_t nshards = 16;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|n:ShardedLock", kwlist,
+                                     &nshards))
+        return NULL;
+    if (nshards < 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "shards must be greater than 0");
+        return NULL;
+    }
+
+    PyObject *module = PyType_GetModuleByDef(type, &thread_module);
+    if (module == NULL) {
+        return NULL;
+    }
+
+    shardedlockobject *self = (shardedlockobject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->in_weakreflist = NULL;
+    self->shards = PyMem_Calloc(nshards, sizeof(lockobject *));
+    if (self->shards == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    self->nshards = nshards;
+    for (Py_ssize_t i = 0; i < nshards; i++) {
+        self->shards[i] = newlockobject(module);
+        if (self->shards[i] == NULL) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+    return (PyObject *)self;
+}
+
+/* Return the index of the shard of key, or -1 with an exception set. */
+static Py_ssize_t
+shardedlock_index(shardedlockobject *self, PyObject *key)
+{
+    Py_hash_t hash = PyObject_Hash(key);
+    if (hash == -1) {
+        return -1;
+    }
+    /* Fibonacci hashing: spread hashes which only differ in their low or
+       high bits, like the hashes of consecutive integers or of aligned
+       addresses, over all the shards. */
+    uint64_t h = (uint64_t)(Py_uhash_t)hash * UINT64_C(0x9E3779B97F4A7C15);
+    return (Py_ssize_t)((h >> 32) % (uint64_t)self->nshards);
+}
+
+/* Return the lock of key, or NULL with an exception set. */
+static lockobject *
+shardedlock_lookup(shardedlockobject *self, PyObject *key)
+{
+    Py_ssize_t i = shardedlock_index(self, key);
+    if (i < 0) {
+        return NULL;
+    }
+    return self->shards[i];
+}
+
+static PyObject *
+shardedlock_lock_for(shardedlockobject *self, PyObject *key)
+{
+    lockobject *lock = shardedlock_lookup(self, key);
+    return Py_XNewRef(lock);
+}
+
+PyDoc_STRVAR(shardedlock_lock_for_doc,
+"lock_for(key) -> lock\n\
+\n\
+Return the lock of the shard of key, a lock object.  Keys which are\n\
+equal always get the same lock.");
+
+static PyObject *
+shardedlock_shard(shardedlockobject *self, PyObject *key)
+{
+    Py_ssize_t i = shardedlock_index(self, key);
+    if (i < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(i);
+}
+
+PyDoc_STRVAR(shardedlock_shard_doc,
+"shard(key) -> int\n\
+\n\
+Return the index of the shard of key.");
+
+static PyObject *
+shardedlock_acquire(shardedlockobject *self, PyObject *args, PyObject *kwds)
+{
+    if (PyTuple_GET_SIZE(args) < 1) {
+        PyErr_SetString(PyExc_TypeError,
+                        "acquire() missing required argument 'key' (pos 1)");
+        return NULL;
+    }
+    lockobject *lock = shardedlock_lookup(self, PyTuple_GET_ITEM(args, 0));
+    if (lock == NULL) {
+        return NULL;
+    }
+    PyObject *rest = PyTuple_GetSlice(args, 1, PyTuple_GET_SIZE(args));
+    if (rest == NULL) {
+        return NULL;
+    }
+    PyObject *res = lock_PyThread_acquire_lock(lock, rest, kwds);
+    Py_DECREF(rest);
+    return res;
+}
+
+PyDoc_STRVAR(shardedlock_acquire_doc,
+"acquire(key, blocking=True, timeout=-1) -> bool\n\
+\n\
+Lock the lock of the shard of key, like lock_for(key).acquire().");
+
+static PyObject *
+shardedlock_release(shardedlockobject *self, PyObject *key)
+{
+    lockobject *lock = shardedlock_lookup(self, key);
+    if (lock == NULL) {
+        return NULL;
+    }
+    return lock_PyThread_release_lock(lock, NULL);
+}
+
+PyDoc_STRVAR(shardedlock_release_doc,
+"release(key)\n\
+\n\
+Release the lock of the shard of key, like lock_for(key).release().");
+
+static PyObject *
+shardedlock_acquire_all(shardedlockobject *self, PyObject *args,
+                        PyObject *kwds)
+{
+    _PyTime_t timeout;
+    if (lock_acquire_parse_args(args, kwds, &timeout) < 0)
+        return NULL;
+
+    _PyTime_t endtime = 0;
+    if (timeout > 0) {
+        endtime = _PyDeadline_Init(timeout);
+    }
+    /* The locks are always acquired in the same order, so that concurrent
+       acquire_all() calls can't deadlock. */
+    Py_ssize_t i;
+    for (i = 0; i < self->nshards; i++) {
+        if (timeout > 0 && i > 0) {
+            timeout = _PyDeadline_Get(endtime);
+            if (timeout < 0) {
+                timeout = 0;
+            }
+        }
+        lockobject *lock = self->shards[i];
+        PyLockStatus r = acquire_timed(lock->lock_lock, timeout);
+        if (r != PY_LOCK_ACQUIRED) {
+            while (--i >= 0) {
+                lock = self->shards[i];
+                PyThread_release_lock(lock->lock_lock);
+                lock->locked = 0;
+            }
+            if (r == PY_LOCK_INTR) {
+                return NULL;
+            }
+            Py_RETURN_FALSE;
+        }
+        lock->locked = 1;
+    }
+    Py_RETURN_TRUE;
+}
+
+PyDoc_STRVAR(shardedlock_acquire_all_doc,
+"acquire_all(blocking=True, timeout=-1) -> bool\n\
+\n\
+Lock the locks of all the shards, in order.  If they cannot all be\n\
+locked within the timeout, release the locks already acquired and\n\
+return False.");
+
+static PyObject *
+shardedlock_release_all(shardedlockobject *self, PyObject *Py_UNUSED(ignored))
+{
+    for (Py_ssize_t i = 0; i < self->nshards; i++) {
+        if (!self->shards[i]->locked) {
+            PyErr_SetString(ThreadError, "release unlocked lock");
+            return NULL;
+        }
+    }
+    for (Py_ssize_t i = self->nshards - 1; i >= 0; i--) {
+        lockobject *lock = self->shards[i];
+        PyThread_release_lock(lock->lock_lock);
+        lock->locked = 0;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(shardedlock_release_all_doc,
+"release_all()\n\
+\n\
+Release the locks of all the shards, which must all be locked.");
+
+static Py_ssize_t
+shardedlock_length(shardedlockobject *self)
+{
+    return self->nshards;
+}
+
+static PyObject *
+shardedlock_repr(shardedlockobject *self)
+{
+    return PyUnicode_FromFormat("<%s object at %p, shards=%zd>",
+        Py_TYPE(self)->tp_name, self, self->nshards);
+}
+
+static PyMethodDef shardedlock_methods[] = {
+    {"lock_for",    (PyCFunction)shardedlock_lock_for,
+     METH_O, shardedlock_lock_for_doc},
+    {"shard",       (PyCFunction)shardedlock_shard,
+     METH_O, shardedlock_shard_doc},
+    {"acquire",     _PyCFunction_CAST(shardedlock_acquire),
+     METH_VARARGS | METH_KEYWORDS, shardedlock_acquire_doc},
+    {"release",     (PyCFunction)shardedlock_release,
+     METH_O, shardedlock_release_doc},
+    {"acquire_all", _PyCFunction_CAST(shardedlock_acquire_all),
+     METH_VARARGS | METH_KEYWORDS, shardedlock_acquire_all_doc},
+    {"release_all", (PyCFunction)shardedlock_release_all,
+     METH_NOARGS, shardedlock_release_all_doc},
+    {NULL,           NULL}              /* sentinel */
+};
+
+PyDoc_STRVAR(shardedlock_doc,
+"ShardedLock(shards=16)\n\
+\n\
+An array of locks, also known as a striped lock.  Each key is mapped to\n\
+the lock of one of the shards by its hash, so that threads working on\n\
+different keys rarely wait for each other.  Methods are:\n\
+\n\
+lock_for(key) -- return the lock of the shard of key\n\
+acquire(key) -- lock the lock of the shard of key\n\
+release(key) -- unlock the lock of the shard of key\n\
+acquire_all() -- lock all the shards\n\
+release_all() -- unlock all the shards");
+
+static PyMemberDef shardedlock_type_members[] = {
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(shardedlockobject, in_weakreflist), READONLY},
+    {NULL},
+};
+
+static PyType_Slot shardedlock_type_slots[] = {
+    {Py_tp_dealloc, (destructor)shardedlock_dealloc},
+    {Py_tp_repr, (reprfunc)shardedlock_repr},
+    {Py_tp_doc, (void *)shardedlock_doc},
+    {Py_tp_methods, shardedlock_methods},
+    {Py_tp_members, shardedlock_type_members},
+    {Py_tp_traverse, shardedlock_traverse},
+    {Py_tp_new, shardedlock_new},
+    {Py_tp_alloc, PyType_GenericAlloc},
+    {Py_tp_free, PyObject_GC_Del},
+    {Py_mp_length, shardedlock_length},
+    {Py_sq_length, shardedlock_length},
+    {0, 0}
+};
+
+static PyType_Spec shardedlock_type_spec = {
+    .name = "_thread.ShardedLock",
+    .basicsize = sizeof(shardedlockobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = shardedlock_type_slots,
+};
+
 /* Thread-local objects */
 
 /* Quick overview:
@@ -1629,6 +1948,18 @@ thread_module_exec(PyObject *module)
     }
     Py_DECREF(rlock_type);
 
+    // ShardedLock
+    PyTypeObject *shardedlock_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &shardedlock_type_spec, NULL);
+    if (shardedlock_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, shardedlock_type) < 0) {
+        Py_DECREF(shardedlock_type);
+        return -1;
+    }
+    Py_DECREF(shardedlock_type);
+
     // Local dummy
     state->local_dummy_type = (PyTypeObject *)PyType_FromSpec(&local_dummy_type_spec);
     if (state->local_dummy_type == NULL) {
@@ -104,7 +104,8 @@ exit:
 }
 
 PyDoc_STRVAR(_pickle_Pickler___init____doc__,
-"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None)\n"
+"Pickler(file, protocol=None, fix_imports=True, buffer_callback=None,\n"
+"        reuse_buffer=False)\n"
 "--\n"
 "\n"
 "This takes a binary file for writing a pickle data stream.\n"
@@ -136,12 +137,16 @@ PyDoc_STRVAR(_pickle_Pickler___init____doc__,
 "buffer is serialized in-band, i.e. inside the pickle stream.\n"
 "\n"
 "It is an error if *buffer_callback* is not None and *protocol*\n"
-"is None or smaller than 5.");
+"is None or smaller than 5.\n"
+"\n"
+"If *reuse_buffer* is True, the pickle data is passed to write() as\n"
+"read-only memoryviews of an internal buffer, which the pickler reuses\n"
+"for the next writes and dump() calls unless write() keeps a view of it.");
 
 static int
 _pickle_Pickler___init___impl(PicklerObject *self, PyObject *file,
                               PyObject *protocol, int fix_imports,
-                              PyObject *buffer_callback);
+                              PyObject *buffer_callback, int reuse_buffer);
 
 static int
 _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
@@ -149,14 +154,14 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     int return_value = -1;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 4
+    #define NUM_KEYWORDS 5
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
         PyObject *ob_item[NUM_KEYWORDS];
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
-        .ob_item = { &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), },
+        .ob_item = { &_Py_ID(file), &_Py_ID(protocol), &_Py_ID(fix_imports), &_Py_ID(buffer_callback), &_Py_ID(reuse_buffer), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -165,14 +170,14 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", NULL};
+    static const char * const _keywords[] = {"file", "protocol", "fix_imports", "buffer_callback", "reuse_buffer", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "Pickler",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[4];
+    PyObject *argsbuf[5];
     PyObject * const *fastargs;
     Py_ssize_t nargs = PyTuple_GET_SIZE(args);
     Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 1;
@@ -180,8 +185,9 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
     PyObject *protocol = Py_None;
     int fix_imports = 1;
     PyObject *buffer_callback = Py_None;
+    int reuse_buffer = 0;
 
-    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 4, 0, argsbuf);
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 5, 0, argsbuf);
     if (!fastargs) {
         goto exit;
     }
@@ -204,9 +210,18 @@ _pickle_Pickler___init__(PyObject *self, PyObject *args, PyObject *kwargs)
             goto skip_optional_pos;
         }
     }
-    buffer_callback = fastargs[3];
+    if (fastargs[3]) {
+        buffer_callback = fastargs[3];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    reuse_buffer = PyObject_IsTrue(fastargs[4]);
+    if (reuse_buffer < 0) {
+        goto exit;
+    }
 skip_optional_pos:
-    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback);
+    return_value = _pickle_Pickler___init___impl((PicklerObject *)self, file, protocol, fix_imports, buffer_callback, reuse_buffer);
 
 exit:
     return return_value;
@@ -911,7 +926,7 @@ exit:
 
 PyDoc_STRVAR(_pickle_loads__doc__,
 "loads($module, data, /, *, fix_imports=True, encoding=\'ASCII\',\n"
-"      errors=\'strict\', buffers=())\n"
+"      errors=\'strict\', buffers=(), zero_copy=False)\n"
 "--\n"
 "\n"
 "Read and return an object from the given pickle data.\n"
@@ -927,7 +942,10 @@ PyDoc_STRVAR(_pickle_loads__doc__,
 "*encoding* and *errors* tell pickle how to decode 8-bit string\n"
 "instances pickled by Python 2; these default to \'ASCII\' and \'strict\',\n"
 "respectively.  The *encoding* can be \'bytes\' to read these 8-bit\n"
-"string instances as bytes objects.");
+"string instances as bytes objects.\n"
+"\n"
+"If *zero_copy* is True, bytes and bytearray objects are loaded as\n"
+"read-only memoryviews of *data* instead of copies.");
 
 #define _PICKLE_LOADS_METHODDEF    \
     {"loads", _PyCFunction_CAST(_pickle_loads), METH_FASTCALL|METH_KEYWORDS, _pickle_loads__doc__},
@@ -935,7 +953,7 @@ PyDoc_STRVAR(_pickle_loads__doc__,
 static PyObject *
 _pickle_loads_impl(PyObject *module, PyObject *data, int fix_imports,
                    const char *encoding, const char *errors,
-                   PyObject *buffers);
+                   PyObject *buffers, int zero_copy);
 
 static PyObject *
 _pickle_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
@@ -943,14 +961,14 @@ _pickle_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 4
+    #define NUM_KEYWORDS 5
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
         PyObject *ob_item[NUM_KEYWORDS];
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
-        .ob_item = { &_Py_ID(fix_imports), &_Py_ID(encoding), &_Py_ID(errors), &_Py_ID(buffers), },
+        .ob_item = { &_Py_ID(fix_imports), &_Py_ID(encoding), &_Py_ID(errors), &_Py_ID(buffers), &_Py_ID(zero_copy), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -959,20 +977,21 @@ _pickle_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"", "fix_imports", "encoding", "errors", "buffers", NULL};
+    static const char * const _keywords[] = {"", "fix_imports", "encoding", "errors", "buffers", "zero_copy", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "loads",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[5];
+    PyObject *argsbuf[6];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     PyObject *data;
     int fix_imports = 1;
     const char *encoding = "ASCII";
     const char *errors = "strict";
     PyObject *buffers = NULL;
+    int zero_copy = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
     if (!args) {
@@ -1027,11 +1046,20 @@ _pickle_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObjec
             goto skip_optional_kwonly;
         }
     }
-    buffers = args[4];
+    if (args[4]) {
+        buffers = args[4];
+        if (!--noptargs) {
+            goto skip_optional_kwonly;
+        }
+    }
+    zero_copy = PyObject_IsTrue(args[5]);
+    if (zero_copy < 0) {
+        goto exit;
+    }
 skip_optional_kwonly:
-    return_value = _pickle_loads_impl(module, data, fix_imports, encoding, errors, buffers);
+    return_value = _pickle_loads_impl(module, data, fix_imports, encoding, errors, buffers, zero_copy);
 
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=a0e04b85e7bae626 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=6c3ffeeb07bded38 input=a9049054013a1b77]*/
@@ -2563,6 +2563,9 @@ _PyObject_AssertFailed(PyObject *obj, const char *expr, const char *msg,
 }
 
 
+_Py_thread_local const char *_Py_diag_stack[16];
+_Py_thread_local int _Py_diag_depth;
+
 void
 _Py_Dealloc(PyObject *op)
 {
@@ -2581,7 +2584,10 @@ _Py_Dealloc(PyObject *op)
 #ifdef Py_TRACE_REFS
     _Py_ForgetReference(op);
 #endif
+    if (_Py_diag_depth < 16) _Py_diag_stack[_Py_diag_depth] = type->tp_name;
+    _Py_diag_depth++;
     (*dealloc)(op);
+    _Py_diag_depth--;
 
 #ifdef Py_DEBUG
     // gh-89373: The tp_dealloc function must leave the current exception
@@ -2197,6 +2197,17 @@ _PyMem_DebugCheckAddress(const char *func, char api, const void *p)
 
     /* Check the API id */
     id = (char)q[-SST];
+    if (id != api || q[-1] != PYMEM_FORBIDDENBYTE) {
+        extern _Py_thread_local const char *_Py_diag_stack[16];
+        extern _Py_thread_local int _Py_diag_depth;
+        PyThreadState *diag_ts = _PyThreadState_GET();
+        fprintf(stderr, "DIAG func %s interp %lld depth %d:", func,
+                diag_ts ? (long long)diag_ts->interp->id : -1LL, _Py_diag_depth);
+        for (int k = 0; k < _Py_diag_depth && k < 16; k++) {
+            fprintf(stderr, " %s", _Py_diag_stack[k]);
+        }
+        fprintf(stderr, "\n");
+    }
     if (id != api) {
         _PyObject_DebugDumpAddress(p);
         _Py_FatalErrorFormat(func,
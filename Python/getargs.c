@@ -4,6 +4,7 @@
 #include "Python.h"
 #include "pycore_tuple.h"         // _PyTuple_ITEMS()
 #include "pycore_pylifecycle.h"   // _PyArg_Fini
+#include "pycore_pystate.h"       // _Py_IsMainInterpreter()
 
 #include <ctype.h>
 #include <float.h>
@@ -2026,6 +2027,8 @@ _parser_init(struct _PyArg_Parser *parser)
     return 1;
 }
 
+static int parser_init_in_main(struct _PyArg_Parser *parser);
+
 static int
 parser_init(struct _PyArg_Parser *parser)
 {
@@ -2035,6 +2038,9 @@ parser_init(struct _PyArg_Parser *parser)
         assert(parser->kwtuple != NULL);
         return 1;
     }
+    if (!_Py_IsMainInterpreter(PyInterpreterState_Get())) {
+        return parser_init_in_main(parser);
+    }
     PyThread_acquire_lock(_PyRuntime.getargs.mutex, WAIT_LOCK);
     // Check again if another thread initialized the parser
     // while we were waiting for the lock.
@@ -2048,6 +2054,62 @@ parser_init(struct _PyArg_Parser *parser)
     return ret;
 }
 
+/* Initialize the parser in the main interpreter.
+ *
+ * Parsers are shared by all interpreters, so the keyword tuple is created
+ * by the main interpreter: it could outlive a subinterpreter with its own
+ * allocator.  Switching to the main interpreter waits for its GIL, so it
+ * is done before taking the lock, otherwise a main interpreter thread
+ * waiting for the lock with its GIL held would deadlock. */
+static int
+parser_init_in_main(struct _PyArg_Parser *parser)
+{
+    PyThreadState *temp_tstate = PyThreadState_New(_PyInterpreterState_Main());
+    if (temp_tstate == NULL) {
+        PyErr_NoMemory();
+        return 0;
+    }
+    PyThreadState *save_tstate = PyThreadState_Swap(temp_tstate);
+
+    int ret = parser_init(parser);
+
+    /* The exception object belongs to the main interpreter, only its
+     * type and message are passed to the subinterpreter. */
+    PyObject *exc_type = PyExc_SystemError;
+    char *msg = NULL;
+    if (!ret) {
+        PyObject *exc = PyErr_GetRaisedException();
+        if (!(Py_TYPE(exc)->tp_flags & Py_TPFLAGS_HEAPTYPE)) {
+            exc_type = (PyObject *)Py_TYPE(exc);
+        }
+        PyObject *str = PyObject_Str(exc);
+        if (str != NULL) {
+            const char *utf8 = PyUnicode_AsUTF8(str);
+            if (utf8 != NULL) {
+                msg = _PyMem_RawStrdup(utf8);
+            }
+            Py_DECREF(str);
+        }
+        PyErr_Clear();
+        Py_DECREF(exc);
+    }
+
+    PyThreadState_Clear(temp_tstate);
+    (void)PyThreadState_Swap(save_tstate);
+    PyThreadState_Delete(temp_tstate);
+
+    if (!ret) {
+        if (msg == NULL) {
+            PyErr_NoMemory();
+        }
+        else {
+            PyErr_SetString(exc_type, msg);
+            PyMem_RawFree(msg);
+        }
+    }
+    return ret;
+}
+
 static void
 parser_clear(struct _PyArg_Parser *parser)
 {
@@ -636,14 +636,14 @@ _PyImport_ClearModulesByIndex(PyInterpreterState *interp)
        18.     _PyImport_FixupExtensionObject():  add it to _PyRuntime.imports.extensions
 
     (6). subsequent times  (found in _PyRuntime.imports.extensions):
-       1. _imp_create_dynamic_impl() -> import_find_extension()
-       2.   import_find_extension() -> import_add_module()
-       3.     if name in sys.modules:  use that module
-       4.     else:
+       1. _imp_create_dynamic_impl() -> _PyImport_CheckSubinterpIncompatibleExtensionAllowed()
+       2. _imp_create_dynamic_impl() -> import_find_extension()
+       3.   import_find_extension() -> import_add_module()
+       4.     if name in sys.modules:  use that module
+       5.     else:
                 1. import_add_module() -> PyModule_NewObject()
                 2. import_add_module():  set it on sys.modules
-       5.   import_find_extension():  copy the "m_copy" dict into __dict__
-       6. _imp_create_dynamic_impl() -> _PyImport_CheckSubinterpIncompatibleExtensionAllowed()
+       6.   import_find_extension():  copy the "m_copy" dict into __dict__
 
     (10). (every time):
        1. noop
@@ -659,9 +659,10 @@ _PyImport_ClearModulesByIndex(PyInterpreterState *interp)
        17.     _PyImport_FixupExtensionObject():  add it to _PyRuntime.imports.extensions
 
     (6). previously loaded in main interpreter  (found in _PyRuntime.imports.extensions):
-       1. _imp_create_dynamic_impl() -> import_find_extension()
-       2.   import_find_extension():  call def->m_base.m_init
-       3.   import_find_extension():  add the module to sys.modules
+       1. _imp_create_dynamic_impl() -> _PyImport_CheckSubinterpIncompatibleExtensionAllowed()
+       2. _imp_create_dynamic_impl() -> import_find_extension()
+       3.   import_find_extension():  call def->m_base.m_init
+       4.   import_find_extension():  add the module to sys.modules
 
     (10). every time:
        1. noop
@@ -3695,17 +3696,19 @@ _imp_create_dynamic_impl(PyObject *module, PyObject *spec, PyObject *file)
     }
 
     PyThreadState *tstate = _PyThreadState_GET();
-    mod = import_find_extension(tstate, name, path);
-    if (mod != NULL) {
+    if (_extensions_cache_get(path, name) != NULL) {
+        /* The module was loaded by another interpreter.  Check that it is
+           allowed in this one before import_find_extension() copies its
+           module dict, which holds objects of the other interpreter. */
         const char *name_buf = PyUnicode_AsUTF8(name);
         assert(name_buf != NULL);
         if (_PyImport_CheckSubinterpIncompatibleExtensionAllowed(name_buf) < 0) {
-            Py_DECREF(mod);
             mod = NULL;
+            goto finally;
         }
-        goto finally;
     }
-    else if (PyErr_Occurred()) {
+    mod = import_find_extension(tstate, name, path);
+    if (mod != NULL || PyErr_Occurred()) {
         goto finally;
     }
 
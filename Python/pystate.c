@@ -788,6 +788,8 @@ PyInterpreterState_New(void)
 }
 
 
+static void _xidregistry_clear(struct _xidregistry *);
+
 static void
 interpreter_clear(PyInterpreterState *interp, PyThreadState *tstate)
 {
@@ -869,6 +871,11 @@ interpreter_clear(PyInterpreterState *interp, PyThreadState *tstate)
     _PyWarnings_Fini(interp);
     _PyAtExit_Fini(interp);
 
+    // Drop the weakrefs to the shareable types of this interpreter.
+    PyThread_acquire_lock(runtime->xidregistry.mutex, WAIT_LOCK);
+    _xidregistry_clear(&interp->xidregistry);
+    PyThread_release_lock(runtime->xidregistry.mutex);
+
     // All Python types must be destroyed before the last GC collection. Python
     // types create a reference cycle to themselves in their in their
     // PyTypeObject.tp_mro member (the tuple contains the type).
@@ -2519,6 +2526,17 @@ _PyCrossInterpreterData_Release(_PyCrossInterpreterData *data)
    alternative would be to add a tp_* slot for a class's
    crossinterpdatafunc. It would be simpler and more efficient. */
 
+static inline struct _xidregistry *
+_get_xidregistry(PyInterpreterState *interp, PyTypeObject *cls)
+{
+    // Heap types are registered in the registry of their interpreter:
+    // their weakrefs must not outlive it.
+    if (cls->tp_flags & Py_TPFLAGS_HEAPTYPE) {
+        return &interp->xidregistry;
+    }
+    return &interp->runtime->xidregistry;
+}
+
 static int
 _xidregistry_add_type(struct _xidregistry *xidregistry, PyTypeObject *cls,
                  crossinterpdatafunc getdata)
@@ -2529,11 +2547,15 @@ _xidregistry_add_type(struct _xidregistry *xidregistry, PyTypeObject *cls,
     if (newhead == NULL) {
         return -1;
     }
-    // XXX Assign a callback to clear the entry from the registry?
-    newhead->cls = PyWeakref_NewRef((PyObject *)cls, NULL);
-    if (newhead->cls == NULL) {
-        PyMem_RawFree(newhead);
-        return -1;
+    newhead->cls = cls;
+    newhead->weakref = NULL;
+    if (cls->tp_flags & Py_TPFLAGS_HEAPTYPE) {
+        // XXX Assign a callback to clear the entry from the registry?
+        newhead->weakref = PyWeakref_NewRef((PyObject *)cls, NULL);
+        if (newhead->weakref == NULL) {
+            PyMem_RawFree(newhead);
+            return -1;
+        }
     }
     newhead->getdata = getdata;
     newhead->prev = NULL;
@@ -2561,28 +2583,39 @@ _xidregistry_remove_entry(struct _xidregistry *xidregistry,
     if (next != NULL) {
         next->prev = entry->prev;
     }
-    Py_DECREF(entry->cls);
+    Py_XDECREF(entry->weakref);
     PyMem_RawFree(entry);
     return next;
 }
 
+static void
+_xidregistry_clear(struct _xidregistry *xidregistry)
+{
+    struct _xidregitem *cur = xidregistry->head;
+    while (cur != NULL) {
+        cur = _xidregistry_remove_entry(xidregistry, cur);
+    }
+}
+
 static struct _xidregitem *
 _xidregistry_find_type(struct _xidregistry *xidregistry, PyTypeObject *cls)
 {
     struct _xidregitem *cur = xidregistry->head;
     while (cur != NULL) {
-        PyObject *registered = PyWeakref_GetObject(cur->cls);
-        if (registered == Py_None) {
-            // The weakly ref'ed object was freed.
-            cur = _xidregistry_remove_entry(xidregistry, cur);
-        }
-        else {
-            assert(PyType_Check(registered));
-            if (registered == (PyObject *)cls) {
-                return cur;
+        if (cur->weakref != NULL) {
+            PyObject *registered = PyWeakref_GetObject(cur->weakref);
+            if (registered == Py_None) {
+                // The weakly ref'ed object was freed.
+                cur = _xidregistry_remove_entry(xidregistry, cur);
+                continue;
             }
-            cur = cur->next;
+            assert(PyType_Check(registered));
+            assert(cur->cls == (PyTypeObject *)registered);
         }
+        if (cur->cls == cls) {
+            return cur;
+        }
+        cur = cur->next;
     }
     return NULL;
 }
@@ -2602,13 +2635,16 @@ _PyCrossInterpreterData_RegisterClass(PyTypeObject *cls,
         return -1;
     }
 
-    struct _xidregistry *xidregistry = &_PyRuntime.xidregistry ;
-    PyThread_acquire_lock(xidregistry->mutex, WAIT_LOCK);
-    if (xidregistry->head == NULL) {
-        _register_builtins_for_crossinterpreter_data(xidregistry);
+    PyInterpreterState *interp = _PyInterpreterState_GET();
+    PyThread_type_lock mutex = interp->runtime->xidregistry.mutex;
+    struct _xidregistry *xidregistry = _get_xidregistry(interp, cls);
+    PyThread_acquire_lock(mutex, WAIT_LOCK);
+    if (interp->runtime->xidregistry.head == NULL) {
+        _register_builtins_for_crossinterpreter_data(
+            &interp->runtime->xidregistry);
     }
     int res = _xidregistry_add_type(xidregistry, cls, getdata);
-    PyThread_release_lock(xidregistry->mutex);
+    PyThread_release_lock(mutex);
     return res;
 }
 
@@ -2616,14 +2652,16 @@ int
 _PyCrossInterpreterData_UnregisterClass(PyTypeObject *cls)
 {
     int res = 0;
-    struct _xidregistry *xidregistry = &_PyRuntime.xidregistry ;
-    PyThread_acquire_lock(xidregistry->mutex, WAIT_LOCK);
+    PyInterpreterState *interp = _PyInterpreterState_GET();
+    PyThread_type_lock mutex = interp->runtime->xidregistry.mutex;
+    struct _xidregistry *xidregistry = _get_xidregistry(interp, cls);
+    PyThread_acquire_lock(mutex, WAIT_LOCK);
     struct _xidregitem *matched = _xidregistry_find_type(xidregistry, cls);
     if (matched != NULL) {
         (void)_xidregistry_remove_entry(xidregistry, matched);
         res = 1;
     }
-    PyThread_release_lock(xidregistry->mutex);
+    PyThread_release_lock(mutex);
     return res;
 }
 
@@ -2635,17 +2673,19 @@ _PyCrossInterpreterData_UnregisterClass(PyTypeObject *cls)
 crossinterpdatafunc
 _PyCrossInterpreterData_Lookup(PyObject *obj)
 {
-    struct _xidregistry *xidregistry = &_PyRuntime.xidregistry ;
-    PyObject *cls = PyObject_Type(obj);
-    PyThread_acquire_lock(xidregistry->mutex, WAIT_LOCK);
-    if (xidregistry->head == NULL) {
-        _register_builtins_for_crossinterpreter_data(xidregistry);
+    PyInterpreterState *interp = _PyInterpreterState_GET();
+    PyThread_type_lock mutex = interp->runtime->xidregistry.mutex;
+    PyTypeObject *cls = Py_TYPE(obj);
+    struct _xidregistry *xidregistry = _get_xidregistry(interp, cls);
+    PyThread_acquire_lock(mutex, WAIT_LOCK);
+    if (interp->runtime->xidregistry.head == NULL) {
+        _register_builtins_for_crossinterpreter_data(
+            &interp->runtime->xidregistry);
     }
-    struct _xidregitem *matched = _xidregistry_find_type(xidregistry,
-                                                         (PyTypeObject *)cls);
-    Py_DECREF(cls);
-    PyThread_release_lock(xidregistry->mutex);
-    return matched != NULL ? matched->getdata : NULL;
+    struct _xidregitem *matched = _xidregistry_find_type(xidregistry, cls);
+    crossinterpdatafunc getdata = matched != NULL ? matched->getdata : NULL;
+    PyThread_release_lock(mutex);
+    return getdata;
 }
 
 /* cross-interpreter data for builtin types */
@@ -2760,7 +2800,7 @@ static void
 _register_builtins_for_crossinterpreter_data(struct _xidregistry *xidregistry)
 {
     // None
-    if (_xidregistry_add_type(xidregistry, (PyTypeObject *)PyObject_Type(Py_None), _none_shared) != 0) {
+    if (_xidregistry_add_type(xidregistry, Py_TYPE(Py_None), _none_shared) != 0) {
         Py_FatalError("could not register None for cross-interpreter sharing");
     }
 
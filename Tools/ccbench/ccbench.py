@@ -146,6 +146,59 @@ def compute(s):
 bandwidth_tasks = [task_pidigits]
 
 
+# Lock contention tasks: the critical section hashes 64 KiB with the GIL
+# released, so that it can run in parallel in several threads unless the
+# lock serializes them.
+
+def _contention_work():
+    with open(__file__, "rb") as f:
+        arg = f.read(4096) * 16
+
+    def compute():
+        hashlib.sha1(arg).digest()
+    return compute
+
+def task_contention_nolock():
+    """No lock (SHA1 hashing)"""
+    return _contention_work(), ()
+
+def task_contention_lock():
+    """Lock (SHA1 hashing)"""
+    compute = _contention_work()
+    lock = threading.Lock()
+
+    def locked():
+        with lock:
+            compute()
+    return locked, ()
+
+def task_contention_rwlock():
+    """RWLock, readers (SHA1 hashing)"""
+    compute = _contention_work()
+    rwlock = threading.RWLock()
+
+    def read_locked():
+        with rwlock.read_lock:
+            compute()
+    return read_locked, ()
+
+def task_contention_shardedlock():
+    """ShardedLock, one key per thread (SHA1 hashing)"""
+    compute = _contention_work()
+    locks = threading.ShardedLock()
+
+    def shard_locked():
+        with locks.lock_for(threading.get_ident()):
+            compute()
+    return shard_locked, ()
+
+contention_tasks = [task_contention_nolock, task_contention_lock]
+if hasattr(threading, 'RWLock'):
+    contention_tasks.append(task_contention_rwlock)
+if hasattr(threading, 'ShardedLock'):
+    contention_tasks.append(task_contention_shardedlock)
+
+
 class TimedLoop:
     def __init__(self, func, args):
         self.func = func
@@ -237,8 +290,8 @@ def run():
 
     return results
 
-def run_throughput_tests(max_threads):
-    for task in throughput_tasks:
+def run_throughput_tests(max_threads, tasks=throughput_tasks):
+    for task in tasks:
         print(task.__doc__)
         print()
         func, args = task()
@@ -258,6 +311,13 @@ def run_throughput_tests(max_threads):
             nthreads += 1
         print()
 
+def run_contention_tests(max_threads):
+    if hashlib is None:
+        print("hashlib is not available, skipping.")
+        print()
+        return
+    run_throughput_tests(max_threads, contention_tasks)
+
 
 LAT_END = "END"
 
@@ -532,6 +592,9 @@ def main():
     parser.add_option("-b", "--bandwidth",
                       action="store_true", dest="bandwidth", default=False,
                       help="run I/O bandwidth tests")
+    parser.add_option("-c", "--contention",
+                      action="store_true", dest="contention", default=False,
+                      help="run lock contention tests")
     parser.add_option("-i", "--interval",
                       action="store", type="int", dest="check_interval", default=None,
                       help="sys.setcheckinterval() value "
@@ -566,8 +629,10 @@ def main():
         bandwidth_client(**kwargs)
         return
 
-    if not options.throughput and not options.latency and not options.bandwidth:
+    if (not options.throughput and not options.latency
+        and not options.bandwidth and not options.contention):
         options.throughput = options.latency = options.bandwidth = True
+        options.contention = True
     if options.check_interval:
         sys.setcheckinterval(options.check_interval)
     if options.switch_interval:
@@ -602,5 +667,10 @@ def main():
         print()
         run_bandwidth_tests(options.nthreads)
 
+    if options.contention:
+        print("--- Lock contention ---")
+        print()
+        run_contention_tests(options.nthreads)
+
 if __name__ == "__main__":
     main()
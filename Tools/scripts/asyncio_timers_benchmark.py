@@ -0,0 +1,70 @@
+"""Compare asyncio timer scheduling on the heap and on the timing wheel.
+
+Simulates a server with many connections, each arming a timeout for
+every request and cancelling it when the request completes, which is
+the pattern of asyncio.timeout() and asyncio.wait_for().  Most timers
+never fire, so the cost is dominated by scheduling and cancellation.
+
+Usage: python asyncio_timers_benchmark.py [-n REQUESTS] [-p PENDING]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+
+def churn(loop, requests, pending, timeout):
+    rng = random.Random(0)
+    noop = lambda: None
+    # Long-lived timeouts of idle connections.
+    idle = [loop.call_later(timeout * rng.random(), noop)
+            for _ in range(pending)]
+
+    t0 = time.perf_counter()
+    for i in range(requests):
+        handle = loop.call_later(timeout, noop)
+        if i % 64 == 0:
+            # Let the loop run an iteration, like a busy server would.
+            loop.run_until_complete(asyncio.sleep(0))
+        handle.cancel()
+    loop.run_until_complete(asyncio.sleep(0))
+    dt = time.perf_counter() - t0
+
+    for handle in idle:
+        handle.cancel()
+    return dt
+
+
+def bench(name, resolution, args):
+    loop = asyncio.new_event_loop()
+    try:
+        if resolution is not None:
+            loop.set_timer_wheel(resolution)
+        dt = churn(loop, args.requests, args.pending, args.timeout)
+    finally:
+        loop.close()
+    rate = args.requests / dt
+    print(f'{name:<24} {dt:8.3f} s  {rate:12,.0f} arm+cancel/s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--requests', type=int, default=1_000_000,
+                        help='number of timeouts armed and cancelled')
+    parser.add_argument('-p', '--pending', type=int, default=100_000,
+                        help='number of timeouts pending during the run')
+    parser.add_argument('-t', '--timeout', type=float, default=30.0,
+                        help='timeout in seconds')
+    parser.add_argument('-r', '--resolution', type=float, default=0.001,
+                        help='timing wheel resolution in seconds')
+    args = parser.parse_args()
+
+    print(f'{args.requests:,} timeouts armed and cancelled, '
+          f'{args.pending:,} pending')
+    bench('heap', None, args)
+    bench(f'wheel ({args.resolution} s)', args.resolution, args)
+
+
+if __name__ == '__main__':
+    main()
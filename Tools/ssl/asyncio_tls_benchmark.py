@@ -0,0 +1,110 @@
+"""Measure asyncio stream throughput over TLS compared to plaintext.
+
+A client sends data to a local echo-less sink server, then reads the
+same amount back from a local source server, both over plain TCP and
+over TLS, using the certificate shipped with the test suite.
+
+Usage: python asyncio_tls_benchmark.py [-s TOTAL_MB] [-c CHUNK_SIZE]
+"""
+
+import argparse
+import asyncio
+import os
+import ssl
+import time
+
+CERTFILE = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                        'Lib', 'test', 'keycert.pem')
+
+
+def make_contexts():
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(CERTFILE)
+    client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+    return server_context, client_context
+
+
+async def run(total, chunk_size, server_ssl, client_ssl):
+    chunk = b'x' * chunk_size
+    count = total // chunk_size
+    done = asyncio.get_running_loop().create_future()
+
+    async def handle(reader, writer):
+        command = await reader.readexactly(1)
+        if command == b'w':
+            # Sink: read everything the client sends.
+            received = 0
+            while received < count * chunk_size:
+                data = await reader.read(256 * 1024)
+                if not data:
+                    break
+                received += len(data)
+            writer.write(b'k')
+        else:
+            # Source: send data to the client.
+            for _ in range(count):
+                writer.write(chunk)
+                await writer.drain()
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0, ssl=server_ssl)
+    port = server.sockets[0].getsockname()[1]
+    results = {}
+    try:
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', port, ssl=client_ssl)
+        t0 = time.perf_counter()
+        writer.write(b'w')
+        for _ in range(count):
+            writer.write(chunk)
+            await writer.drain()
+        await reader.readexactly(1)
+        results['write'] = time.perf_counter() - t0
+        writer.close()
+        await writer.wait_closed()
+
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', port, ssl=client_ssl)
+        t0 = time.perf_counter()
+        writer.write(b'r')
+        received = 0
+        while received < count * chunk_size:
+            data = await reader.read(256 * 1024)
+            if not data:
+                break
+            received += len(data)
+        results['read'] = time.perf_counter() - t0
+        writer.close()
+        await writer.wait_closed()
+    finally:
+        server.close()
+        await server.wait_closed()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--size', type=int, default=256,
+                        help='megabytes transferred in each direction')
+    parser.add_argument('-c', '--chunk-size', type=int, default=16 * 1024,
+                        help='size of each write() call, in bytes')
+    args = parser.parse_args()
+    total = args.size * 1024 * 1024
+    server_ssl, client_ssl = make_contexts()
+
+    print(f'{args.size} MiB per direction, {args.chunk_size} bytes per write')
+    plain = asyncio.run(run(total, args.chunk_size, None, None))
+    tls = asyncio.run(run(total, args.chunk_size, server_ssl, client_ssl))
+    for direction in ('write', 'read'):
+        p = args.size / plain[direction]
+        t = args.size / tls[direction]
+        print(f'{direction:<6} plaintext {p:9.1f} MiB/s   '
+              f'TLS {t:9.1f} MiB/s   TLS overhead {p / t:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()